@@ -0,0 +1,142 @@
+"""Benchmark regresi untuk scanner link di extractor.py.
+
+Membuat teks sintetis berukuran besar (campuran kalimat biasa, link, token
+bertitik panjang ala minified JS, dan blob base64), lalu membandingkan waktu
+scan versi lama (tiga re.findall + re.sub/urlparse per kandidat) dengan
+extractor.extract_links. Exit code 1 kalau scanner baru lebih lambat atau
+himpunan link-nya berbeda dari versi lama (selain perbedaan yang memang
+disengaja, lihat main).
+
+    python bench_scanner.py --size-mb 300
+"""
+import re
+import sys
+import time
+import random
+import argparse
+import base64
+import string
+from urllib.parse import urlparse
+
+from extractor import extract_links
+
+DOMAIN_CHARS = set(string.ascii_letters + string.digits + '.-')
+
+
+def legacy_extract_links(content):
+    """Implementasi lama di load_and_extract_links, disimpan sebagai pembanding"""
+    link_patterns = [
+        r'https?://[^\s<>"\'`\[\]{}|\\^]+',
+        r'www\.[^\s<>"\'`\[\]{}|\\^]+\.[a-zA-Z]{2,}[^\s<>"\'`\[\]{}|\\^]*',
+        r'[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}/[^\s<>"\'`\[\]{}|\\^]*',
+    ]
+    links = []
+    for pattern in link_patterns:
+        links.extend(re.findall(pattern, content, re.IGNORECASE))
+
+    found_links = []
+    for link in links:
+        cleaned_link = re.sub(r'[.,!?;:)}\]]+$', '', link.strip())
+        if cleaned_link:
+            if not cleaned_link.startswith(('http://', 'https://')):
+                if cleaned_link.startswith('www.'):
+                    cleaned_link = 'https://' + cleaned_link
+                elif '.' in cleaned_link and not cleaned_link.startswith('mailto:'):
+                    if re.match(r'^[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', cleaned_link):
+                        cleaned_link = 'https://' + cleaned_link
+            if cleaned_link.startswith(('http://', 'https://')):
+                parsed = urlparse(cleaned_link)
+                if parsed.netloc and '.' in parsed.netloc:
+                    found_links.append(cleaned_link)
+    return list(dict.fromkeys(found_links))
+
+
+def build_content(size_mb, seed=1234):
+    """Buat teks sintetis kira-kira sebesar size_mb megabyte"""
+    rng = random.Random(seed)
+    words = ['laporan', 'meeting', 'project', 'alpha', 'catatan', 'hello', 'world',
+             'data', 'file', 'ini', 'adalah', 'contoh', 'teks', 'biasa', '123']
+    links = ['https://docs.python.org/3/', 'http://example.com/a?b=1', 'www.example.org',
+             'github.com/user/repo', 'https://drive.google.com/file/d/abc123.',
+             '(https://slack.company.com/channels/alpha)',
+             'example.com/x?u=https://y.com/z', 'www.google.com/url?q=https://t.com/a',
+             'mywww.site.org/x', 'shop.www.example.com/a/b', 'abc.www.foo.com/x']
+    minified = 'a.b.c.d.e.f.g.h.' * 256  # token bertitik panjang tanpa slash
+    blob = base64.b64encode(bytes(rng.getrandbits(8) for _ in range(3072))).decode('ascii')
+
+    pieces = []
+    for _ in range(200):
+        line = ' '.join(rng.choice(words) for _ in range(12))
+        if rng.random() < 0.3:
+            line += ' ' + rng.choice(links)
+        pieces.append(line)
+    pieces.append(minified)
+    pieces.append(blob)
+    block = '\n'.join(pieces) + '\n'
+
+    repeat = max(1, (size_mb * 1024 * 1024) // len(block))
+    return block * repeat
+
+
+def timed(func, content):
+    start = time.perf_counter()
+    result = func(content)
+    return result, time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark scanner link lama vs baru')
+    parser.add_argument('--size-mb', type=int, default=300, help='Ukuran teks sintetis (MB)')
+    parser.add_argument('--skip-legacy', action='store_true',
+                        help='Hanya ukur scanner baru (scanner lama bisa sangat lambat)')
+    args = parser.parse_args(argv)
+
+    content = build_content(args.size_mb)
+    print(f"Ukuran teks: {len(content) / (1024 * 1024):.1f} MB")
+
+    new_links, new_time = timed(extract_links, content)
+    print(f"Scanner baru : {new_time:8.2f} s  ({len(new_links)} link)")
+    if args.skip_legacy:
+        return 0
+
+    old_links, old_time = timed(legacy_extract_links, content)
+    print(f"Scanner lama : {old_time:8.2f} s  ({len(old_links)} link)")
+    print(f"Speedup      : {old_time / new_time:8.2f}x")
+
+    # Perbedaan yang disengaja: scanner lama juga menghasilkan duplikat dari
+    # match yang tumpang tindih di dalam link http (misal www.x di dalam
+    # http://www.x jadi https://www.x), dan link www palsu dari "www." di
+    # tengah domain (shop.www.example.com/a jadi https://www.example.com/a);
+    # scanner baru tidak.
+    # (Teks sintetis sengaja tidak memuat HTTP:// huruf besar, yang oleh
+    # scanner lama dibuang dan oleh scanner baru diterima.)
+    old_set = set(old_links)
+    new_set = set(new_links)
+    missing = old_set - new_set
+    scheme_swapped = {link for link in missing
+                      if link.startswith('https://') and 'http://' + link[8:] in new_set}
+    missing -= scheme_swapped
+    inner_www = {link for link in missing
+                 if link.startswith('https://www.') and any(
+                     other.endswith(link[8:]) and other[-len(link) + 7] in DOMAIN_CHARS
+                     for other in new_set if len(other) > len(link))}
+    missing -= inner_www
+    extra = new_set - old_set
+    if scheme_swapped:
+        print(f"Duplikat http->https dari scanner lama (disengaja): {len(scheme_swapped)}")
+    if inner_www:
+        print(f"Link www dari tengah domain oleh scanner lama (disengaja): {sorted(inner_www)}")
+    if missing or extra:
+        if missing:
+            print(f"GAGAL: {len(missing)} link versi lama tidak ditemukan scanner baru: {sorted(missing)[:10]}")
+        if extra:
+            print(f"GAGAL: {len(extra)} link scanner baru tidak ada di versi lama: {sorted(extra)[:10]}")
+        return 1
+    if new_time > old_time:
+        print("GAGAL: scanner baru lebih lambat dari versi lama")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
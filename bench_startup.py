@@ -0,0 +1,105 @@
+"""Benchmark waktu start aplikasi (regresi cold-start).
+
+Setiap run menjalankan process Python baru yang meng-import main.py, membuat
+LinkOpenerApp lalu menunggu paint pertama jendela. Dilaporkan median waktu
+import dan waktu sampai paint pertama. Exit code 1 kalau melewati batas atau
+kalau library berat (Selenium, pandas, PyPDF2, ...) ikut ter-import saat start.
+
+    python bench_startup.py --runs 5 --max-import-ms 800 --max-paint-ms 1500
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+
+# Library yang seharusnya baru di-import saat pertama kali dibutuhkan
+HEAVY_MODULES = ['selenium', 'requests', 'pandas', 'PyPDF2', 'pptx', 'xlrd', 'olefile']
+
+
+def measure_child():
+    """Dijalankan di process anak: ukur import main.py dan paint pertama"""
+    start = time.perf_counter()
+    import main as app_main
+    from PySide6.QtWidgets import QApplication
+    from PySide6.QtCore import QObject, QEvent, QTimer
+    imported = time.perf_counter()
+
+    app = QApplication(sys.argv[:1])
+    window = app_main.LinkOpenerApp()
+    first_paint = []
+
+    class PaintWatcher(QObject):
+        def eventFilter(self, obj, event):
+            if (not first_paint and event.type() == QEvent.Paint
+                    and hasattr(obj, 'window') and obj.window() is window):
+                first_paint.append(time.perf_counter())
+                QTimer.singleShot(0, app.quit)
+            return False
+
+    watcher = PaintWatcher()
+    app.installEventFilter(watcher)
+    window.show()
+    QTimer.singleShot(10000, app.quit)  # jangan menggantung kalau tidak ada paint
+    app.exec()
+
+    result = {
+        'import_ms': (imported - start) * 1000,
+        'paint_ms': (first_paint[0] - start) * 1000 if first_paint else None,
+        'heavy_modules': [name for name in HEAVY_MODULES if name in sys.modules],
+    }
+    print(json.dumps(result))
+
+
+def run_once():
+    env = dict(os.environ)
+    env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    output = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), '--child'],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        env=env, capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark waktu start Link Opener')
+    parser.add_argument('--runs', type=int, default=5, help='Jumlah run (process baru tiap run)')
+    parser.add_argument('--max-import-ms', type=float, default=None, help='Batas median waktu import (ms)')
+    parser.add_argument('--max-paint-ms', type=float, default=None, help='Batas median waktu sampai paint pertama (ms)')
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        measure_child()
+        return 0
+
+    results = [run_once() for _ in range(args.runs)]
+    import_ms = statistics.median(r['import_ms'] for r in results)
+    paint_values = [r['paint_ms'] for r in results if r['paint_ms'] is not None]
+    paint_ms = statistics.median(paint_values) if paint_values else None
+    heavy = sorted({name for r in results for name in r['heavy_modules']})
+
+    print(f"Import main.py      : {import_ms:8.1f} ms (median dari {args.runs} run)")
+    if paint_ms is None:
+        print("Paint pertama       :      n/a (jendela tidak ter-paint)")
+    else:
+        print(f"Paint pertama       : {paint_ms:8.1f} ms (median dari {len(paint_values)} run)")
+    print(f"Library berat dimuat: {', '.join(heavy) if heavy else '-'}")
+
+    failed = False
+    if heavy:
+        print("GAGAL: library berat ikut di-import saat start")
+        failed = True
+    if args.max_import_ms is not None and import_ms > args.max_import_ms:
+        print(f"GAGAL: waktu import melebihi {args.max_import_ms} ms")
+        failed = True
+    if args.max_paint_ms is not None and (paint_ms is None or paint_ms > args.max_paint_ms):
+        print(f"GAGAL: waktu paint pertama melebihi {args.max_paint_ms} ms")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
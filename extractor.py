@@ -0,0 +1,2407 @@
+"""Engine ekstraksi link tanpa GUI.
+
+Modul ini bisa di-import tanpa PySide6 maupun Selenium, sehingga dipakai
+baik oleh aplikasi desktop (main.py) maupun mode batch dari command line:
+
+    python main.py extract --jobs 4 folder_dokumen/
+"""
+import io
+import sys
+import os
+import re
+import json
+import time
+import csv
+import logging
+import mmap
+import codecs
+import struct
+import queue
+import signal
+import argparse
+import functools
+import itertools
+import importlib
+import importlib.machinery
+import tarfile
+import zipfile
+import threading
+import multiprocessing
+import multiprocessing.util
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from collections import namedtuple
+
+from link_normalizer import LinkDedupIndex, load_rules
+
+logger = logging.getLogger(__name__)
+
+# Libraries untuk membaca berbagai format file baru di-import saat pertama kali
+# dibutuhkan (lihat _import_optional), supaya start aplikasi tetap cepat:
+#   pptx (.pptx), PyPDF2 (.pdf), xlrd (.xls), olefile (.doc/.ppt), pandas (.csv, opsional)
+_optional_modules = {}
+
+
+def _import_optional(module_name):
+    """Import library format sekali saja; kembalikan None kalau tidak terinstall"""
+    if module_name not in _optional_modules:
+        try:
+            _optional_modules[module_name] = importlib.import_module(module_name)
+        except ImportError:
+            _optional_modules[module_name] = None
+    return _optional_modules[module_name]
+
+
+# False kalau process ini mengerjakan file bersamaan dengan process ekstraksi lain
+# (lihat ExtractionProcess dan run_extract_batch): XLSX/PDF besar tidak membuka
+# Pool lagi, supaya CPU tidak dibagi berlebihan. File yang dikerjakan sendirian
+# tetap memakai Pool.
+_process_pools_enabled = True
+# Pool XLSX/PDF selalu spawn: process ekstraksi punya thread queue, dan fork
+# dari process yang punya thread bisa deadlock
+_POOL_CONTEXT = multiprocessing.get_context('spawn')
+
+
+def set_process_pools_enabled(enabled):
+    """Izinkan/larang Pool bertingkat untuk XLSX/PDF besar di process ini"""
+    global _process_pools_enabled
+    _process_pools_enabled = enabled
+
+
+# Callback progres opsional: callback(done, total, unit). Dipasang oleh pemanggil
+# (misal worker GUI) lewat set_progress_callback; total 0 berarti tidak diketahui.
+_progress_callback = None
+
+
+def set_progress_callback(callback):
+    """Pasang (atau lepas dengan None) callback progres ekstraksi untuk process ini"""
+    global _progress_callback
+    _progress_callback = callback
+
+
+def _report_progress(done, total, unit):
+    if _progress_callback is not None:
+        _progress_callback(done, total, unit)
+
+
+class MemoryFile(namedtuple('MemoryFile', ['name', 'data'])):
+    """File di memori: member arsip atau objek embedded (tanpa folder temp).
+
+    name adalah path member (dipakai untuk ekstensi dan atribusi link), data
+    berisi bytes-nya. Semua extractor menerima path file maupun MemoryFile.
+    """
+    __slots__ = ()
+
+
+# Ekstensi ganda yang dikenali utuh (bukan hanya bagian terakhirnya)
+_COMPOUND_EXTENSIONS = ('.tar.gz', '.tar.bz2', '.tar.xz')
+
+
+def _source_name(source):
+    return source.name if isinstance(source, MemoryFile) else source
+
+
+def _source_extension(source):
+    """Ekstensi file dalam huruf kecil, termasuk ekstensi ganda seperti .tar.gz"""
+    name = os.path.basename(_source_name(source)).lower()
+    for extension in _COMPOUND_EXTENSIONS:
+        if name.endswith(extension):
+            return extension
+    return Path(name).suffix
+
+
+def _source_size(source):
+    return len(source.data) if isinstance(source, MemoryFile) else os.path.getsize(source)
+
+
+def _file_arg(source):
+    """Argumen untuk library yang menerima path maupun file-like (zipfile, PyPDF2, olefile, ...)"""
+    return io.BytesIO(source.data) if isinstance(source, MemoryFile) else source
+
+
+def _open_binary(source):
+    return io.BytesIO(source.data) if isinstance(source, MemoryFile) else open(source, 'rb')
+
+
+def _open_text(source, encoding, errors, newline=None):
+    if isinstance(source, MemoryFile):
+        return io.TextIOWrapper(io.BytesIO(source.data), encoding=encoding, errors=errors, newline=newline)
+    return open(source, 'r', encoding=encoding, errors=errors, newline=newline)
+
+
+# Asal link: teks biasa (dicari dengan scanner regex) atau target hyperlink asli
+ORIGIN_TEXT = 'teks'
+ORIGIN_HYPERLINK = 'hyperlink'
+
+
+class TextPart(namedtuple('TextPart', ['location', 'origin', 'text'])):
+    """Potongan hasil ekstraksi beserta lokasinya di dokumen.
+
+    location misalnya 'halaman 3', 'Sheet1!B4', 'slide 2' atau '' kalau
+    format tidak punya lokasi. Kalau origin ORIGIN_HYPERLINK, text adalah satu
+    target hyperlink utuh yang langsung dipakai tanpa lewat scanner regex.
+    """
+    __slots__ = ()
+
+
+class LinkRecord(namedtuple('LinkRecord', ['url', 'format', 'member', 'location', 'origin'])):
+    """Satu link beserta asalnya: format, member arsip, lokasi dan jenis (teks/hyperlink)"""
+    __slots__ = ()
+
+    def provenance(self):
+        """Asal link untuk ditampilkan, misal 'XLSX Sheet1!B4 (hyperlink)'"""
+        where = ' '.join(part for part in (self.format.upper(), self.location) if part)
+        if self.member:
+            where = f"{self.member}: {where}"
+        return f"{where} ({self.origin})"
+
+
+def _join_unit_text(units):
+    """Gabungkan teks dari generator potongan (list TextPart per halaman/sheet/...) jadi satu string"""
+    return '\n'.join(part.text for unit in units for part in unit)
+
+
+# Mode ekstraksi PDF: teks + annotation, atau annotation /URI saja (tanpa layout teks)
+PDF_MODE_FULL = 'full'
+PDF_MODE_ANNOTS = 'annots'
+PDF_MODES = (PDF_MODE_FULL, PDF_MODE_ANNOTS)
+
+
+def extract_text_from_file(file_path, pdf_mode=PDF_MODE_FULL, spec=None):
+    """Ekstrak teks dari berbagai format file.
+
+    Format ditentukan oleh select_format (magic bytes dulu, baru ekstensi),
+    jadi file yang salah nama (misal .xls yang sebenarnya XLSX) tetap terbaca.
+    """
+    file_extension = _source_extension(file_path)
+    
+    try:
+        if spec is None:
+            spec = select_format(file_path)
+        if spec is None:
+            raise Exception(f"Format file {file_extension} tidak didukung")
+        if spec.children is not None:
+            # Arsip / dokumen dengan objek embedded: gabungan teks semua member
+            return _join_unit_text(unit for _, _, unit in _iter_source_units(file_path, pdf_mode, spec=spec))
+        return _call_format_extract(spec, file_path, pdf_mode=pdf_mode)
+    except Exception as e:
+        raise Exception(f"Gagal membaca file {file_extension}: {str(e)}")
+
+
+def extract_text_from_txt(file_path):
+    """Ekstrak teks dari file TXT"""
+    with _open_text(file_path, 'utf-8', 'ignore') as file:
+        return file.read()
+
+
+# Namespace XML Office Open (DOCX/XLSX/PPTX)
+_W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_R_NS = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+_PKG_REL_NS = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+_HYPERLINK_REL_TYPE = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink'
+
+# Part di dalam DOCX yang bisa berisi teks/hyperlink
+_DOCX_PART_RE = re.compile(r'^word/(document|header\d*|footer\d*|footnotes|endnotes|comments)\.xml$')
+# Target field HYPERLINK, misal: HYPERLINK "https://example.com" \o "tooltip"
+_FIELD_HYPERLINK_RE = re.compile(r'HYPERLINK\s+"([^"]+)"')
+
+
+def _rels_path_for_part(part_name):
+    """word/document.xml -> word/_rels/document.xml.rels"""
+    folder, _, name = part_name.rpartition('/')
+    return f"{folder}/_rels/{name}.rels" if folder else f"_rels/{name}.rels"
+
+
+def _read_hyperlink_rels(archive, part_name):
+    """Baca file .rels milik sebuah part dan kembalikan map r:id -> URL hyperlink"""
+    rels_name = _rels_path_for_part(part_name)
+    try:
+        data = archive.read(rels_name)
+    except KeyError:
+        return {}
+    rels = {}
+    for rel in ET.fromstring(data).iter(f'{_PKG_REL_NS}Relationship'):
+        if rel.get('Type') == _HYPERLINK_REL_TYPE and rel.get('Target'):
+            rels[rel.get('Id')] = rel.get('Target')
+    return rels
+
+
+def _iter_docx_part(archive, part_name, text, links):
+    """Iterparse satu part DOCX: kumpulkan teks per paragraf dan target hyperlink.
+
+    Target diambil dari w:hyperlink (r:id di file _rels), field kompleks
+    (w:instrText) dan field sederhana (w:fldSimple w:instr) HYPERLINK.
+
+    Elemen paragraf langsung dibersihkan setelah diproses supaya memori tidak
+    tumbuh mengikuti ukuran dokumen.
+    """
+    rels = _read_hyperlink_rels(archive, part_name)
+    paragraph = []
+    field_code = []
+    with archive.open(part_name) as part:
+        for event, elem in ET.iterparse(part, events=('start', 'end')):
+            tag = elem.tag
+            if event == 'start':
+                if tag == f'{_W_NS}hyperlink':
+                    target = rels.get(elem.get(f'{_R_NS}id'))
+                    if target and target.startswith('http'):
+                        links.append(target)
+                elif tag == f'{_W_NS}fldSimple':
+                    # Field sederhana: <w:fldSimple w:instr='HYPERLINK "https://..."'>
+                    for target in _FIELD_HYPERLINK_RE.findall(elem.get(f'{_W_NS}instr', '')):
+                        if target.startswith('http'):
+                            links.append(target)
+                continue
+
+            if tag == f'{_W_NS}t':
+                if elem.text:
+                    paragraph.append(elem.text)
+            elif tag == f'{_W_NS}instrText':
+                if elem.text:
+                    field_code.append(elem.text)
+            elif tag == f'{_W_NS}tab':
+                paragraph.append('\t')
+            elif tag in (f'{_W_NS}br', f'{_W_NS}cr'):
+                paragraph.append('\n')
+            elif tag == f'{_W_NS}p':
+                if paragraph:
+                    text.append(''.join(paragraph))
+                    paragraph = []
+                if field_code:
+                    # Field HYPERLINK: teks yang tampil bisa beda dengan URL-nya
+                    for target in _FIELD_HYPERLINK_RE.findall(''.join(field_code)):
+                        if target.startswith('http'):
+                            links.append(target)
+                    field_code = []
+                elem.clear()
+    if paragraph:
+        text.append(''.join(paragraph))
+
+
+def iter_parts_from_docx(file_path):
+    """Yield list TextPart DOCX per part (isi dokumen, header, footer, ...).
+
+    DOCX dibuka langsung sebagai zip dan XML-nya di-iterparse, tanpa membangun
+    object model python-docx. Selain isi dokumen (termasuk tabel dan text box),
+    header, footer, footnote, endnote dan komentar juga ikut dipindai, dan
+    hyperlink r:id di-resolve langsung dari file _rels. Lokasi adalah nama
+    part ('document', 'header1', 'footnotes', ...).
+    """
+    try:
+        with zipfile.ZipFile(_file_arg(file_path)) as archive:
+            part_names = [name for name in archive.namelist() if _DOCX_PART_RE.match(name)]
+            if 'word/document.xml' not in part_names:
+                raise Exception("word/document.xml tidak ditemukan")
+            # Isi dokumen utama dulu, baru header/footer/notes
+            part_names.sort(key=lambda name: name != 'word/document.xml')
+            for index, part_name in enumerate(part_names):
+                text = []
+                links = []
+                _iter_docx_part(archive, part_name, text, links)
+                _report_progress(index + 1, len(part_names), 'bagian')
+                location = part_name[len('word/'):-len('.xml')]
+                # Hyperlink lebih dulu: kalau URL-nya juga tertulis di teks, asalnya tetap hyperlink
+                unit = [TextPart(location, ORIGIN_HYPERLINK, link) for link in links]
+                if text:
+                    unit.append(TextPart(location, ORIGIN_TEXT, '\n'.join(text)))
+                if unit:
+                    yield unit
+    except zipfile.BadZipFile:
+        raise Exception("File DOCX rusak atau bukan file DOCX yang valid")
+
+
+def extract_text_from_docx(file_path):
+    """Ekstrak teks dari file DOCX termasuk hyperlink"""
+    return _join_unit_text(iter_parts_from_docx(file_path))
+
+
+# Teks ASCII / UTF-16LE (Latin-1) yang bisa dibaca di dalam data biner (minimal 4 karakter)
+_ASCII_RUN_RE = re.compile(rb'[\x20-\x7e\t\r\n]{4,}')
+_UTF16_RUN_RE = re.compile(rb'(?:[\x20-\xff\t\r\n]\x00){4,}')
+# Karakter kontrol Word: \r paragraf, \x07 akhir cell, \x0b line break,
+# \x0c page break, \x13/\x14/\x15 awal/pemisah/akhir field
+_WORD_CONTROL_CHARS = str.maketrans({'\r': '\n', '\x07': '\t', '\x0b': '\n', '\x0c': '\n',
+                                     '\x13': ' ', '\x14': ' ', '\x15': ' '})
+
+
+def _scan_binary_text(data):
+    """Ambil potongan teks ASCII dan UTF-16LE dari data biner.
+
+    Pencarian dilakukan oleh regex bytes (di C), bukan loop per karakter.
+    Dipakai sebagai fallback kalau struktur stream tidak bisa di-parse.
+    """
+    text = [match.decode('ascii') for match in _ASCII_RUN_RE.findall(data)]
+    text.extend(match.decode('utf-16-le') for match in _UTF16_RUN_RE.findall(data))
+    return '\n'.join(text)
+
+
+def _read_doc_piece_table_text(word_stream, table_stream):
+    """Rekonstruksi teks dokumen Word 97-2003 dari piece table (Clx) di table stream"""
+    # Lokasi Clx ada di FibRgFcLcb97 (fcClx/lcbClx, entri ke-33)
+    csw = struct.unpack_from('<H', word_stream, 0x20)[0]
+    offset = 0x22 + csw * 2
+    cslw = struct.unpack_from('<H', word_stream, offset)[0]
+    offset += 2 + cslw * 4 + 2
+    fc_clx, lcb_clx = struct.unpack_from('<II', word_stream, offset + 33 * 8)
+    clx = table_stream[fc_clx:fc_clx + lcb_clx]
+
+    # Lewati Prc (clxt=0x01), cari Pcdt (clxt=0x02)
+    pos = 0
+    while pos < len(clx) and clx[pos] == 0x01:
+        pos += 3 + struct.unpack_from('<h', clx, pos + 1)[0]
+    if pos >= len(clx) or clx[pos] != 0x02:
+        raise ValueError("Piece table tidak ditemukan")
+    lcb = struct.unpack_from('<I', clx, pos + 1)[0]
+    plc = clx[pos + 5:pos + 5 + lcb]
+
+    # PlcPcd: (n+1) CP lalu n Pcd 8 byte
+    piece_count = (len(plc) - 4) // 12
+    cps = struct.unpack_from(f'<{piece_count + 1}I', plc, 0)
+    pcd_offset = (piece_count + 1) * 4
+    pieces = []
+    for i in range(piece_count):
+        fc = struct.unpack_from('<I', plc, pcd_offset + i * 8 + 2)[0]
+        char_count = cps[i + 1] - cps[i]
+        if fc & 0x40000000:
+            # Compressed: 1 byte per karakter (cp1252)
+            start = (fc & 0x3FFFFFFF) // 2
+            pieces.append(word_stream[start:start + char_count].decode('cp1252', errors='replace'))
+        else:
+            pieces.append(word_stream[fc:fc + char_count * 2].decode('utf-16-le', errors='replace'))
+    return ''.join(pieces)
+
+
+def iter_parts_from_doc(file_path):
+    """Yield list TextPart dari file DOC (format lama), lokasi 'document'.
+
+    Teks diambil dari stream WordDocument lewat piece table, jadi teks
+    UTF-16 juga terbaca. Target field HYPERLINK di-yield sebagai TextPart
+    hyperlink karena teks yang tampil bisa beda dengan URL-nya.
+    """
+    olefile = _import_optional('olefile')
+    if olefile is None:
+        raise Exception("Library olefile tidak terinstall. Install dengan: pip install olefile")
+    
+    try:
+        if not olefile.isOleFile(_file_arg(file_path)):
+            raise Exception("Bukan file OLE Word 97-2003")
+        with olefile.OleFileIO(_file_arg(file_path)) as ole:
+            if not ole.exists('WordDocument'):
+                raise Exception("Stream WordDocument tidak ditemukan")
+            word_stream = ole.openstream('WordDocument').read()
+            flags = struct.unpack_from('<H', word_stream, 0x0A)[0]
+            if flags & 0x0100:
+                raise Exception("File DOC terenkripsi")
+            table_name = '1Table' if flags & 0x0200 else '0Table'
+            table_stream = ole.openstream(table_name).read() if ole.exists(table_name) else b''
+
+        try:
+            text = _read_doc_piece_table_text(word_stream, table_stream)
+        except (ValueError, struct.error):
+            # Struktur tidak standar: ambil potongan teks langsung dari stream
+            text = _scan_binary_text(word_stream)
+
+        # Hyperlink lebih dulu: kalau URL-nya juga tertulis di teks, asalnya tetap hyperlink
+        unit = [TextPart('document', ORIGIN_HYPERLINK, target)
+                for target in _FIELD_HYPERLINK_RE.findall(text) if target.startswith('http')]
+        unit.append(TextPart('document', ORIGIN_TEXT, text.translate(_WORD_CONTROL_CHARS)))
+    except Exception as e:
+        raise Exception(f"Gagal membaca file DOC ({str(e)}). Coba convert ke DOCX dulu.")
+    yield unit
+
+
+def extract_text_from_doc(file_path):
+    """Ekstrak teks dari file DOC (format lama) termasuk target hyperlink"""
+    return _join_unit_text(iter_parts_from_doc(file_path))
+
+
+def extract_text_from_excel(file_path):
+    """Ekstrak teks dari file Excel (XLS/XLSX) termasuk hyperlink"""
+    file_extension = _source_extension(file_path)
+
+    if file_extension == '.xlsx':
+        return extract_text_from_xlsx(file_path)
+    elif file_extension == '.xls':
+        return extract_text_from_xls(file_path)
+    raise Exception(f"Format file {file_extension} bukan file Excel")
+
+
+_SS_NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+
+# Sheet dengan XML lebih besar dari ini diproses paralel di worker process
+XLSX_PARALLEL_MIN_BYTES = 16 * 1024 * 1024
+
+
+def _may_contain_link(value):
+    """Filter murah: teks tanpa titik tidak mungkin berisi link"""
+    return '.' in value
+
+
+def _resolve_part_target(base_folder, target):
+    """Resolve Target relasi (relatif atau absolut) jadi nama member zip"""
+    if target.startswith('/'):
+        return target.lstrip('/')
+    parts = base_folder.split('/') if base_folder else []
+    for piece in target.split('/'):
+        if piece == '..':
+            if parts:
+                parts.pop()
+        elif piece and piece != '.':
+            parts.append(piece)
+    return '/'.join(parts)
+
+
+def _read_xlsx_sheet_parts(archive):
+    """Kembalikan daftar (nama sheet, part XML worksheet) sesuai urutan sheet di workbook"""
+    rels = {}
+    for rel in ET.fromstring(archive.read('xl/_rels/workbook.xml.rels')).iter(f'{_PKG_REL_NS}Relationship'):
+        rels[rel.get('Id')] = _resolve_part_target('xl', rel.get('Target', ''))
+
+    sheet_parts = []
+    for sheet in ET.fromstring(archive.read('xl/workbook.xml')).iter(f'{_SS_NS}sheet'):
+        part_name = rels.get(sheet.get(f'{_R_NS}id'))
+        if part_name and part_name in archive.NameToInfo:
+            sheet_parts.append((sheet.get('name', ''), part_name))
+    return sheet_parts
+
+
+def _read_xlsx_link_strings(archive):
+    """Baca sharedStrings.xml dan simpan hanya string yang mungkin berisi link.
+
+    Mengembalikan map index -> string. String lain (mayoritas isi workbook)
+    tidak pernah disimpan.
+    """
+    strings = {}
+    try:
+        part = archive.open('xl/sharedStrings.xml')
+    except KeyError:
+        return strings
+    with part:
+        index = 0
+        for _, elem in ET.iterparse(part):
+            if elem.tag != f'{_SS_NS}si':
+                continue
+            value = ''.join(t.text or '' for t in elem.iter(f'{_SS_NS}t'))
+            if _may_contain_link(value):
+                strings[index] = value
+            index += 1
+            elem.clear()
+    return strings
+
+
+def _xlsx_cell_location(sheet_name, ref):
+    return f"{sheet_name}!{ref}" if ref else sheet_name
+
+
+def _extract_xlsx_sheet(archive, sheet_name, part_name, link_strings):
+    """Stream satu worksheet dan kembalikan list TextPart per cell + target hyperlink.
+
+    Cell angka/boolean/error dilewati tanpa membuat string; cell teks hanya
+    diambil kalau lolos filter _may_contain_link. Lokasi berupa 'Sheet1!B4'.
+    """
+    parts = []
+    hyperlinks = []
+    with archive.open(part_name) as part:
+        for _, elem in ET.iterparse(part):
+            tag = elem.tag
+            if tag == f'{_SS_NS}c':
+                cell_type = elem.get('t')
+                value = None
+                if cell_type == 's':
+                    index = elem.findtext(f'{_SS_NS}v')
+                    if index is not None:
+                        value = link_strings.get(int(index))
+                elif cell_type in ('str', 'inlineStr'):
+                    if cell_type == 'str':
+                        value = elem.findtext(f'{_SS_NS}v') or ''
+                    else:
+                        value = ''.join(t.text or '' for t in elem.iter(f'{_SS_NS}t'))
+                    if not _may_contain_link(value):
+                        value = None
+                # Formula seperti =HYPERLINK("https://...", "teks")
+                formula = elem.findtext(f'{_SS_NS}f')
+                if formula and not _may_contain_link(formula):
+                    formula = None
+                if value is not None or formula:
+                    location = _xlsx_cell_location(sheet_name, elem.get('r'))
+                    if value is not None:
+                        parts.append(TextPart(location, ORIGIN_TEXT, value))
+                    if formula:
+                        parts.append(TextPart(location, ORIGIN_TEXT, formula))
+            elif tag == f'{_SS_NS}row':
+                elem.clear()
+            elif tag == f'{_SS_NS}hyperlink':
+                rel_id = elem.get(f'{_R_NS}id')
+                if rel_id:
+                    hyperlinks.append((elem.get('ref'), rel_id))
+
+    if hyperlinks:
+        rels = _read_hyperlink_rels(archive, part_name)
+        for ref, rel_id in hyperlinks:
+            target = rels.get(rel_id)
+            if target and target.startswith('http'):
+                parts.append(TextPart(_xlsx_cell_location(sheet_name, ref), ORIGIN_HYPERLINK, target))
+    return parts
+
+
+def _xlsx_sheet_job(job):
+    """Job worker process: buka workbook sendiri lalu proses satu sheet"""
+    file_path, sheet_name, part_name, link_strings = job
+    with zipfile.ZipFile(file_path) as archive:
+        return _extract_xlsx_sheet(archive, sheet_name, part_name, link_strings)
+
+
+def iter_parts_from_xlsx(file_path, max_workers=None):
+    """Yield list TextPart XLSX per sheet dengan streaming XML (tanpa openpyxl).
+
+    Workbook dibaca langsung dari zip: sharedStrings difilter dulu, lalu tiap
+    sheet di-iterparse baris per baris. Hyperlink diambil dari relasi
+    sheetN.xml.rels. Kalau ada sheet yang sangat besar, semua sheet dibagi
+    ke beberapa worker process dan hasilnya digabung sesuai urutan sheet.
+    """
+    try:
+        with zipfile.ZipFile(_file_arg(file_path)) as archive:
+            sheet_parts = _read_xlsx_sheet_parts(archive)
+            link_strings = _read_xlsx_link_strings(archive)
+            sheet_sizes = [archive.getinfo(part_name).file_size for _, part_name in sheet_parts]
+
+            workers = min(len(sheet_parts), max_workers or os.cpu_count() or 1)
+            # Worker process membuka file sendiri, jadi hanya untuk file di disk
+            use_pool = (workers > 1
+                        and not isinstance(file_path, MemoryFile)
+                        and max(sheet_sizes, default=0) >= XLSX_PARALLEL_MIN_BYTES
+                        and _process_pools_enabled
+                        and not multiprocessing.current_process().daemon)
+            if not use_pool:
+                for index, (sheet_name, part_name) in enumerate(sheet_parts):
+                    sheet_parts_found = _extract_xlsx_sheet(archive, sheet_name, part_name, link_strings)
+                    _report_progress(index + 1, len(sheet_parts), 'sheet')
+                    if sheet_parts_found:
+                        yield sheet_parts_found
+                return
+    except (zipfile.BadZipFile, KeyError):
+        raise Exception("File XLSX rusak atau bukan file XLSX yang valid")
+
+    jobs = [(file_path, sheet_name, part_name, link_strings) for sheet_name, part_name in sheet_parts]
+    with _POOL_CONTEXT.Pool(processes=workers) as pool:
+        for index, sheet_parts_found in enumerate(pool.imap(_xlsx_sheet_job, jobs)):
+            _report_progress(index + 1, len(jobs), 'sheet')
+            if sheet_parts_found:
+                yield sheet_parts_found
+
+
+def extract_text_from_xlsx(file_path, max_workers=None):
+    """Ekstrak teks dari file XLSX (semua sheet digabung sesuai urutan sheet)"""
+    return _join_unit_text(iter_parts_from_xlsx(file_path, max_workers))
+
+
+def iter_parts_from_xls(file_path):
+    """Yield list TextPart XLS (Excel 97-2003) per sheet termasuk hyperlink.
+
+    Workbook dibuka dengan on_demand tanpa formatting_info, sheet dimuat satu
+    per satu lalu di-unload lagi. Nilai cell diambil per baris (row_types/
+    row_values) dan hanya cell teks yang mungkin berisi link yang disimpan.
+    Hyperlink diambil dari record HLINK (hyperlink_list) milik sheet.
+    """
+    xlrd = _import_optional('xlrd')
+    if xlrd is None:
+        raise Exception("Library xlrd tidak terinstall. Install dengan: pip install xlrd")
+
+    if isinstance(file_path, MemoryFile):
+        workbook = xlrd.open_workbook(file_contents=file_path.data, on_demand=True)
+    else:
+        workbook = xlrd.open_workbook(file_path, on_demand=True)
+    try:
+        for sheet_index in range(workbook.nsheets):
+            parts = []
+            sheet = workbook.sheet_by_index(sheet_index)
+            for row in range(sheet.nrows):
+                for col, (cell_type, cell_value) in enumerate(zip(sheet.row_types(row), sheet.row_values(row))):
+                    if cell_type == xlrd.XL_CELL_TEXT and _may_contain_link(cell_value):
+                        location = f"{sheet.name}!{xlrd.cellname(row, col)}"
+                        parts.append(TextPart(location, ORIGIN_TEXT, cell_value))
+
+            # Hyperlink asli dari record HLINK (teks cell bisa beda dengan URL-nya)
+            for hyperlink in getattr(sheet, 'hyperlink_list', ()):
+                url = hyperlink.url_or_path
+                if hyperlink.type == 'url' and url and url.startswith('http'):
+                    location = f"{sheet.name}!{xlrd.cellname(hyperlink.frowx, hyperlink.fcolx)}"
+                    parts.append(TextPart(location, ORIGIN_HYPERLINK, url))
+            workbook.unload_sheet(sheet_index)
+            _report_progress(sheet_index + 1, workbook.nsheets, 'sheet')
+            if parts:
+                yield parts
+    finally:
+        workbook.release_resources()
+
+
+def extract_text_from_xls(file_path):
+    """Ekstrak teks dari file XLS (semua sheet digabung)"""
+    return _join_unit_text(iter_parts_from_xls(file_path))
+
+
+def iter_parts_from_pptx(file_path):
+    """Yield list TextPart PPTX per slide termasuk hyperlink (lokasi 'slide N')"""
+    pptx = _import_optional('pptx')
+    if pptx is None:
+        raise Exception("Library python-pptx tidak terinstall. Install dengan: pip install python-pptx")
+    
+    prs = pptx.Presentation(_file_arg(file_path))
+    
+    slide_count = len(prs.slides)
+    for slide_index, slide in enumerate(prs.slides):
+        _report_progress(slide_index, slide_count, 'slide')
+        location = f"slide {slide_index + 1}"
+        parts = []
+        for shape in slide.shapes:
+            if hasattr(shape, "text") and shape.text:
+                parts.append(TextPart(location, ORIGIN_TEXT, shape.text))
+            
+            # Cek hyperlink di shape
+            if hasattr(shape, "click_action") and shape.click_action.hyperlink:
+                hyperlink = shape.click_action.hyperlink
+                if hasattr(hyperlink, 'address') and hyperlink.address:
+                    if hyperlink.address.startswith('http'):
+                        parts.append(TextPart(location, ORIGIN_HYPERLINK, hyperlink.address))
+            
+            # Cek hyperlink di text runs (untuk text yang ada hyperlink-nya)
+            if hasattr(shape, "text_frame"):
+                for paragraph in shape.text_frame.paragraphs:
+                    for run in paragraph.runs:
+                        if hasattr(run, "hyperlink") and run.hyperlink:
+                            if hasattr(run.hyperlink, 'address') and run.hyperlink.address:
+                                if run.hyperlink.address.startswith('http'):
+                                    parts.append(TextPart(location, ORIGIN_HYPERLINK, run.hyperlink.address))
+        if parts:
+            yield parts
+
+
+def extract_text_from_pptx(file_path):
+    """Ekstrak teks dari file PPTX termasuk hyperlink"""
+    return _join_unit_text(iter_parts_from_pptx(file_path))
+
+
+# PDF dengan halaman sebanyak ini atau lebih dibagi per range halaman ke worker process
+PDF_PARALLEL_MIN_PAGES = 64
+
+
+def _extract_pdf_page(page, mode, page_number):
+    """Ekstrak teks (kalau mode full) dan link annotation dari satu halaman PDF sebagai list TextPart"""
+    location = f"halaman {page_number}"
+    parts = []
+    if mode == PDF_MODE_FULL:
+        # Ekstrak teks normal
+        page_text = page.extract_text()
+        if page_text:
+            parts.append(TextPart(location, ORIGIN_TEXT, page_text))
+
+    # Ekstrak link dari annotations (/Annots -> /A -> /URI)
+    annotations = page.get('/Annots')
+    if annotations:
+        for annotation in annotations.get_object():
+            annotation_obj = annotation.get_object()
+            if not annotation_obj or '/A' not in annotation_obj:
+                continue
+            action = annotation_obj['/A'].get_object()
+            if '/URI' in action:
+                uri = action['/URI']
+                if isinstance(uri, str) and uri.startswith('http'):
+                    parts.append(TextPart(location, ORIGIN_HYPERLINK, uri))
+    return parts
+
+
+def _pdf_pages_job(job):
+    """Job worker process: buka PDF sendiri lalu proses range halaman [start, stop)"""
+    file_path, start, stop, mode = job
+    PyPDF2 = _import_optional('PyPDF2')
+    parts = []
+    with open(file_path, 'rb') as file:
+        pdf_reader = PyPDF2.PdfReader(file)
+        for page_index in range(start, stop):
+            parts.extend(_extract_pdf_page(pdf_reader.pages[page_index], mode, page_index + 1))
+    return parts
+
+
+def iter_parts_from_pdf(file_path, mode=PDF_MODE_FULL, max_workers=None):
+    """Yield list TextPart PDF per halaman (atau per range halaman) termasuk link/annotation.
+
+    mode=PDF_MODE_ANNOTS hanya membaca link /URI dari annotation tanpa
+    extract_text (jauh lebih cepat, cukup untuk PDF yang link-nya berupa
+    annotation). PDF dengan banyak halaman dibagi per range halaman ke
+    process pool, dan hasilnya digabung sesuai urutan halaman.
+    """
+    PyPDF2 = _import_optional('PyPDF2')
+    if PyPDF2 is None:
+        raise Exception("Library PyPDF2 tidak terinstall. Install dengan: pip install PyPDF2")
+    if mode not in PDF_MODES:
+        raise Exception(f"Mode PDF tidak dikenal: {mode}")
+
+    try:
+        with _open_binary(file_path) as file:
+            pdf_reader = PyPDF2.PdfReader(file)
+            page_count = len(pdf_reader.pages)
+            workers = min(max_workers or os.cpu_count() or 1, page_count)
+            use_pool = (mode == PDF_MODE_FULL
+                        and workers > 1
+                        and not isinstance(file_path, MemoryFile)
+                        and page_count >= PDF_PARALLEL_MIN_PAGES
+                        and _process_pools_enabled
+                        and not multiprocessing.current_process().daemon)
+            if not use_pool:
+                for page_number, page in enumerate(pdf_reader.pages, 1):
+                    page_parts = _extract_pdf_page(page, mode, page_number)
+                    _report_progress(page_number, page_count, 'halaman')
+                    if page_parts:
+                        yield page_parts
+                return
+
+        # Beberapa shard per worker supaya halaman berat tidak menumpuk di satu worker
+        shard_size = max(1, -(-page_count // (workers * 4)))
+        jobs = [(file_path, start, min(start + shard_size, page_count), mode)
+                for start in range(0, page_count, shard_size)]
+        pages_done = 0
+        with _POOL_CONTEXT.Pool(processes=workers) as pool:
+            for (_, start, stop, _), shard_parts in zip(jobs, pool.imap(_pdf_pages_job, jobs)):
+                pages_done += stop - start
+                _report_progress(pages_done, page_count, 'halaman')
+                if shard_parts:
+                    yield shard_parts
+    except Exception as e:
+        raise Exception(f"Gagal membaca PDF: {str(e)}")
+
+
+def extract_text_from_pdf(file_path, mode=PDF_MODE_FULL, max_workers=None):
+    """Ekstrak teks dari file PDF termasuk link/annotation (semua halaman digabung)"""
+    return _join_unit_text(iter_parts_from_pdf(file_path, mode, max_workers))
+
+
+# Record PowerPoint 97-2003 yang berisi teks
+_PPT_TEXT_CHARS_ATOM = 0x0FA0  # UTF-16LE
+_PPT_TEXT_BYTES_ATOM = 0x0FA8  # 8-bit (latin-1)
+_PPT_CSTRING_ATOM = 0x0FBA  # UTF-16LE, termasuk target ExHyperlink
+# Container yang menentukan lokasi / asal teks di dalamnya
+_PPT_SLIDE = 0x03EE  # satu slide (teks shape di drawing-nya)
+_PPT_SLIDE_LIST_WITH_TEXT = 0x0FF0  # instance 0: teks placeholder semua slide
+_PPT_SLIDE_PERSIST_ATOM = 0x03F3  # awal teks slide berikutnya di SlideListWithText
+_PPT_EX_HYPERLINK = 0x0FD7  # CString instance 1 di dalamnya = target hyperlink
+_PPT_HYPERLINK_TARGET_INSTANCE = 1
+
+
+def _iter_ppt_text_records(stream):
+    """Jalan linear di record stream 'PowerPoint Document' dan yield (lokasi, origin, teks).
+
+    Container (recVer 0xF) dimasuki, atom lain dilompati tanpa dibaca. Lokasi
+    'slide N' diambil dari SlidePersistAtom di SlideListWithText atau dari
+    urutan container Slide; target ExHyperlink di-yield dengan origin hyperlink.
+    """
+    pos = 0
+    end = len(stream)
+    slide_count = 0
+    slide_end = 0
+    list_slide = 0
+    list_end = 0
+    hyperlink_end = 0
+    while pos + 8 <= end:
+        ver_instance, rec_type, rec_len = struct.unpack_from('<HHI', stream, pos)
+        pos += 8
+        if ver_instance & 0x000F == 0x000F:
+            # Container: isinya diproses sebagai record berikutnya
+            if rec_type == _PPT_SLIDE:
+                slide_count += 1
+                slide_end = pos + rec_len
+            elif rec_type == _PPT_SLIDE_LIST_WITH_TEXT and ver_instance >> 4 == 0:
+                list_slide = 0
+                list_end = pos + rec_len
+            elif rec_type == _PPT_EX_HYPERLINK:
+                hyperlink_end = pos + rec_len
+            continue
+        if pos + rec_len > end:
+            break
+        if rec_type == _PPT_SLIDE_PERSIST_ATOM and pos < list_end:
+            list_slide += 1
+        elif rec_type in (_PPT_TEXT_CHARS_ATOM, _PPT_CSTRING_ATOM, _PPT_TEXT_BYTES_ATOM):
+            if pos < list_end and list_slide:
+                location = f"slide {list_slide}"
+            elif pos < slide_end:
+                location = f"slide {slide_count}"
+            else:
+                location = ''
+            origin = ORIGIN_TEXT
+            if (rec_type == _PPT_CSTRING_ATOM and pos < hyperlink_end
+                    and ver_instance >> 4 == _PPT_HYPERLINK_TARGET_INSTANCE):
+                origin = ORIGIN_HYPERLINK
+            if rec_type == _PPT_TEXT_BYTES_ATOM:
+                text = stream[pos:pos + rec_len].decode('latin-1')
+            else:
+                text = stream[pos:pos + rec_len].decode('utf-16-le', errors='replace')
+            yield location, origin, text
+        pos += rec_len
+
+
+def iter_parts_from_ppt(file_path):
+    """Yield list TextPart dari file PPT (format lama).
+
+    Teks dan target hyperlink diambil dari record atom di stream
+    'PowerPoint Document', bukan dari decode byte seluruh file. Atom teks
+    berurutan dengan lokasi yang sama digabung jadi satu TextPart.
+    """
+    olefile = _import_optional('olefile')
+    if olefile is None:
+        raise Exception("Library olefile tidak terinstall. Install dengan: pip install olefile")
+    
+    try:
+        if not olefile.isOleFile(_file_arg(file_path)):
+            raise Exception("Bukan file OLE PowerPoint 97-2003")
+        with olefile.OleFileIO(_file_arg(file_path)) as ole:
+            if not ole.exists('PowerPoint Document'):
+                raise Exception("Stream PowerPoint Document tidak ditemukan")
+            stream = ole.openstream('PowerPoint Document').read()
+
+        links = []
+        texts = []
+        pieces = []
+        location = None
+        for record_location, origin, text in _iter_ppt_text_records(stream):
+            if not text.strip():
+                continue
+            if origin == ORIGIN_HYPERLINK:
+                links.append(TextPart(record_location, ORIGIN_HYPERLINK, text))
+                continue
+            if record_location != location:
+                if pieces:
+                    texts.append(TextPart(location, ORIGIN_TEXT, '\n'.join(pieces)))
+                location = record_location
+                pieces = []
+            pieces.append(text.replace('\r', '\n').replace('\x0b', '\n'))
+        if pieces:
+            texts.append(TextPart(location, ORIGIN_TEXT, '\n'.join(pieces)))
+        # Hyperlink lebih dulu: kalau URL-nya juga tertulis di teks, asalnya tetap hyperlink
+        unit = links + texts
+        if not unit:
+            # Tidak ada atom teks yang terbaca: ambil potongan teks langsung dari stream
+            unit.append(TextPart('', ORIGIN_TEXT, _scan_binary_text(stream)))
+    except Exception as e:
+        raise Exception(f"Gagal membaca file PPT ({str(e)}). Coba convert ke PPTX dulu.")
+    yield unit
+
+
+def extract_text_from_ppt(file_path):
+    """Ekstrak teks dari file PPT (format lama) termasuk target hyperlink"""
+    return _join_unit_text(iter_parts_from_ppt(file_path))
+
+
+# Jumlah baris per chunk saat membaca CSV dengan pandas
+CSV_CHUNK_ROWS = 100000
+# Ukuran awal file yang dipakai untuk menebak encoding
+_ENCODING_SNIFF_BYTES = 64 * 1024
+
+
+def _sniff_text_encoding(file_path):
+    """Tebak encoding file teks sekali saja dari potongan awal file.
+
+    Urutannya sama seperti sebelumnya: UTF-8 (dengan/ tanpa BOM), lalu
+    cp1252, lalu latin-1 yang selalu berhasil.
+    """
+    with _open_binary(file_path) as file:
+        prefix = file.read(_ENCODING_SNIFF_BYTES)
+    if prefix.startswith(b'\xef\xbb\xbf'):
+        return 'utf-8-sig'
+    try:
+        # final=False: karakter multi-byte yang terpotong di akhir prefix bukan error
+        codecs.getincrementaldecoder('utf-8')().decode(prefix, final=False)
+        return 'utf-8'
+    except UnicodeDecodeError:
+        pass
+    try:
+        prefix.decode('cp1252')
+        return 'cp1252'
+    except UnicodeDecodeError:
+        return 'latin-1'
+
+
+def _csv_cell_location(row, column):
+    """Lokasi cell CSV: nomor baris (baris header = 1) dan nomor kolom, mulai dari 1"""
+    return f"baris {row}, kolom {column}"
+
+
+def _iter_csv_link_cells_pandas(pd, file_path, encoding):
+    """Baca CSV per chunk dengan pandas dan yield (lokasi, cell) yang mungkin berisi link.
+
+    Filter dilakukan per kolom dengan str.contains (vectorized), jadi hanya
+    cell yang lolos yang diubah jadi object Python.
+    """
+    first_chunk = True
+    for chunk in pd.read_csv(_file_arg(file_path), encoding=encoding, encoding_errors='replace',
+                             dtype=str, chunksize=CSV_CHUNK_ROWS):
+        if first_chunk:
+            # Nama kolom juga ikut dipindai
+            for column_number, column in enumerate(chunk.columns, 1):
+                if _may_contain_link(str(column)):
+                    yield _csv_cell_location(1, column_number), str(column)
+            first_chunk = False
+        for column_number, column in enumerate(chunk.columns, 1):
+            values = chunk[column]
+            mask = values.str.contains('.', regex=False, na=False)
+            if mask.any():
+                # Index chunk berlanjut antar chunk; +2 untuk baris header dan mulai dari 1
+                for row_index, value in values[mask].items():
+                    yield _csv_cell_location(row_index + 2, column_number), value
+
+
+def _iter_csv_link_cells(file_path, encoding):
+    """Baca CSV baris per baris dengan modul csv dan yield (lokasi, cell) yang mungkin berisi link"""
+    with _open_text(file_path, encoding, 'replace', newline='') as file:
+        for row_number, row in enumerate(csv.reader(file), 1):
+            for column_number, cell in enumerate(row, 1):
+                if _may_contain_link(cell):
+                    yield _csv_cell_location(row_number, column_number), cell
+
+
+# Jumlah cell CSV per potongan saat streaming
+CSV_TEXT_BATCH_CELLS = 10000
+
+
+def iter_parts_from_csv(file_path):
+    """Yield list TextPart dari file CSV secara streaming, per kelompok cell.
+
+    Encoding ditebak sekali dari awal file, lalu file dibaca per chunk tanpa
+    membangun DataFrame utuh. Kalau pandas terinstall, filter cell dilakukan
+    vectorized per chunk; kalau tidak, dipakai modul csv bawaan Python.
+    """
+    encoding = _sniff_text_encoding(file_path)
+    pd = _import_optional('pandas')
+    if pd is not None:
+        cells = _iter_csv_link_cells_pandas(pd, file_path, encoding)
+    else:
+        cells = _iter_csv_link_cells(file_path, encoding)
+    batch = []
+    for location, cell in cells:
+        batch.append(TextPart(location, ORIGIN_TEXT, cell))
+        if len(batch) >= CSV_TEXT_BATCH_CELLS:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def extract_text_from_csv(file_path):
+    """Ekstrak teks dari file CSV (semua cell yang mungkin berisi link)"""
+    return _join_unit_text(iter_parts_from_csv(file_path))
+
+
+# Token RTF: control word, hex escape \'hh, control symbol, kurung kurawal, teks biasa
+_RTF_TOKEN_RE = re.compile(
+    rb"\\([a-zA-Z]{1,32})(-?[0-9]{1,10})? ?"
+    rb"|\\'([0-9a-fA-F]{2})"
+    rb"|\\([^a-zA-Z'])"
+    rb"|([{}])"
+    rb"|([^\\{}\r\n]+)"
+    rb"|[\r\n]+"
+)
+# Di dalam group yang dilewati, semua selain \ { } dilompati sekaligus
+_RTF_SKIP_RE = re.compile(rb'[^\\{}]+')
+# Destination yang tidak berisi teks yang terlihat (gambar, tabel font, metadata, ...)
+_RTF_SKIP_DESTINATIONS = frozenset([
+    'fonttbl', 'colortbl', 'stylesheet', 'info', 'pict', 'object', 'objdata',
+    'themedata', 'colorschememapping', 'datastore', 'latentstyles', 'listtable',
+    'listoverridetable', 'rsidtbl', 'generator', 'xmlnstbl', 'filetbl', 'revtbl',
+])
+_RTF_NEWLINE_WORDS = frozenset(['par', 'line', 'sect', 'page', 'row'])
+_RTF_TAB_WORDS = frozenset(['tab', 'cell'])
+_RTF_SYMBOLS = {b'\\': '\\', b'{': '{', b'}': '}', b'~': ' ', b'_': '-', b'\n': '\n', b'\r': '\n'}
+
+
+def _iter_rtf_text(data, links):
+    """Tokenizer RTF streaming: yield potongan teks yang terlihat secara bertahap.
+
+    Group \pict, \bin, tabel font/warna dan destination \* yang tidak dikenal
+    dilompati tanpa membuat string. Instruksi field HYPERLINK dikumpulkan
+    terpisah dan target URL-nya ditambahkan ke links begitu group \fldinst
+    ditutup, jadi link tetap ditemukan walaupun teks yang tampil berbeda.
+    """
+    pos = 0
+    end = len(data)
+    stack = []
+    skip = False  # group ini (dan isinya) tidak berisi teks terlihat
+    in_instr = False  # sedang di dalam {\*\fldinst ...}
+    uc = 1  # jumlah karakter pengganti setelah \uN
+    pending_skip_chars = 0
+    star = False
+    codec = 'cp1252'
+    instr = []
+
+    while pos < end:
+        if skip:
+            match = _RTF_SKIP_RE.match(data, pos)
+            if match:
+                pos = match.end()
+                continue
+        match = _RTF_TOKEN_RE.match(data, pos)
+        if match is None:
+            pos += 1
+            continue
+        pos = match.end()
+        word, param, hex_code, symbol, brace, run = match.groups()
+
+        if brace is not None:
+            if brace == b'{':
+                stack.append((skip, in_instr, uc))
+            else:
+                was_instr = in_instr
+                if stack:
+                    skip, in_instr, uc = stack.pop()
+                if was_instr and not in_instr:
+                    for target in _FIELD_HYPERLINK_RE.findall(''.join(instr)):
+                        if target.startswith('http'):
+                            links.append(target)
+                    instr = []
+            star = False
+            continue
+
+        if word is not None:
+            word = word.decode('ascii')
+            if word == 'bin' and param:
+                # Data biner mentah: lompati byte-nya langsung
+                pos += max(0, int(param))
+            elif skip:
+                pass
+            elif word == 'fldinst':
+                in_instr = True
+            elif star or word in _RTF_SKIP_DESTINATIONS:
+                skip = True
+            elif word == 'u' and param:
+                value = int(param)
+                piece = chr(value + 65536 if value < 0 else value)
+                pending_skip_chars = uc
+                if in_instr:
+                    instr.append(piece)
+                else:
+                    yield piece
+            elif word == 'uc' and param:
+                uc = int(param)
+            elif word == 'ansicpg' and param:
+                try:
+                    codec = codecs.lookup(f'cp{param.decode("ascii")}').name
+                except LookupError:
+                    pass
+            elif word in _RTF_NEWLINE_WORDS or word in _RTF_TAB_WORDS:
+                piece = '\n' if word in _RTF_NEWLINE_WORDS else '\t'
+                if in_instr:
+                    instr.append(piece)
+                else:
+                    yield piece
+            star = False
+            continue
+
+        if skip:
+            continue
+
+        if symbol is not None:
+            if symbol == b'*':
+                star = True
+                continue
+            piece = _RTF_SYMBOLS.get(symbol)
+        elif hex_code is not None:
+            if pending_skip_chars:
+                pending_skip_chars -= 1
+                continue
+            piece = bytes([int(hex_code, 16)]).decode(codec, errors='replace')
+        elif run is not None:
+            if pending_skip_chars:
+                skipped = min(pending_skip_chars, len(run))
+                pending_skip_chars -= skipped
+                run = run[skipped:]
+            piece = run.decode(codec, errors='replace')
+        else:
+            piece = None  # newline mentah di file RTF tidak berarti apa-apa
+        star = False
+        if piece:
+            if in_instr:
+                instr.append(piece)
+            else:
+                yield piece
+
+
+# Teks RTF dikirim per potongan sebesar ini (karakter)
+RTF_UNIT_CHARS = 1024 * 1024
+
+
+def _iter_rtf_units(data):
+    """Kelompokkan hasil _iter_rtf_text jadi list TextPart per kira-kira RTF_UNIT_CHARS karakter.
+
+    Potongan dipotong di delimiter (seperti chunk TXT), jadi link tidak
+    terbelah; target HYPERLINK ikut di potongan tempat field-nya ditemukan.
+    """
+    links = []
+    pieces = []
+    size = 0
+    carry = ''
+    for piece in _iter_rtf_text(data, links):
+        pieces.append(piece)
+        size += len(piece)
+        if size < RTF_UNIT_CHARS:
+            continue
+        text, carry = _split_chunk(carry + ''.join(pieces))
+        pieces = []
+        size = 0
+        if text or links:
+            unit = _rtf_unit(links, text)
+            # _iter_rtf_text terus menambah ke list yang sama
+            links.clear()
+            yield unit
+    text = carry + ''.join(pieces)
+    if text or links:
+        yield _rtf_unit(links, text)
+
+
+def _rtf_unit(links, text):
+    # Hyperlink lebih dulu: kalau URL-nya juga tertulis di teks, asalnya tetap hyperlink
+    unit = [TextPart('', ORIGIN_HYPERLINK, link) for link in links]
+    if text:
+        unit.append(TextPart('', ORIGIN_TEXT, text))
+    return unit
+
+
+def iter_parts_from_rtf(file_path):
+    """Yield list TextPart dari file RTF per potongan, target field HYPERLINK sebagai TextPart hyperlink.
+
+    File di-mmap dan di-tokenize langsung (tanpa striprtf), jadi tidak ada
+    salinan penuh isi file di memori dan tidak ada pembacaan ulang saat
+    encoding gagal; encoding diambil dari \ansicpg di header RTF. Link di
+    awal file sudah keluar sebelum sisa file di-tokenize.
+    """
+    if isinstance(file_path, MemoryFile):
+        yield from _iter_rtf_units(file_path.data)
+        return
+    try:
+        with open(file_path, 'rb') as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                yield from _iter_rtf_units(data)
+    except OSError as e:
+        raise Exception(f"Gagal membaca file RTF: {str(e)}")
+
+
+def extract_text_from_rtf(file_path):
+    """Ekstrak teks dari file RTF termasuk target hyperlink"""
+    return _join_unit_text(iter_parts_from_rtf(file_path))
+
+
+# Namespace OpenDocument
+_ODF_TEXT_NS = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}'
+_ODF_TABLE_NS = '{urn:oasis:names:tc:opendocument:xmlns:table:1.0}'
+_ODF_DRAW_NS = '{urn:oasis:names:tc:opendocument:xmlns:drawing:1.0}'
+_XLINK_HREF = '{http://www.w3.org/1999/xlink}href'
+_ODF_PARAGRAPH_TAGS = (f'{_ODF_TEXT_NS}p', f'{_ODF_TEXT_NS}h')
+# Element yang menjadi lokasi link (sheet ODS, slide ODP) -> atribut namanya
+_ODF_LOCATION_TAGS = {
+    f'{_ODF_TABLE_NS}table': f'{_ODF_TABLE_NS}name',
+    f'{_ODF_DRAW_NS}page': f'{_ODF_DRAW_NS}name',
+}
+# Teks ODF dikirim per potongan sebesar ini (karakter) walaupun sheet/slide belum selesai
+ODF_UNIT_CHARS = 1024 * 1024
+
+
+def _odf_unit(location, links, text):
+    """Satu potongan ODF: hyperlink dulu (asalnya tetap hyperlink), lalu teks paragraf"""
+    unit = [TextPart(location, ORIGIN_HYPERLINK, link) for link in links]
+    if text:
+        unit.append(TextPart(location, ORIGIN_TEXT, '\n'.join(text)))
+    return unit
+
+
+def iter_parts_from_odf(file_path, label):
+    """Stream content.xml dari file ODT/ODS/ODP dan yield list TextPart per sheet/slide.
+
+    Satu kali iterparse: setiap paragraf (text:p / text:h) diambil teksnya
+    lalu langsung dibersihkan, dan atribut xlink:href (text:a, draw:a, dll)
+    di-yield sebagai TextPart hyperlink. Lokasi adalah nama sheet (ODS) atau
+    slide (ODP); dokumen ODT yang panjang dikirim per ODF_UNIT_CHARS karakter.
+    Tidak ada DOM odfpy yang dibangun.
+    """
+    try:
+        with zipfile.ZipFile(_file_arg(file_path)) as archive, archive.open('content.xml') as content:
+            total_bytes = archive.getinfo('content.xml').file_size
+            location = ''
+            text = []
+            links = []
+            chars = 0
+            for event, elem in ET.iterparse(content, events=('start', 'end')):
+                tag = elem.tag
+                if event == 'start':
+                    href = elem.get(_XLINK_HREF)
+                    if href:
+                        links.append(href)
+                    if tag in _ODF_LOCATION_TAGS:
+                        location = elem.get(_ODF_LOCATION_TAGS[tag], '')
+                    continue
+
+                if tag in _ODF_PARAGRAPH_TAGS:
+                    para_text = ''.join(elem.itertext())
+                    if _may_contain_link(para_text):
+                        text.append(para_text)
+                        chars += len(para_text)
+                    elem.clear()
+                elif tag == f'{_ODF_TEXT_NS}s':
+                    elem.text = ' ' * int(elem.get(f'{_ODF_TEXT_NS}c', '1'))
+                elif tag == f'{_ODF_TEXT_NS}tab':
+                    elem.text = '\t'
+                elif tag == f'{_ODF_TEXT_NS}line-break':
+                    elem.text = '\n'
+                elif tag == f'{_ODF_TABLE_NS}table-row':
+                    elem.clear()
+
+                end_of_location = tag in _ODF_LOCATION_TAGS
+                if (end_of_location or chars >= ODF_UNIT_CHARS) and (text or links):
+                    _report_progress(content.tell(), total_bytes, 'byte')
+                    yield _odf_unit(location, links, text)
+                    text = []
+                    links = []
+                    chars = 0
+                if end_of_location:
+                    elem.clear()
+                    location = ''
+            if text or links:
+                yield _odf_unit(location, links, text)
+    except (zipfile.BadZipFile, KeyError, ET.ParseError) as e:
+        raise Exception(f"Gagal membaca file {label}: {str(e)}")
+
+
+def iter_parts_from_odt(file_path):
+    """Yield list TextPart dari file ODT (OpenDocument Text)"""
+    return iter_parts_from_odf(file_path, 'ODT')
+
+
+def iter_parts_from_ods(file_path):
+    """Yield list TextPart dari file ODS (OpenDocument Spreadsheet) per sheet"""
+    return iter_parts_from_odf(file_path, 'ODS')
+
+
+def iter_parts_from_odp(file_path):
+    """Yield list TextPart dari file ODP (OpenDocument Presentation) per slide"""
+    return iter_parts_from_odf(file_path, 'ODP')
+
+
+def extract_text_from_odt(file_path):
+    """Ekstrak teks dari file ODT (OpenDocument Text)"""
+    return _join_unit_text(iter_parts_from_odt(file_path))
+
+
+def extract_text_from_ods(file_path):
+    """Ekstrak teks dari file ODS (OpenDocument Spreadsheet)"""
+    return _join_unit_text(iter_parts_from_ods(file_path))
+
+
+def extract_text_from_odp(file_path):
+    """Ekstrak teks dari file ODP (OpenDocument Presentation)"""
+    return _join_unit_text(iter_parts_from_odp(file_path))
+
+
+# Karakter yang tidak boleh ada di dalam link (sama untuk ketiga jenis link)
+_LINK_DELIMITERS = r'\s<>"\'`\[\]{}|\\^'
+
+# Satu regex untuk semua jenis link: ambil token utuh (dibatasi delimiter) yang
+# mengandung titik. Lookbehind memastikan match hanya dimulai di awal token, dan
+# bagian sebelum titik pertama tidak berisi titik, jadi tidak ada backtracking
+# bertingkat: waktu scan linear terhadap panjang teks, termasuk untuk token
+# panjang seperti minified JS atau blob base64.
+_LINK_TOKEN_RE = re.compile(
+    r'(?<![^' + _LINK_DELIMITERS + r'])'
+    r'[^' + _LINK_DELIMITERS + r'.]*\.[^' + _LINK_DELIMITERS + r']*'
+)
+# Potongan domain (huruf, angka, titik, strip) untuk link tanpa protocol
+_DOMAIN_RUN_RE = re.compile(r'[a-zA-Z0-9.-]+')
+# Karakter yang bisa ada di potongan domain (sama dengan _DOMAIN_RUN_RE)
+_DOMAIN_CHARS = frozenset('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789.-')
+# Setelah "www." harus ada minimal satu karakter lalu ".xx" (TLD)
+_WWW_TAIL_RE = re.compile(r'.\.[a-zA-Z]{2}')
+# Karakter yang dibuang dari akhir link
+_TRAILING_PUNCTUATION = '.,!?;:)}]'
+
+# Jenis link, sekaligus urutan kelompok di hasil akhir
+LINK_KIND_HTTP = 0
+LINK_KIND_WWW = 1
+LINK_KIND_DOMAIN = 2
+
+
+def _classify_link_token(token):
+    """Tentukan link di dalam satu token.
+
+    Mengembalikan list (jenis, kandidat link mentah), kosong kalau tidak ada.
+    Link http/https diambil dari "http" sampai akhir token. Link www atau
+    domain/path (www > domain) hanya diambil kalau dimulai sebelum "http",
+    jadi token redirect seperti example.com/x?u=https://y.com/z menghasilkan
+    link luar dan link dalam, sedangkan http://www.x.com tidak menghasilkan
+    duplikat https://www.x.com. "www." hanya dipakai kalau berada di awal
+    potongan domain: shop.www.example.com/a jadi link domain utuh, bukan
+    https://www.example.com/a.
+    """
+    lower = token.lower()
+    found = []
+
+    # Link dengan protocol http/https: dari "http" sampai akhir token
+    start = lower.find('http://')
+    https_start = lower.find('https://')
+    if https_start != -1 and (start == -1 or https_start < start):
+        start = https_start
+    if start != -1:
+        found.append((LINK_KIND_HTTP, token[start:]))
+        if start == 0:
+            return found
+        limit = start
+    else:
+        limit = len(token)
+
+    # Link www.
+    www_start = lower.find('www.', 0, limit)
+    while www_start > 0 and token[www_start - 1] in _DOMAIN_CHARS:
+        www_start = lower.find('www.', www_start + 1, limit)
+    if www_start != -1 and _WWW_TAIL_RE.search(token, www_start + 4):
+        found.append((LINK_KIND_WWW, token[www_start:]))
+        return found
+
+    # Link domain/path tanpa protocol, misal example.com/halaman
+    for run in _DOMAIN_RUN_RE.finditer(token, 0, limit):
+        end = run.end()
+        if token[end:end + 1] != '/':
+            continue
+        domain = run.group()
+        dot = domain.rfind('.')
+        tld = domain[dot + 1:]
+        if dot > 0 and len(tld) >= 2 and tld.isascii() and tld.isalpha():
+            found.append((LINK_KIND_DOMAIN, token[run.start():]))
+            break
+    return found
+
+
+def _normalize_link_candidate(kind, link):
+    """Bersihkan kandidat link dan pastikan punya protocol serta domain valid.
+
+    Mengembalikan link final atau None kalau tidak valid.
+    """
+    # Hapus karakter yang tidak diinginkan di akhir
+    link = link.rstrip(_TRAILING_PUNCTUATION)
+    if not link:
+        return None
+
+    if kind == LINK_KIND_HTTP:
+        # Seragamkan protocol ke huruf kecil (HTTP:// -> http://)
+        scheme_end = link.index('://')
+        link = link[:scheme_end].lower() + link[scheme_end:]
+    else:
+        link = 'https://' + link
+
+    return link if _has_valid_netloc(link) else None
+
+
+def _has_valid_netloc(link):
+    """Pastikan domain valid (netloc harus mengandung titik)"""
+    rest = link[link.index('://') + 3:]
+    for separator in '/?#':
+        cut = rest.find(separator)
+        if cut != -1:
+            rest = rest[:cut]
+    return bool(rest) and '.' in rest
+
+
+# Karakter delimiter (spasi, kutip, <>, ...) dan karakter kontrol di target hyperlink
+_UNSAFE_TARGET_CHARS_RE = re.compile(r'[\x00-\x1f\x7f' + _LINK_DELIMITERS + r']')
+# Di host hanya kurung siku (IPv6) yang boleh
+_UNSAFE_HOST_CHARS_RE = re.compile(r'[\x00-\x1f\x7f\s<>"\'`{}|\\^]')
+
+
+def _percent_encode_match(match):
+    return ''.join(f'%{byte:02X}' for byte in match.group().encode('utf-8'))
+
+
+def _normalize_hyperlink_target(url):
+    """Target hyperlink tanpa scanner regex: cek protocol dan domain, lalu amankan karakternya.
+
+    Delimiter link (spasi, kutip, <>, ...) di path/query/fragment di-percent-encode
+    (misal ' jadi %27) supaya URL tetap satu token yang aman dipakai di mana saja;
+    target dengan karakter seperti itu di host ditolak.
+    """
+    url = url.strip()
+    scheme_end = url.find('://')
+    if scheme_end == -1 or url[:scheme_end].lower() not in ('http', 'https'):
+        return None
+    host_start = scheme_end + 3
+    host_end = len(url)
+    for separator in '/?#':
+        cut = url.find(separator, host_start)
+        if cut != -1:
+            host_end = min(host_end, cut)
+    if _UNSAFE_HOST_CHARS_RE.search(url, host_start, host_end):
+        return None
+    url = (url[:scheme_end].lower() + url[scheme_end:host_end]
+           + _UNSAFE_TARGET_CHARS_RE.sub(_percent_encode_match, url[host_end:]))
+    return url if _has_valid_netloc(url) else None
+
+
+def iter_link_candidates(content):
+    """Scan teks satu kali dan yield (jenis, link) untuk setiap link valid.
+
+    Link di-yield sesuai urutan kemunculan di teks; pengelompokan per jenis
+    dilakukan oleh extract_links.
+    """
+    for match in _LINK_TOKEN_RE.finditer(content):
+        for kind, candidate in _classify_link_token(match.group()):
+            link = _normalize_link_candidate(kind, candidate)
+            if link is not None:
+                yield kind, link
+
+
+def _iter_unit_link_candidates(format_name, member, unit):
+    """Cari link di satu potongan (list TextPart): list (asal, list (jenis, link)).
+
+    asal adalah (format, member, lokasi, origin) yang dipakai bersama oleh
+    semua link di satu TextPart, jadi LinkRecord baru dibuat untuk link yang
+    lolos dedup. Target hyperlink langsung dipakai; hanya teks biasa yang
+    di-scan regex.
+    """
+    found = []
+    for location, origin, text in unit:
+        if origin == ORIGIN_HYPERLINK:
+            url = _normalize_hyperlink_target(text)
+            if url is not None:
+                found.append(((format_name, member, location, ORIGIN_HYPERLINK), [(LINK_KIND_HTTP, url)]))
+            continue
+        candidates = list(iter_link_candidates(text))
+        if candidates:
+            found.append(((format_name, member, location, ORIGIN_TEXT), candidates))
+    return found
+
+
+def _make_link_record(link, source):
+    return LinkRecord._make((link,) + source)
+
+
+def _group_link_records(parts):
+    """Seperti _group_link_candidates, tapi untuk hasil _iter_unit_link_candidates per potongan.
+
+    Mengembalikan list LinkRecord dengan URL unik; asal yang dipakai adalah
+    tempat URL itu pertama kali muncul.
+    """
+    links = ([], [], [])
+    sources = ([], [], [])
+    for part in parts:
+        for source, candidates in part:
+            for kind, link in candidates:
+                links[kind].append(link)
+                sources[kind].append(source)
+
+    ordered_links = links[LINK_KIND_HTTP] + links[LINK_KIND_WWW] + links[LINK_KIND_DOMAIN]
+    ordered_sources = sources[LINK_KIND_HTTP] + sources[LINK_KIND_WWW] + sources[LINK_KIND_DOMAIN]
+    # Dict dibangun dari belakang, jadi tiap link menunjuk ke asal kemunculan pertamanya
+    first_sources = dict(zip(reversed(ordered_links), reversed(ordered_sources)))
+    make_record = LinkRecord._make
+    return [make_record((link,) + first_sources[link]) for link in dict.fromkeys(ordered_links)]
+
+
+def _group_link_candidates(candidates):
+    """Gabungkan (jenis, link) jadi list link unik, dikelompokkan per jenis"""
+    groups = ([], [], [])
+    for kind, link in candidates:
+        groups[kind].append(link)
+
+    # Hapus duplikat
+    return list(dict.fromkeys(groups[LINK_KIND_HTTP] + groups[LINK_KIND_WWW] + groups[LINK_KIND_DOMAIN]))  # Preserves order
+
+
+def extract_links(content):
+    """Cari semua link http/https, www dan domain/path di dalam teks.
+
+    Mengembalikan list link unik. Urutan sama seperti sebelumnya: semua link
+    http/https dulu, lalu link www, lalu link domain/path, masing-masing
+    sesuai urutan kemunculan.
+    """
+    return _group_link_candidates(iter_link_candidates(content))
+
+
+# Ukuran chunk default untuk streaming file teks (byte)
+TXT_CHUNK_SIZE = 4 * 1024 * 1024
+# Sisa token di akhir chunk yang lebih panjang dari ini langsung di-scan
+# (bukan link wajar), supaya memori tetap datar pada file tanpa spasi
+_MAX_CARRY = 64 * 1024
+_CHUNK_DELIMITERS = ' \n\r\t<>"\'`[]{}|\\^'
+
+
+def _split_chunk(text):
+    """Potong text setelah delimiter terakhir: (bagian yang aman di-scan, sisa untuk chunk berikutnya).
+
+    Bagian pertama kosong kalau text belum punya delimiter dan masih pendek.
+    """
+    cut = max(text.rfind(char) for char in _CHUNK_DELIMITERS) + 1
+    if cut == 0 and len(text) <= _MAX_CARRY:
+        return '', text
+    if cut == 0 or len(text) - cut > _MAX_CARRY:
+        cut = len(text)
+    return text[:cut], text[cut:]
+
+
+def iter_text_from_txt(file_path, chunk_size=TXT_CHUNK_SIZE):
+    """Baca file teks per chunk dan yield potongan teks yang aman di-scan terpisah.
+
+    Token terakhir di setiap chunk belum tentu utuh, jadi bagian setelah
+    delimiter terakhir dibawa (overlap) ke chunk berikutnya. Dengan begitu link
+    yang terpotong di batas chunk tetap ditemukan, dan memori yang dipakai
+    hanya sebesar satu chunk berapapun ukuran file.
+    """
+    carry = ''
+    total_bytes = _source_size(file_path)
+    read_bytes = 0
+    # Decode bertahap: karakter UTF-8 yang terpotong di batas chunk disambung di chunk berikutnya
+    decoder = codecs.getincrementaldecoder('utf-8')('ignore')
+    with _open_binary(file_path) as file:
+        while True:
+            data = file.read(chunk_size)
+            if not data:
+                break
+            # Progres dari offset byte file, bukan jumlah karakter hasil decode
+            read_bytes += len(data)
+            _report_progress(read_bytes, total_bytes, 'byte')
+            text, carry = _split_chunk(carry + decoder.decode(data))
+            if text:
+                yield text
+    if carry:
+        yield carry
+
+
+def iter_parts_from_txt(file_path, chunk_size=TXT_CHUNK_SIZE):
+    """Yield list TextPart per chunk file teks (tanpa lokasi)"""
+    for text in iter_text_from_txt(file_path, chunk_size):
+        yield [TextPart('', ORIGIN_TEXT, text)]
+
+
+# ---------------------------------------------------------------------------
+# Registry format file
+# ---------------------------------------------------------------------------
+
+# name: nama format; extensions: ekstensi yang dikenali; extract: fungsi
+# file_path -> teks; sniff: fungsi _FileProbe -> bool (None = hanya dari
+# ekstensi); cost: perkiraan biaya relatif (kecil = cepat), dipakai kalau ada
+# beberapa backend yang cocok; stream: generator file_path -> list TextPart
+# bertahap (per chunk/halaman/sheet/slide) kalau backend bisa streaming;
+# teks tiap TextPart harus aman di-scan terpisah (tidak memotong token di
+# tengah) dan berlaku opsi yang sama dengan extract; requires: modul opsional yang harus
+# terinstall; options: nama opsi ekstraksi yang diteruskan ke extract; label:
+# nama grup untuk filter dialog file; children: generator (file, _ArchiveBudget)
+# -> MemoryFile untuk member arsip / objek embedded yang ikut dipindai
+# (extract None berarti format ini hanya wadah, tanpa teks sendiri).
+FormatSpec = namedtuple('FormatSpec', ['name', 'extensions', 'extract', 'sniff', 'cost',
+                                       'stream', 'requires', 'options', 'label', 'children'])
+
+_FORMATS = []
+
+_ZIP_MAGIC = b'PK\x03\x04'
+_OLE_MAGIC = b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'
+
+
+def register_format(name, extensions, extract, sniff=None, cost=10, stream=None,
+                    requires=None, options=(), label=None, children=None):
+    """Daftarkan backend ekstraksi untuk sebuah format file.
+
+    Format baru cukup memanggil fungsi ini; dialog file, drag & drop dan mode
+    batch otomatis ikut mendukung ekstensinya.
+    """
+    spec = FormatSpec(name, tuple(ext.lower() for ext in extensions), extract, sniff, cost,
+                      stream, requires, tuple(options), label or f"{name.upper()} Files", children)
+    _FORMATS.append(spec)
+    return spec
+
+
+def supported_extensions():
+    """Semua ekstensi yang didukung, sesuai urutan pendaftaran format"""
+    extensions = []
+    for spec in _FORMATS:
+        for ext in spec.extensions:
+            if ext not in extensions:
+                extensions.append(ext)
+    return extensions
+
+
+def supported_formats_text():
+    """Daftar format untuk ditampilkan ke user, misal 'TXT, DOC, DOCX'"""
+    return ', '.join(ext.lstrip('.').upper() for ext in supported_extensions())
+
+
+def file_dialog_filter():
+    """String filter untuk QFileDialog, dikelompokkan per label format"""
+    groups = {}
+    for spec in _FORMATS:
+        if not spec.extensions:
+            continue  # Format yang hanya dikenali dari isinya (misal objek OLE embedded)
+        patterns = groups.setdefault(spec.label, [])
+        patterns.extend(f"*{ext}" for ext in spec.extensions if f"*{ext}" not in patterns)
+    all_patterns = ' '.join(f"*{ext}" for ext in supported_extensions())
+    parts = [f"All Supported ({all_patterns})"]
+    parts.extend(f"{label} ({' '.join(patterns)})" for label, patterns in groups.items())
+    parts.append("All Files (*)")
+    return ';;'.join(parts)
+
+
+class _FileProbe:
+    """Informasi awal file untuk sniffing: header, isi zip, atau stream OLE.
+
+    Isi zip/OLE baru dibaca kalau ada sniffer yang memintanya.
+    """
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        with _open_binary(file_path) as file:
+            self.header = file.read(16)
+        self._zip_names = None
+        self._zip_mimetype = None
+        self._ole_streams = None
+
+    def _load_zip(self):
+        self._zip_names = frozenset()
+        self._zip_mimetype = ''
+        if not self.header.startswith(_ZIP_MAGIC):
+            return
+        try:
+            with zipfile.ZipFile(_file_arg(self.file_path)) as archive:
+                self._zip_names = frozenset(archive.namelist())
+                if 'mimetype' in self._zip_names:
+                    self._zip_mimetype = archive.read('mimetype')[:128].decode('ascii', errors='ignore').strip()
+        except (zipfile.BadZipFile, OSError):
+            pass
+
+    @property
+    def zip_names(self):
+        if self._zip_names is None:
+            self._load_zip()
+        return self._zip_names
+
+    @property
+    def zip_mimetype(self):
+        if self._zip_mimetype is None:
+            self._load_zip()
+        return self._zip_mimetype
+
+    @property
+    def ole_streams(self):
+        if self._ole_streams is None:
+            self._ole_streams = frozenset()
+            olefile = _import_optional('olefile')
+            if olefile is not None and self.header.startswith(_OLE_MAGIC):
+                try:
+                    with olefile.OleFileIO(_file_arg(self.file_path)) as ole:
+                        self._ole_streams = frozenset('/'.join(entry) for entry in ole.listdir())
+                except Exception:
+                    pass
+        return self._ole_streams
+
+
+def _backend_available(spec):
+    return spec.requires is None or _import_optional(spec.requires) is not None
+
+
+def select_format(file_path):
+    """Pilih backend tercepat yang sanggup membaca file.
+
+    Pertama dicek dari isi file (magic bytes, member zip, stream OLE); kalau
+    tidak ada yang cocok, baru dari ekstensi. Dari beberapa kandidat dipilih
+    yang dependensinya terinstall dan cost-nya paling kecil.
+    """
+    probe = _FileProbe(file_path)
+    candidates = []
+    for spec in _FORMATS:
+        if spec.sniff is None:
+            continue
+        try:
+            if spec.sniff(probe):
+                candidates.append(spec)
+        except Exception:
+            continue
+    if not candidates:
+        extension = _source_extension(file_path)
+        candidates = [spec for spec in _FORMATS if extension in spec.extensions]
+    if not candidates:
+        return None
+
+    available = [spec for spec in candidates if _backend_available(spec)]
+    # Kalau tidak ada yang tersedia, tetap kembalikan kandidat supaya pesan error
+    # "library tidak terinstall" dari backend-nya yang muncul
+    return min(available or candidates, key=lambda spec: spec.cost)
+
+
+def _call_format_extract(spec, file_path, **options):
+    kwargs = {name: options[name] for name in spec.options if name in options}
+    return spec.extract(file_path, **kwargs)
+
+
+def _call_format_stream(spec, file_path, **options):
+    kwargs = {name: options[name] for name in spec.options if name in options}
+    return spec.stream(file_path, **kwargs)
+
+
+def _extract_pdf_with_options(file_path, pdf_mode=PDF_MODE_FULL):
+    return extract_text_from_pdf(file_path, mode=pdf_mode)
+
+
+def _iter_pdf_with_options(file_path, pdf_mode=PDF_MODE_FULL):
+    return iter_parts_from_pdf(file_path, mode=pdf_mode)
+
+
+# Batas rekursi arsip / objek embedded, sebagai pelindung dari zip bomb
+ARCHIVE_MAX_DEPTH = 3
+ARCHIVE_MAX_MEMBER_BYTES = 64 * 1024 * 1024
+ARCHIVE_MAX_TOTAL_BYTES = 256 * 1024 * 1024
+ARCHIVE_MAX_MEMBERS = 10000
+
+# Part objek embedded di dalam DOCX/XLSX/PPTX
+_EMBEDDING_PART_RE = re.compile(r'^(word|xl|ppt)/embeddings/[^/]+$')
+_OLE_NATIVE_STREAM = '\x01Ole10Native'
+
+
+class _ArchiveBudget:
+    """Sisa kuota byte dan jumlah member yang boleh dibaca untuk satu file teratas"""
+
+    def __init__(self, source):
+        self.source = source
+        self.bytes_left = ARCHIVE_MAX_TOTAL_BYTES
+        self.members_left = ARCHIVE_MAX_MEMBERS
+
+    def read(self, stream, declared_size, archive, name):
+        """Baca member name dari archive ke memori; None (dengan warning) kalau melebihi batas.
+
+        Ukuran yang tercatat di header arsip bisa palsu, jadi pembacaan juga
+        dihentikan begitu melewati batas.
+        """
+        if self.members_left <= 0:
+            # Cukup sekali: sisa member arsip besar bisa ribuan
+            log = logger.warning if self.members_left == 0 else logger.debug
+            self.members_left -= 1
+            log("Member %s di %s dilewati: batas jumlah member (%d) terlampaui",
+                name, self._archive_label(archive), ARCHIVE_MAX_MEMBERS)
+            return None
+        limit = min(ARCHIVE_MAX_MEMBER_BYTES, self.bytes_left)
+        size = declared_size
+        if size <= limit:
+            data = stream.read(limit + 1)
+            size = len(data)
+        if size > limit:
+            if size > ARCHIVE_MAX_MEMBER_BYTES:
+                reason = f"batas ukuran member ({ARCHIVE_MAX_MEMBER_BYTES} byte)"
+            else:
+                reason = f"sisa kuota total arsip ({self.bytes_left} dari {ARCHIVE_MAX_TOTAL_BYTES} byte)"
+            logger.warning("Member %s di %s dilewati: %s terlampaui",
+                           name, self._archive_label(archive), reason)
+            return None
+        self.members_left -= 1
+        self.bytes_left -= len(data)
+        return data
+
+    def _archive_label(self, archive):
+        # Arsip bertingkat ditulis seperti member di LinkRecord: 'luar.zip!dalam.zip'
+        if isinstance(archive, MemoryFile):
+            return f"{self.source}!{archive.name}"
+        return archive
+
+
+def _iter_zip_children(file_path, budget):
+    """Member zip yang formatnya didukung, dibaca langsung ke memori"""
+    with zipfile.ZipFile(_file_arg(file_path)) as archive:
+        for info in archive.infolist():
+            if info.is_dir() or not is_supported_file(info.filename):
+                continue
+            try:
+                with archive.open(info) as member:
+                    data = budget.read(member, info.file_size, file_path, info.filename)
+            except (RuntimeError, zipfile.BadZipFile, NotImplementedError, OSError):
+                continue  # Member terenkripsi / rusak / metode kompresi tidak didukung
+            if data is not None:
+                yield MemoryFile(info.filename, data)
+
+
+def _iter_tar_children(file_path, budget):
+    """Member tar (.tar, .tar.gz, ...) yang formatnya didukung, dibaca berurutan ke memori"""
+    if isinstance(file_path, MemoryFile):
+        archive = tarfile.open(fileobj=io.BytesIO(file_path.data), mode='r:*')
+    else:
+        archive = tarfile.open(file_path, mode='r:*')
+    with archive:
+        for info in archive:
+            if not info.isfile() or not is_supported_file(info.name):
+                continue
+            member = archive.extractfile(info)
+            data = budget.read(member, info.size, file_path, info.name) if member is not None else None
+            if data is not None:
+                yield MemoryFile(info.name, data)
+
+
+def _iter_office_embedded_children(file_path, budget):
+    """Objek embedded di word/embeddings, xl/embeddings atau ppt/embeddings"""
+    with zipfile.ZipFile(_file_arg(file_path)) as archive:
+        for info in archive.infolist():
+            if not _EMBEDDING_PART_RE.match(info.filename):
+                continue
+            with archive.open(info) as member:
+                data = budget.read(member, info.file_size, file_path, info.filename)
+            if data is not None:
+                yield MemoryFile(info.filename, data)
+
+
+def _parse_ole_native(data):
+    """Ambil (nama file, isi) dari stream \\x01Ole10Native (objek Package OLE)"""
+    try:
+        pos = 6  # ukuran total (4) + flag (2)
+        label_end = data.index(b'\x00', pos)
+        path_end = data.index(b'\x00', label_end + 1)
+        temp_end = data.index(b'\x00', path_end + 1 + 8)
+        size = struct.unpack_from('<I', data, temp_end + 1)[0]
+    except (ValueError, struct.error):
+        return None
+    payload = data[temp_end + 5:temp_end + 5 + size]
+    label = data[pos:label_end].decode('latin-1').replace('\\', '/')
+    return os.path.basename(label) or 'Ole10Native', payload
+
+
+def _iter_ole_package_children(file_path, budget):
+    """File asli yang dibungkus objek Package OLE (oleObjectN.bin)"""
+    olefile = _import_optional('olefile')
+    with olefile.OleFileIO(_file_arg(file_path)) as ole:
+        data = ole.openstream(_OLE_NATIVE_STREAM).read()
+    parsed = _parse_ole_native(data)
+    if parsed is not None:
+        name, payload = parsed
+        data = budget.read(io.BytesIO(payload), len(payload), file_path, name)
+        if data is not None:
+            yield MemoryFile(name, data)
+
+
+def _is_plain_zip(probe):
+    """Zip biasa, bukan paket Office Open XML / OpenDocument"""
+    return (probe.header.startswith(_ZIP_MAGIC)
+            and '[Content_Types].xml' not in probe.zip_names
+            and not probe.zip_mimetype)
+
+
+# Format bawaan. Urutan pendaftaran = urutan di dialog file dan daftar format.
+register_format('txt', ['.txt'], extract_text_from_txt, cost=1,
+                stream=iter_parts_from_txt, label='Text Files')
+register_format('doc', ['.doc'], extract_text_from_doc, cost=4, requires='olefile',
+                stream=iter_parts_from_doc,
+                sniff=lambda probe: 'WordDocument' in probe.ole_streams, label='Word Documents')
+register_format('docx', ['.docx'], extract_text_from_docx, cost=3, stream=iter_parts_from_docx,
+                children=_iter_office_embedded_children,
+                sniff=lambda probe: 'word/document.xml' in probe.zip_names, label='Word Documents')
+register_format('xls', ['.xls'], extract_text_from_xls, cost=5, requires='xlrd',
+                stream=iter_parts_from_xls,
+                sniff=lambda probe: bool({'Workbook', 'Book'} & probe.ole_streams), label='Excel Files')
+register_format('xlsx', ['.xlsx'], extract_text_from_xlsx, cost=4, stream=iter_parts_from_xlsx,
+                children=_iter_office_embedded_children,
+                sniff=lambda probe: 'xl/workbook.xml' in probe.zip_names, label='Excel Files')
+register_format('ppt', ['.ppt'], extract_text_from_ppt, cost=4, requires='olefile',
+                stream=iter_parts_from_ppt,
+                sniff=lambda probe: 'PowerPoint Document' in probe.ole_streams, label='PowerPoint Files')
+register_format('pptx', ['.pptx'], extract_text_from_pptx, cost=6, requires='pptx',
+                stream=iter_parts_from_pptx, children=_iter_office_embedded_children,
+                sniff=lambda probe: 'ppt/presentation.xml' in probe.zip_names, label='PowerPoint Files')
+register_format('pdf', ['.pdf'], _extract_pdf_with_options, cost=8, requires='PyPDF2',
+                stream=_iter_pdf_with_options, options=('pdf_mode',), sniff=lambda probe: probe.header.startswith(b'%PDF-'),
+                label='PDF Files')
+register_format('csv', ['.csv'], extract_text_from_csv, cost=2, stream=iter_parts_from_csv,
+                label='CSV Files')
+register_format('rtf', ['.rtf'], extract_text_from_rtf, cost=3, stream=iter_parts_from_rtf,
+                sniff=lambda probe: probe.header.startswith(b'{\\rtf'), label='RTF Files')
+register_format('odt', ['.odt'], extract_text_from_odt, cost=3, stream=iter_parts_from_odt,
+                sniff=lambda probe: probe.zip_mimetype == 'application/vnd.oasis.opendocument.text',
+                label='OpenDocument Files')
+register_format('ods', ['.ods'], extract_text_from_ods, cost=3, stream=iter_parts_from_ods,
+                sniff=lambda probe: probe.zip_mimetype == 'application/vnd.oasis.opendocument.spreadsheet',
+                label='OpenDocument Files')
+register_format('odp', ['.odp'], extract_text_from_odp, cost=3, stream=iter_parts_from_odp,
+                sniff=lambda probe: probe.zip_mimetype == 'application/vnd.oasis.opendocument.presentation',
+                label='OpenDocument Files')
+register_format('zip', ['.zip'], None, cost=9, sniff=_is_plain_zip,
+                children=_iter_zip_children, label='Archives')
+register_format('tar', ['.tar', '.tgz', '.tar.gz', '.tar.bz2', '.tar.xz'], None, cost=9,
+                children=_iter_tar_children, label='Archives')
+register_format('ole_package', [], None, cost=9, requires='olefile',
+                sniff=lambda probe: _OLE_NATIVE_STREAM in probe.ole_streams,
+                children=_iter_ole_package_children, label='OLE Package')
+
+
+def _iter_source_units(source, pdf_mode=PDF_MODE_FULL, member='', depth=0, budget=None, spec=None):
+    """Yield (format, member, list TextPart) per potongan file, termasuk isi arsip dan objek embedded.
+
+    member kosong untuk file itu sendiri; member bertingkat digabung dengan '!'
+    (misal 'docs/a.docx!word/embeddings/oleObject1.bin!catatan.txt'). Member
+    dibaca ke memori (MemoryFile), tidak pernah ditulis ke disk. Rekursi
+    dibatasi ARCHIVE_MAX_DEPTH dan kuota _ArchiveBudget; member yang rusak
+    dilewati tanpa menggagalkan file induknya.
+    """
+    if spec is None:
+        spec = select_format(source)
+    if spec is None:
+        raise Exception(f"Format file {_source_extension(source)} tidak didukung")
+    if spec.stream is not None:
+        # Backend streaming: file tidak pernah dimuat utuh ke memori
+        for unit in _call_format_stream(spec, source, pdf_mode=pdf_mode):
+            yield spec.name, member, unit
+    elif spec.extract is not None:
+        yield spec.name, member, [TextPart('', ORIGIN_TEXT, _call_format_extract(spec, source, pdf_mode=pdf_mode))]
+
+    if spec.children is None or depth >= ARCHIVE_MAX_DEPTH:
+        return
+    budget = budget or _ArchiveBudget(_source_name(source))
+    try:
+        for child in spec.children(source, budget):
+            child_member = f"{member}!{child.name}" if member else child.name
+            try:
+                yield from _iter_source_units(child, pdf_mode, child_member, depth + 1, budget)
+            except Exception as e:
+                logger.debug("Member %s dilewati: %s", child_member, e)
+    except Exception as e:
+        if spec.extract is None and depth == 0:
+            raise  # Arsip teratas yang rusak = file gagal
+        logger.warning("Gagal membaca member di %s: %s", member or _source_name(source), e)
+
+
+def _iter_file_candidate_parts(file_path, pdf_mode=PDF_MODE_FULL):
+    """Yield hasil _iter_unit_link_candidates per potongan file (chunk/halaman/sheet/slide/member).
+
+    Backend tanpa stream menghasilkan satu potongan berisi seluruh file.
+    """
+    file_extension = _source_extension(file_path)
+    try:
+        for format_name, member, unit in _iter_source_units(file_path, pdf_mode):
+            yield _iter_unit_link_candidates(format_name, member, unit)
+    except Exception as e:
+        raise Exception(f"Gagal membaca file {file_extension}: {str(e)}")
+
+
+def extract_link_records_from_file(file_path, pdf_mode=PDF_MODE_FULL):
+    """Seperti extract_links_from_file, tapi mengembalikan list LinkRecord (link + asalnya)"""
+    return _group_link_records(_iter_file_candidate_parts(file_path, pdf_mode))
+
+
+def extract_links_from_file(file_path, pdf_mode=PDF_MODE_FULL):
+    """Ekstrak teks dari file lalu kembalikan list link unik di dalamnya"""
+    # Tanpa LinkRecord: asal link tidak dibutuhkan, jadi cukup kelompokkan (jenis, link)
+    return _group_link_candidates(candidate for part in _iter_file_candidate_parts(file_path, pdf_mode)
+                                  for _, candidates in part for candidate in candidates)
+
+
+# Batch link dari iter_link_batches dipecah kalau lebih besar dari ini
+LINK_BATCH_SIZE = 2000
+
+
+def iter_link_batches(file_path, pdf_mode=PDF_MODE_FULL, batch_size=LINK_BATCH_SIZE):
+    """Yield list LinkRecord baru (URL belum pernah muncul) segera setelah tiap potongan file selesai.
+
+    Link dari halaman PDF / sheet XLSX pertama sudah keluar sebelum sisa file
+    di-parse. Urutannya urutan kemunculan, bukan dikelompokkan per jenis
+    seperti extract_links_from_file, tapi isinya sama.
+    """
+    seen = set()
+    for part in _iter_file_candidate_parts(file_path, pdf_mode):
+        batch = []
+        for source, candidates in part:
+            for _, link in candidates:
+                if link not in seen:
+                    seen.add(link)
+                    batch.append(_make_link_record(link, source))
+        for start in range(0, len(batch), batch_size):
+            yield batch[start:start + batch_size]
+
+
+# Jarak minimum antar pesan progres dari process ekstraksi ke GUI (detik)
+PROGRESS_REPORT_INTERVAL = 0.1
+
+
+def extract_links_to_queue(file_path, result_queue, pdf_mode=PDF_MODE_FULL):
+    """Target process ekstraksi: kirim progres dan hasil lewat multiprocessing.Queue.
+
+    Pesan yang dikirim: ('progress', done, total, unit) dan ('links', list LinkRecord)
+    selama ekstraksi, lalu diakhiri ('done', None) atau ('error', pesan).
+    """
+    last_report = [0.0]
+
+    def report(done, total, unit):
+        now = time.monotonic()
+        if now - last_report[0] >= PROGRESS_REPORT_INTERVAL or (total and done >= total):
+            last_report[0] = now
+            result_queue.put(('progress', done, total, unit))
+
+    set_progress_callback(report)
+    try:
+        for batch in iter_link_batches(file_path, pdf_mode=pdf_mode):
+            result_queue.put(('links', batch))
+        result_queue.put(('done', None))
+    except Exception as e:
+        result_queue.put(('error', str(e)))
+    finally:
+        set_progress_callback(None)
+
+
+# Process ekstraksi mengecek apakah process induknya masih hidup setiap sekian detik
+_PARENT_CHECK_INTERVAL = 1.0
+
+
+def _extraction_process_main(task_queue, result_queue):
+    """Loop process ExtractionProcess: kerjakan (file_path, pdf_mode, pool) sampai menerima None.
+
+    pool menentukan apakah file itu boleh memakai Pool XLSX/PDF sendiri. Process
+    berhenti sendiri kalau process induknya (misal GUI yang crash) sudah tidak ada.
+    """
+    def stop(signum, frame):
+        # Hasil yang belum terkirim tidak dibaca lagi: jangan tunggu queue kosong saat keluar
+        result_queue.cancel_join_thread()
+        sys.exit(1)
+
+    # terminate() -> SystemExit, jadi Pool XLSX/PDF yang sedang jalan ikut dihentikan
+    signal.signal(signal.SIGTERM, stop)
+    parent = multiprocessing.parent_process()
+    while True:
+        try:
+            task = task_queue.get(timeout=_PARENT_CHECK_INTERVAL)
+        except queue.Empty:
+            if parent is not None and not parent.is_alive():
+                return
+            continue
+        if task is None:
+            return
+        file_path, pdf_mode, use_pools = task
+        set_process_pools_enabled(use_pools)
+        extract_links_to_queue(file_path, result_queue, pdf_mode)
+
+
+def _skip_main_in_spawn():
+    """Buat process spawn berikutnya tidak meng-import ulang script utama (__main__).
+
+    Spec bernama '__main__' membuat multiprocessing melewati import ulang
+    script (seperti saat aplikasi dijalankan dengan python -m paket), jadi
+    process ekstraksi hanya meng-import extractor, bukan main.py dengan
+    PySide6. Cukup dipanggil sekali, dari thread mana pun.
+    """
+    main_module = sys.modules['__main__']
+    spec = getattr(main_module, '__spec__', None)
+    if spec is None or not (spec.name == '__main__' or spec.name.endswith('.__main__')):
+        main_module.__spec__ = importlib.machinery.ModuleSpec('__main__', None)
+
+
+class ExtractionProcess:
+    """Process ekstraksi (spawn) yang hidup lama dan mengerjakan file satu per satu.
+
+    Process baru hanya meng-import extractor (lihat _skip_main_in_spawn).
+    Process ini bukan daemon, jadi boleh membuka Pool XLSX/PDF sendiri untuk
+    file yang dikerjakan sendirian. Hasil dikirim lewat result_queue dengan
+    format pesan extract_links_to_queue. Process yang macet atau dibatalkan
+    dihentikan dengan kill() lalu diganti yang baru.
+    """
+
+    def __init__(self):
+        context = multiprocessing.get_context('spawn')
+        self.task_queue = context.Queue()
+        self.result_queue = context.Queue()
+        self.process = context.Process(target=_extraction_process_main,
+                                       args=(self.task_queue, self.result_queue))
+        self.process.start()
+
+    def submit(self, file_path, pdf_mode=PDF_MODE_FULL, use_pools=False):
+        """Mulai ekstraksi satu file; hasil dibaca lewat get().
+
+        use_pools True hanya kalau file ini dikerjakan sendirian, supaya Pool
+        XLSX/PDF tidak berebut CPU dengan process ekstraksi lain.
+        """
+        self.task_queue.put((file_path, pdf_mode, use_pools))
+
+    def get(self, timeout):
+        """Pesan berikutnya dari process; raise queue.Empty kalau belum ada"""
+        return self.result_queue.get(timeout=timeout)
+
+    def is_alive(self):
+        return self.process.is_alive()
+
+    def close(self):
+        """Minta process berhenti setelah file yang sedang dikerjakan"""
+        if self.process.is_alive():
+            self.task_queue.put(None)
+            self.process.join(1)
+        self.kill()
+
+    def kill(self):
+        """Hentikan process sekarang juga (misal timeout atau dibatalkan)"""
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join(1)
+            if self.process.is_alive():
+                self.process.kill()
+                self.process.join()
+        for process_queue in (self.task_queue, self.result_queue):
+            process_queue.cancel_join_thread()
+            process_queue.close()
+
+
+def _close_idle_processes(idle, lock):
+    """Tutup dan kosongkan list process menganggur milik ExtractionProcessPool"""
+    with lock:
+        processes = idle[:]
+        del idle[:]
+    for process in processes:
+        process.close()
+
+
+class ExtractionProcessPool:
+    """Kumpulan ExtractionProcess yang dipakai ulang antar file (thread-safe).
+
+    Berbeda dengan ProcessPoolExecutor, satu process yang macet bisa dihentikan
+    (discard) tanpa merusak process lain yang sedang bekerja.
+    """
+
+    def __init__(self):
+        self._idle = []
+        self._lock = threading.Lock()
+        _skip_main_in_spawn()
+        # Process ekstraksi bukan daemon: tutup sebelum multiprocessing menunggu
+        # (join) semua process anak saat aplikasi keluar
+        multiprocessing.util.Finalize(self, _close_idle_processes, args=(self._idle, self._lock),
+                                      exitpriority=10)
+
+    def acquire(self):
+        """Ambil process yang menganggur, atau start process baru"""
+        with self._lock:
+            while self._idle:
+                process = self._idle.pop()
+                if process.is_alive():
+                    return process
+                process.kill()
+        return ExtractionProcess()
+
+    def release(self, process):
+        """Kembalikan process yang sudah selesai mengerjakan file-nya"""
+        with self._lock:
+            self._idle.append(process)
+
+    def discard(self, process):
+        """Hentikan process yang macet/dibatalkan; berikutnya diganti process baru"""
+        process.kill()
+
+    def close(self):
+        """Hentikan semua process yang menganggur"""
+        _close_idle_processes(self._idle, self._lock)
+
+
+def is_supported_file(file_path):
+    """Cek apakah ekstensi file didukung"""
+    return _source_extension(file_path) in supported_extensions()
+
+
+def iter_supported_files(paths):
+    """Kumpulkan file yang didukung dari daftar file dan/atau folder (rekursif)"""
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for name in sorted(files):
+                    if is_supported_file(name):
+                        yield os.path.join(root, name)
+        elif is_supported_file(path):
+            yield path
+
+
+def _extract_job(file_path, pdf_mode=PDF_MODE_FULL):
+    """Job untuk worker process: ekstrak link dari satu file beserta waktunya"""
+    start = time.perf_counter()
+    try:
+        links = extract_link_records_from_file(file_path, pdf_mode=pdf_mode)
+        error = None
+    except Exception as e:
+        links = []
+        error = str(e)
+    return file_path, links, time.perf_counter() - start, error
+
+
+def run_extract_batch(paths, jobs=1, pdf_mode=PDF_MODE_FULL):
+    """Ekstrak link dari banyak file, tersebar ke process pool.
+
+    Hasil di-yield per file begitu selesai: (file_path, links, elapsed, error),
+    dengan links berupa list LinkRecord.
+    Urutan hasil mengikuti file yang selesai duluan, bukan urutan input.
+    """
+    files = iter_supported_files(paths)
+    first = next(files, None)
+    second = next(files, None)
+    if jobs <= 1 or second is None:
+        # Dikerjakan di process ini; satu file sendirian (misal PDF 1000 halaman)
+        # tetap bisa memakai Pool XLSX/PDF-nya sendiri
+        for file_path in itertools.chain((first, second), files):
+            if file_path is not None:
+                yield _extract_job(file_path, pdf_mode)
+        return
+
+    # Banyak file: CPU sudah terbagi per file, jadi Pool bertingkat dimatikan di worker
+    job = functools.partial(_extract_job, pdf_mode=pdf_mode)
+    with multiprocessing.Pool(processes=jobs, initializer=set_process_pools_enabled,
+                              initargs=(False,)) as pool:
+        for result in pool.imap_unordered(job, itertools.chain((first, second), files), chunksize=4):
+            yield result
+
+
+# Jeda default antar scan folder pada mode watch (detik)
+WATCH_INTERVAL = 2.0
+
+
+class FolderWatcher:
+    """Deteksi file baru/berubah di folder tanpa mem-parse ulang file lain.
+
+    Tiap file dikenali dari fingerprint (ukuran, mtime_ns) hasil os.stat, jadi
+    scan ulang hanya berisi stat, bukan parsing. File yang fingerprint-nya
+    masih berubah antar scan (misal sedang di-copy) ditunda sampai stabil.
+    """
+
+    def __init__(self, paths):
+        self.paths = list(paths)
+        self.fingerprints = {}
+        self.pending = {}
+
+    def directories(self):
+        """Semua folder (termasuk subfolder) yang dipantau"""
+        directories = []
+        for path in self.paths:
+            if os.path.isdir(path):
+                directories.extend(root for root, _, _ in os.walk(path))
+        return directories
+
+    def _current_fingerprints(self):
+        fingerprints = {}
+        for file_path in iter_supported_files(self.paths):
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                continue  # File dihapus di tengah scan
+            fingerprints[file_path] = (stat.st_size, stat.st_mtime_ns)
+        return fingerprints
+
+    def prime(self):
+        """Scan awal: catat semua file yang sudah ada dan kembalikan daftarnya"""
+        self.fingerprints = self._current_fingerprints()
+        self.pending = {}
+        return list(self.fingerprints)
+
+    def scan(self):
+        """Kembalikan file baru/berubah sejak scan sebelumnya yang sudah stabil"""
+        current = self._current_fingerprints()
+        ready = []
+        pending = {}
+        for file_path, fingerprint in current.items():
+            if self.fingerprints.get(file_path) == fingerprint:
+                continue
+            if self.pending.get(file_path) == fingerprint:
+                self.fingerprints[file_path] = fingerprint
+                ready.append(file_path)
+            else:
+                pending[file_path] = fingerprint
+        for file_path in [path for path in self.fingerprints if path not in current]:
+            del self.fingerprints[file_path]
+        self.pending = pending
+        return ready
+
+
+def _write_batch_results(results, out, rules=None, index=None):
+    """Tulis hasil run_extract_batch sebagai NDJSON; kembalikan jumlah file gagal.
+
+    Link di-dedup per file berdasarkan bentuk kanoniknya menurut rules (None =
+    aturan di config.json), tapi yang ditulis tetap URL aslinya. Kalau index
+    diberikan, dedup berlaku lintas file: link yang sudah pernah ditulis dilewati.
+    """
+    rules = rules or load_rules()
+    failed = 0
+    for file_path, links, elapsed, error in results:
+        elapsed_ms = round(elapsed * 1000, 3)
+        if error is not None:
+            failed += 1
+            out.write(json.dumps({'file': file_path, 'error': error, 'elapsed_ms': elapsed_ms},
+                                 ensure_ascii=False) + '\n')
+            continue
+        file_index = index if index is not None else LinkDedupIndex(rules)
+        for record in links:
+            if not file_index.add(record.url):
+                continue
+            row = {'file': file_path, 'link': record.url, 'format': record.format, 'origin': record.origin}
+            if record.member:
+                row['member'] = record.member
+            if record.location:
+                row['location'] = record.location
+            row['elapsed_ms'] = elapsed_ms
+            out.write(json.dumps(row, ensure_ascii=False) + '\n')
+        out.flush()
+    return failed
+
+
+def run_watch(paths, jobs=1, pdf_mode=PDF_MODE_FULL, interval=WATCH_INTERVAL, out=None, rules=None):
+    """Pantau folder terus-menerus dan tulis link baru sebagai NDJSON.
+
+    Semua file yang sudah ada diekstrak sekali di awal; setelah itu hanya file
+    baru atau yang berubah yang diekstrak ulang. Berhenti dengan Ctrl+C.
+    """
+    out = out or sys.stdout
+    watcher = FolderWatcher(paths)
+    index = LinkDedupIndex(rules or load_rules())
+    failed = 0
+    try:
+        files = watcher.prime()
+        while True:
+            if files:
+                failed += _write_batch_results(run_extract_batch(files, jobs=jobs, pdf_mode=pdf_mode),
+                                               out, index=index)
+            time.sleep(interval)
+            files = watcher.scan()
+    except KeyboardInterrupt:
+        pass
+    return 1 if failed else 0
+
+
+def configure_logging(level=None):
+    """Aktifkan log ke stderr; level diambil dari env LINK_OPENER_LOG (default WARNING).
+
+    Log debug (LINK_OPENER_LOG=DEBUG) dimatikan secara default, jadi loop
+    ekstraksi/buka link tidak melakukan I/O untuk pesan debug.
+    """
+    level = level or os.environ.get('LINK_OPENER_LOG', 'WARNING')
+    if isinstance(level, str):
+        level = logging.getLevelName(level.upper())
+        if not isinstance(level, int):
+            level = logging.WARNING
+    logging.basicConfig(level=level, stream=sys.stderr,
+                        format='%(asctime)s %(levelname)s %(name)s: %(message)s')
+
+
+def run_cli(argv=None):
+    """Entry point mode batch: python main.py extract --jobs N <dir|files...>
+
+    Menulis hasil sebagai NDJSON ke stdout, satu baris per link:
+    {"file": ..., "link": ..., "elapsed_ms": ...}
+    File yang gagal dibaca ditulis sebagai {"file": ..., "error": ...}.
+    Dengan --watch, folder terus dipantau dan hanya link baru yang ditulis.
+    """
+    parser = argparse.ArgumentParser(
+        prog='main.py extract',
+        description='Ekstrak link dari file/folder dokumen tanpa GUI (output NDJSON)')
+    parser.add_argument('paths', nargs='+', help='File atau folder yang akan dipindai')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1,
+                        help='Jumlah worker process (default: jumlah CPU)')
+    parser.add_argument('--pdf-mode', choices=PDF_MODES, default=PDF_MODE_FULL,
+                        help="'annots' hanya membaca link annotation PDF tanpa ekstrak teks (lebih cepat)")
+    parser.add_argument('--no-normalize', action='store_true',
+                        help='Dedup link berdasarkan string persis, tanpa normalisasi URL (lihat url_normalization di config.json)')
+    parser.add_argument('--watch', action='store_true',
+                        help='Pantau folder terus-menerus; hanya file baru/berubah yang diekstrak ulang')
+    parser.add_argument('--interval', type=float, default=WATCH_INTERVAL,
+                        help=f'Jeda antar scan folder pada mode --watch dalam detik (default: {WATCH_INTERVAL})')
+    args = parser.parse_args(argv)
+    configure_logging()
+
+    rules = load_rules()
+    if args.no_normalize:
+        rules = rules._replace(enabled=False)
+    if args.watch:
+        return run_watch(args.paths, jobs=args.jobs, pdf_mode=args.pdf_mode, interval=args.interval,
+                         rules=rules)
+    failed = _write_batch_results(run_extract_batch(args.paths, jobs=args.jobs, pdf_mode=args.pdf_mode),
+                                  sys.stdout, rules=rules)
+    return 1 if failed else 0
@@ -0,0 +1,144 @@
+"""Cache hasil ekstraksi link di disk (SQLite), content-addressed dengan LRU.
+
+Setiap file dikenali dari hash isinya, jadi file yang sama (walaupun di-copy
+atau di-rename) tidak perlu di-parse ulang. Supaya membuka ulang file besar
+tetap instan, path + ukuran + mtime terakhir juga dicatat: kalau keduanya
+tidak berubah, hash tidak perlu dihitung ulang.
+"""
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from collections import namedtuple
+
+# Naikkan kalau hasil engine ekstraksi berubah, supaya cache lama tidak dipakai
+# (versi 3: link disimpan sebagai record [url, format, member, lokasi, asal];
+#  versi 4: target hyperlink dengan spasi/kutip di-percent-encode)
+CACHE_VERSION = 4
+# Batas default total ukuran daftar link yang disimpan (byte)
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+CacheKey = namedtuple('CacheKey', ['path', 'size', 'mtime_ns', 'digest'])
+
+
+def default_cache_path():
+    """Lokasi default file cache: di folder aplikasi, di samping config.json"""
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(base_dir, 'link_cache.db')
+
+
+def hash_file(file_path):
+    """Hitung hash isi file (BLAKE2b) secara streaming"""
+    digest = hashlib.blake2b(digest_size=20)
+    with open(file_path, 'rb') as file:
+        for chunk in iter(lambda: file.read(_HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class LinkCache:
+    """Cache daftar link per file dengan eviction LRU berdasarkan total ukuran"""
+
+    def __init__(self, db_path=None, max_bytes=DEFAULT_MAX_BYTES):
+        self.db_path = db_path or default_cache_path()
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                digest TEXT NOT NULL,
+                links TEXT NOT NULL,
+                size_bytes INTEGER NOT NULL,
+                last_used REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS entries_last_used ON entries(last_used);
+            CREATE TABLE IF NOT EXISTS paths (
+                path TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                digest TEXT NOT NULL
+            );
+        """)
+        self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def file_key(self, file_path):
+        """Buat CacheKey untuk file: hash isi hanya dihitung kalau ukuran/mtime berubah"""
+        path = os.path.abspath(file_path)
+        stat = os.stat(path)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT digest FROM paths WHERE path = ? AND size = ? AND mtime_ns = ?",
+                (path, stat.st_size, stat.st_mtime_ns)).fetchone()
+        digest = row[0] if row else hash_file(path)
+        return CacheKey(path, stat.st_size, stat.st_mtime_ns, digest)
+
+    def _entry_key(self, key, variant):
+        return f"{CACHE_VERSION}:{key.digest}:{key.size}:{variant}"
+
+    def get(self, key, variant=''):
+        """Ambil list link untuk CacheKey, atau None kalau belum ada di cache.
+
+        variant membedakan hasil untuk opsi ekstraksi yang berbeda (misal mode PDF).
+        """
+        entry_key = self._entry_key(key, variant)
+        with self._lock:
+            row = self._conn.execute("SELECT links FROM entries WHERE key = ?", (entry_key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._conn.execute("UPDATE entries SET last_used = ? WHERE key = ?", (time.time(), entry_key))
+            self._remember_path(key)
+            self._conn.commit()
+        return json.loads(row[0])
+
+    def put(self, key, links, variant=''):
+        """Simpan list link untuk CacheKey lalu evict entry lama kalau melebihi batas"""
+        payload = json.dumps(links, ensure_ascii=False)
+        size_bytes = len(payload.encode('utf-8'))
+        if size_bytes > self.max_bytes:
+            return
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, digest, links, size_bytes, last_used) VALUES (?, ?, ?, ?, ?)",
+                (self._entry_key(key, variant), key.digest, payload, size_bytes, time.time()))
+            self._remember_path(key)
+            self._evict()
+            self._conn.commit()
+
+    def _remember_path(self, key):
+        self._conn.execute(
+            "INSERT OR REPLACE INTO paths (path, size, mtime_ns, digest) VALUES (?, ?, ?, ?)",
+            (key.path, key.size, key.mtime_ns, key.digest))
+
+    def _evict(self):
+        """Hapus entry yang paling lama tidak dipakai sampai total ukuran di bawah batas"""
+        total = self._conn.execute("SELECT COALESCE(SUM(size_bytes), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute("SELECT key, size_bytes FROM entries ORDER BY last_used").fetchall()
+        for entry_key, size_bytes in rows:
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (entry_key,))
+            total -= size_bytes
+        # Path yang hash-nya sudah tidak punya entry juga tidak perlu diingat
+        self._conn.execute("DELETE FROM paths WHERE digest NOT IN (SELECT digest FROM entries)")
+
+    def stats(self):
+        """Statistik cache: hit, miss, jumlah entry dan total ukuran"""
+        with self._lock:
+            count, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM entries").fetchone()
+        return {'hits': self.hits, 'misses': self.misses, 'entries': count, 'bytes': total}
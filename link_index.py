@@ -0,0 +1,164 @@
+"""Index pencarian untuk daftar link yang sangat panjang (filter per ketikan).
+
+Filter teks tidak memanggil fungsi Python per baris: pencocokan dilakukan
+lewat map/compress (jalan di C) atas teks link huruf kecil, dan kalau query
+hanya memperpanjang query sebelumnya, yang dicek ulang cuma hasil sebelumnya.
+Filter domain memakai index host -> baris, jadi tidak perlu scan teks sama sekali.
+
+Sintaks query (semua bagian harus cocok):
+
+    github repo          link yang memuat "github" dan "repo" (tanpa beda huruf besar)
+    domain:example.com   host example.com atau subdomain-nya; beberapa domain: = salah satu
+    /docs?/              regular expression (seluruh query di antara dua garis miring)
+"""
+import re
+import sys
+import operator
+from array import array
+from itertools import compress, repeat
+from collections import namedtuple
+
+LinkQuery = namedtuple('LinkQuery', ['terms', 'domains', 'regex'])
+
+_HOST_RE = re.compile(r'[a-z][a-z0-9+.-]*://(?:[^@/?#]*@)?(\[[^\]/?#]*\]|[^:/?#]*)', re.IGNORECASE)
+_DOMAIN_KEYS = ('domain', 'site')
+# Sampai sekian host, baris per host digabung; lebih dari itu baris di-scan per id host
+_MERGE_MAX_HOSTS = 16
+
+
+def parse_query(text):
+    """Ubah teks filter jadi LinkQuery, atau None kalau kosong.
+
+    Raise re.error kalau regex tidak valid.
+    """
+    text = text.strip()
+    if not text:
+        return None
+    if len(text) > 2 and text.startswith('/') and text.endswith('/'):
+        return LinkQuery((), (), re.compile(text[1:-1], re.IGNORECASE))
+    terms = []
+    domains = []
+    for word in text.lower().split():
+        key, sep, value = word.partition(':')
+        if sep and key in _DOMAIN_KEYS:
+            if value.strip('.'):
+                domains.append(value.strip('.'))
+        else:
+            terms.append(word)
+    if not terms and not domains:
+        return None
+    return LinkQuery(tuple(terms), tuple(domains), None)
+
+
+def _refines(query, previous):
+    """True kalau semua hasil query pasti ada di hasil previous (query hanya lebih sempit)"""
+    if query.regex is not None or previous.regex is not None or query.domains != previous.domains:
+        return False
+    if len(query.terms) < len(previous.terms):
+        return False
+    return all(old in new for old, new in zip(previous.terms, query.terms))
+
+
+class LinkSearchIndex:
+    """Index baris link: teks huruf kecil untuk filter teks dan host -> baris untuk filter domain.
+
+    Host disimpan sekali saja (di-intern) dan tiap baris hanya menyimpan id
+    host-nya di array 'I', jadi index tetap hemat untuk ratusan ribu link.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def __len__(self):
+        return len(self._texts)
+
+    def clear(self):
+        # Link yang sudah huruf kecil disimpan sebagai objek yang sama (tidak dobel memori)
+        self._texts = []
+        self.hosts = []  # host unik, index = id host
+        self._host_ids = {}
+        self.row_hosts = array('I')  # id host per baris
+        self.host_rows = []  # per id host: array 'I' nomor baris (urut naik)
+        self._last_query = None
+        self._last_rows = None
+        self._last_count = 0
+
+    def add(self, links):
+        """Tambahkan link sebagai baris berikutnya (urutan sama dengan model tabel)"""
+        row = len(self._texts)
+        for link in links:
+            text = link.lower()
+            self._texts.append(link if text == link else text)
+            match = _HOST_RE.match(text)
+            host = match.group(1) if match else ''
+            host_id = self._host_ids.get(host)
+            if host_id is None:
+                host_id = self._host_ids[host] = len(self.hosts)
+                self.hosts.append(sys.intern(host))
+                self.host_rows.append(array('I'))
+            self.row_hosts.append(host_id)
+            self.host_rows[host_id].append(row)
+            row += 1
+
+    def host_ids_for_domain(self, domain):
+        """Id host yang sama dengan domain atau subdomain-nya"""
+        suffix = '.' + domain
+        return [host_id for host_id, host in enumerate(self.hosts)
+                if host == domain or host.endswith(suffix)]
+
+    def rows_for_domains(self, domains):
+        """Nomor baris (urut naik) dengan host di salah satu domain"""
+        host_ids = {host_id for domain in domains for host_id in self.host_ids_for_domain(domain)}
+        if len(host_ids) <= _MERGE_MAX_HOSTS:
+            # Gabungan beberapa list yang sudah urut: timsort mengenali run-nya
+            rows = array('I')
+            for host_id in host_ids:
+                rows.extend(self.host_rows[host_id])
+            return array('I', sorted(rows)) if len(host_ids) > 1 else rows
+        # Banyak host (misal domain:co.id): satu scan id host per baris lebih murah
+        return array('I', compress(range(len(self.row_hosts)), map(host_ids.__contains__, self.row_hosts)))
+
+    def filter_rows(self, rows, query):
+        """Saring rows (iterable nomor baris urut naik, None = semua baris) dengan query"""
+        texts = self._texts
+        if rows is not None and not isinstance(rows, (array, range)):
+            rows = array('I', rows)
+        if query.domains:
+            if rows is None:
+                rows = self.rows_for_domains(query.domains)
+            else:
+                host_ids = {host_id for domain in query.domains
+                            for host_id in self.host_ids_for_domain(domain)}
+                rows = array('I', compress(rows, map(host_ids.__contains__,
+                                                     map(self.row_hosts.__getitem__, rows))))
+        if query.regex is not None:
+            if rows is None:
+                rows = array('I', compress(range(len(texts)), map(query.regex.search, texts)))
+            else:
+                rows = array('I', compress(rows, map(query.regex.search, map(texts.__getitem__, rows))))
+        # Term terpanjang biasanya paling selektif, jadi dicek lebih dulu
+        for term in sorted(query.terms, key=len, reverse=True):
+            if rows is None:
+                rows = array('I', compress(range(len(texts)), map(operator.contains, texts, repeat(term))))
+            else:
+                rows = array('I', compress(rows, map(operator.contains, map(texts.__getitem__, rows),
+                                                     repeat(term))))
+        return array('I', range(len(texts))) if rows is None else rows
+
+    def search(self, query):
+        """Nomor baris (array 'I', urut naik) yang cocok dengan query.
+
+        Kalau query hanya mempersempit query sebelumnya (misal user mengetik
+        satu huruf lagi), yang dicek hanya hasil sebelumnya plus baris baru.
+        """
+        count = len(self._texts)
+        previous = self._last_query
+        if previous is not None and _refines(query, previous):
+            candidates = array('I', self._last_rows)
+            candidates.extend(range(self._last_count, count))
+            rows = self.filter_rows(candidates, query)
+        else:
+            rows = self.filter_rows(None, query)
+        self._last_query, self._last_rows, self._last_count = query, rows, count
+        # Salinan: pemanggil boleh menambah baris ke hasilnya tanpa merusak cache refine
+        return array('I', rows)
@@ -0,0 +1,182 @@
+"""Normalisasi URL ke bentuk kanonik dan index dedup berbasis hash.
+
+Link yang sebenarnya sama (beda huruf besar di host, port default, slash di
+akhir, fragment #..., parameter tracking utm_*, host unicode vs punycode,
+percent-encoding) dianggap satu link, jadi tidak dibuka sebagai tab terpisah.
+Bentuk kanonik hanya dipakai sebagai key dedup: link yang ditampilkan,
+dibuka dan diekspor tetap URL aslinya (termasuk #anchor-nya).
+
+Aturan bisa diubah lewat config.json, misalnya:
+
+    "url_normalization": {
+        "strip_trailing_slash": false,
+        "tracking_params": ["utm_*", "fbclid", "gclid", "ref"]
+    }
+"""
+import os
+import re
+import json
+import hashlib
+import fnmatch
+import functools
+from collections import namedtuple
+from urllib.parse import urlsplit, urlunsplit, quote
+
+NormalizationRules = namedtuple('NormalizationRules', [
+    'enabled',                    # False = link dipakai apa adanya (dedup string persis)
+    'lowercase_host',             # Example.COM -> example.com
+    'strip_default_port',         # :80 untuk http, :443 untuk https
+    'strip_fragment',             # buang #bagian
+    'strip_trailing_slash',       # /a/ -> /a (path kosong jadi /)
+    'strip_tracking_params',      # buang parameter query yang cocok dengan tracking_params
+    'tracking_params',            # nama parameter, boleh pakai wildcard (utm_*)
+    'idna',                       # host unicode -> punycode (xn--...)
+    'normalize_percent_encoding', # %7e -> ~, %2f -> %2F, spasi/unicode -> %XX
+])
+
+DEFAULT_TRACKING_PARAMS = (
+    'utm_*', 'fbclid', 'gclid', 'dclid', 'gbraid', 'wbraid', 'msclkid', 'yclid',
+    'mc_cid', 'mc_eid', 'igshid', '_ga', '_gl', 'mkt_tok', 'ref_src',
+)
+
+DEFAULT_RULES = NormalizationRules(
+    enabled=True,
+    lowercase_host=True,
+    strip_default_port=True,
+    strip_fragment=True,
+    strip_trailing_slash=True,
+    strip_tracking_params=True,
+    tracking_params=DEFAULT_TRACKING_PARAMS,
+    idna=True,
+    normalize_percent_encoding=True,
+)
+
+_DEFAULT_PORTS = {'http': '80', 'https': '443'}
+_UNRESERVED = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-._~')
+_PERCENT_RE = re.compile(r'%([0-9A-Fa-f]{2})')
+_PATH_SAFE = "/:@!$&'()*+,;=%"
+_QUERY_SAFE = "/?:@!$&'()*+,;=%"
+
+
+def default_config_path():
+    """Lokasi config.json aplikasi (di folder yang sama dengan modul ini)"""
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), 'config.json')
+
+
+def load_rules(config_path=None):
+    """Baca aturan normalisasi dari config.json (key 'url_normalization').
+
+    Key yang tidak ada memakai nilai default; file yang tidak ada atau rusak
+    berarti semua aturan default.
+    """
+    config_path = config_path or default_config_path()
+    try:
+        with open(config_path, 'r', encoding='utf-8') as file:
+            overrides = json.load(file).get('url_normalization') or {}
+    except (OSError, ValueError, AttributeError):
+        return DEFAULT_RULES
+    values = {name: overrides[name] for name in NormalizationRules._fields if name in overrides}
+    if 'tracking_params' in values:
+        values['tracking_params'] = tuple(values['tracking_params'])
+    return DEFAULT_RULES._replace(**values)
+
+
+@functools.lru_cache(maxsize=16)
+def _tracking_param_re(patterns):
+    """Gabungkan pola nama parameter tracking jadi satu regex (case-insensitive)"""
+    if not patterns:
+        return None
+    return re.compile('|'.join(fnmatch.translate(pattern.lower()) for pattern in patterns))
+
+
+def _normalize_percent(component, safe):
+    """Decode %XX untuk karakter unreserved, hex lain jadi huruf besar, lalu quote sisanya"""
+    def fix(match):
+        char = chr(int(match.group(1), 16))
+        return char if char in _UNRESERVED else '%' + match.group(1).upper()
+    return quote(_PERCENT_RE.sub(fix, component), safe=safe)
+
+
+def _split_host_port(hostport):
+    if hostport.startswith('['):
+        # Alamat IPv6: [::1]:8080
+        end = hostport.find(']')
+        if end != -1:
+            rest = hostport[end + 1:]
+            return hostport[:end + 1], rest[1:] if rest.startswith(':') else ''
+        return hostport, ''
+    host, _, port = hostport.partition(':')
+    return host, port
+
+
+def canonicalize_url(url, rules=DEFAULT_RULES):
+    """Ubah URL ke bentuk kanonik sesuai rules. URL yang tidak bisa di-parse dikembalikan apa adanya."""
+    if not rules.enabled:
+        return url
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url
+    scheme = parts.scheme.lower()
+
+    userinfo, at, hostport = parts.netloc.rpartition('@')
+    host, port = _split_host_port(hostport)
+    if rules.lowercase_host:
+        host = host.lower()
+    if rules.idna and not host.isascii():
+        try:
+            host = host.encode('idna').decode('ascii')
+        except UnicodeError:
+            pass
+    if rules.strip_default_port and port == _DEFAULT_PORTS.get(scheme):
+        port = ''
+    netloc = f"{userinfo}{at}{host}{':' + port if port else ''}"
+
+    path = parts.path
+    query = parts.query
+    if rules.normalize_percent_encoding:
+        path = _normalize_percent(path, _PATH_SAFE)
+        query = _normalize_percent(query, _QUERY_SAFE)
+    if rules.strip_trailing_slash:
+        path = path.rstrip('/') or '/'
+    if rules.strip_tracking_params and query:
+        tracking_re = _tracking_param_re(tuple(rules.tracking_params))
+        if tracking_re is not None:
+            query = '&'.join(param for param in query.split('&')
+                             if param and not tracking_re.match(param.partition('=')[0].lower()))
+    fragment = '' if rules.strip_fragment else parts.fragment
+
+    return urlunsplit((scheme, netloc, path, query, fragment))
+
+
+def url_hash(url):
+    """Hash 64-bit (BLAKE2b) dari URL, dipakai sebagai key index dedup"""
+    return int.from_bytes(hashlib.blake2b(url.encode('utf-8', 'surrogatepass'), digest_size=8).digest(),
+                          'little')
+
+
+class LinkDedupIndex:
+    """Index dedup link lintas file berdasarkan hash 64-bit dari URL kanonik.
+
+    Yang disimpan hanya hash (integer), bukan string URL, jadi tetap hemat
+    memori untuk jutaan link. Peluang tabrakan hash 64-bit pada jutaan URL
+    praktis nol.
+    """
+
+    def __init__(self, rules=DEFAULT_RULES):
+        self.rules = rules
+        self._hashes = set()
+
+    def __len__(self):
+        return len(self._hashes)
+
+    def clear(self):
+        self._hashes.clear()
+
+    def add(self, url):
+        """Tambahkan link; True kalau baru, False kalau bentuk kanoniknya sudah pernah ditambahkan"""
+        key = url_hash(canonicalize_url(url, self.rules))
+        if key in self._hashes:
+            return False
+        self._hashes.add(key)
+        return True
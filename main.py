@@ -1,82 +1,49 @@
 import sys
+
+if __name__ == "__main__" and len(sys.argv) > 1 and sys.argv[1] == 'extract':
+    # Mode batch tanpa GUI: jangan import PySide6/Selenium sama sekali
+    from extractor import run_cli
+    sys.exit(run_cli(sys.argv[2:]))
+
 import re
 import ctypes
 import os
 import json
 import shutil
+import time
+import queue
+import logging
+import operator
 import zipfile
-import requests
+import threading
+import multiprocessing
+from array import array
+from bisect import bisect_left
+from itertools import compress
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from pathlib import Path
 from PySide6.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, 
                                QHBoxLayout, QWidget, QPushButton, 
                                QProgressBar, QLabel, QFileDialog, 
-                               QMessageBox, QTextEdit, QFrame, QTableWidget, 
-                               QTableWidgetItem, QHeaderView, QMenu)
-from PySide6.QtCore import QThread, Signal, Qt, QUrl, QMimeData
+                               QMessageBox, QTextEdit, QFrame, QTableView, 
+                               QAbstractItemView, QHeaderView, QMenu, QLineEdit, QComboBox,
+                               QTreeView)
+from PySide6.QtCore import (QThread, Signal, Qt, QUrl, QMimeData, QTimer, QFileSystemWatcher,
+                            QAbstractTableModel, QAbstractItemModel, QAbstractProxyModel, QModelIndex)
 from PySide6.QtGui import QFont, QDragEnterEvent, QDropEvent, QIcon, QColor, QAction, QClipboard
 import qtawesome as qta
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-
-# Libraries untuk membaca berbagai format file
-try:
-    from docx import Document  # untuk .docx
-except ImportError:
-    Document = None
-
-try:
-    import openpyxl  # untuk .xlsx
-except ImportError:
-    openpyxl = None
-
-try:
-    from pptx import Presentation  # untuk .pptx
-except ImportError:
-    Presentation = None
-
-try:
-    import PyPDF2  # untuk .pdf
-except ImportError:
-    PyPDF2 = None
-
-try:
-    import xlrd  # untuk .xls
-except ImportError:
-    xlrd = None
-
-try:
-    import olefile  # untuk .doc dan .ppt
-    import struct
-except ImportError:
-    olefile = None
-    struct = None
-
-try:
-    import pandas as pd  # untuk .csv
-except ImportError:
-    pd = None
-
-try:
-    from odf.opendocument import load as odf_load  # untuk .odt, .ods, .odp
-    from odf.text import P as OdfP
-    from odf.table import Table as OdfTable, TableRow as OdfTableRow, TableCell as OdfTableCell
-    from odf.draw import Page as OdfPage, Frame as OdfFrame
-    from odf import teletype
-except ImportError:
-    odf_load = None
-    OdfP = None
-    OdfTable = None
-    OdfTableRow = None
-    OdfTableCell = None
-    OdfPage = None
-    OdfFrame = None
-    teletype = None
-
-try:
-    from striprtf.striprtf import rtf_to_text  # untuk .rtf
-except ImportError:
-    rtf_to_text = None
+# Selenium dan requests baru di-import saat pertama kali membuka Chrome /
+# update ChromeDriver, supaya jendela aplikasi muncul secepat mungkin.
+
+from extractor import (is_supported_file, iter_supported_files,
+                       supported_formats_text, file_dialog_filter, set_process_pools_enabled,
+                       ExtractionProcessPool, FolderWatcher, LinkRecord, LINK_BATCH_SIZE,
+                       configure_logging)
+from link_cache import LinkCache
+from link_normalizer import LinkDedupIndex, load_rules
+from link_index import LinkSearchIndex, parse_query
+
+logger = logging.getLogger('link_opener')
 
 
 def get_chromedriver_win64_link():
@@ -84,6 +51,8 @@ def get_chromedriver_win64_link():
 
     Returns the URL string or None if not found.
     """
+    import requests
+
     PAGE_URL = 'https://googlechromelabs.github.io/chrome-for-testing/'
     resp = requests.get(PAGE_URL, timeout=10)
     resp.raise_for_status()
@@ -119,6 +88,8 @@ def get_chromedriver_win64_link():
 
 def download_chromedriver():
     """Download and update ChromeDriver automatically"""
+    import requests
+
     # Get the base directory (where main.py is located)
     BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
@@ -291,20 +262,104 @@ def init_chromedriver():
             raise Exception(f"ChromeDriver not available and update failed: {e}")
 
 
+# Batas waktu ekstraksi satu file (detik) sebelum dianggap gagal
+EXTRACTION_TIMEOUT_SECONDS = 300
+# Jumlah file yang diekstrak bersamaan saat drop banyak file/folder
+EXTRACTION_JOBS = min(4, os.cpu_count() or 1)
+# Jeda setelah perubahan terakhir di folder yang dipantau sebelum scan ulang (ms)
+WATCH_DEBOUNCE_MS = 1000
+# Interval update tabel/progress dari LinkOpenerWorker (ms, ~30 kali per detik)
+OPENER_UPDATE_INTERVAL_MS = 33
+# Interval update tree per domain saat link masih masuk (ms)
+DOMAIN_UPDATE_INTERVAL_MS = 100
+
+
+def create_chrome_driver(chromedriver_path):
+    """Buat Chrome driver incognito (Selenium di-import di sini, bukan saat startup)"""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.chrome.options import Options
+
+    # Chrome options untuk incognito mode
+    chrome_options = Options()
+    chrome_options.add_argument("--incognito")
+    chrome_options.add_argument("--disable-web-security")
+    chrome_options.add_argument("--disable-features=VizDisplayCompositor")
+    
+    # Hilangkan pesan "Chrome is being controlled by automated test software"
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+    
+    # Setup service dan driver
+    service = Service(str(chromedriver_path))
+    driver = webdriver.Chrome(service=service, options=chrome_options)
+    
+    # Hilangkan deteksi webdriver dengan execute script
+    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    return driver
+
+
+def _add_row_to_ranges(ranges, row):
+    """Catat row ke list range [start, stop]; row yang berurutan digabung jadi satu range"""
+    if ranges and ranges[-1][1] == row:
+        ranges[-1][1] = row + 1
+    else:
+        ranges.append([row, row + 1])
+
+
 class LinkOpenerWorker(QThread):
-    """Worker thread untuk membuka link agar GUI tidak freeze"""
-    progress_updated = Signal(int)
-    status_updated = Signal(str)
+    """Worker thread untuk membuka link agar GUI tidak freeze.
+
+    Perubahan status tidak dikirim per link lewat signal, tapi dikumpulkan
+    (range baris, tab baru, progress, teks status) dan diambil GUI secara
+    berkala lewat take_updates(), jadi ribuan link tidak membanjiri event loop.
+    """
     finished = Signal()
-    chrome_tab_opened = Signal(str)  # Signal untuk melaporkan tab handle yang dibuka
-    link_processing = Signal(int)  # Signal untuk melaporkan index link yang sedang diproses
-    link_opened = Signal(int)  # Signal untuk melaporkan index link yang berhasil dibuka
     
-    def __init__(self, links):
+    def __init__(self, links, rows=None):
         super().__init__()
         self.links = links
+        # Nomor baris tabel untuk tiap link (bisa hanya sebagian baris kalau tabel difilter)
+        self.rows = range(len(links)) if rows is None else rows
         self.driver = None
-        self.opened_tabs = []  # Track tab handles yang dibuka
+        self.opened_tabs = []  # Track tab handle yang dibuka
+        self._updates_lock = threading.Lock()
+        self._reset_updates()
+    
+    def _reset_updates(self):
+        self._processing_ranges = []  # range baris yang mulai diproses (kuning)
+        self._opened_ranges = []  # range baris yang berhasil dibuka (hijau)
+        self._failed_ranges = []  # range baris yang gagal dibuka (merah)
+        self._new_tabs = []  # tab handle baru sejak update terakhir
+        self._progress = None
+        self._status = None
+    
+    def take_updates(self):
+        """Ambil semua perubahan sejak panggilan terakhir, atau None kalau tidak ada.
+
+        Hasilnya dict: processing/opened/failed (list range [start, stop]), tabs,
+        progress (persen atau None) dan status (teks terakhir atau None).
+        """
+        with self._updates_lock:
+            if (not self._processing_ranges and not self._opened_ranges and not self._failed_ranges
+                    and not self._new_tabs and self._progress is None and self._status is None):
+                return None
+            updates = {
+                'processing': self._processing_ranges,
+                'opened': self._opened_ranges,
+                'failed': self._failed_ranges,
+                'tabs': self._new_tabs,
+                'progress': self._progress,
+                'status': self._status,
+            }
+            self._reset_updates()
+        return updates
+    
+    def _set_status(self, text):
+        with self._updates_lock:
+            self._status = text
+    
     def run(self):
         total_links = len(self.links)
         
@@ -313,45 +368,44 @@ class LinkOpenerWorker(QThread):
             self.setup_chrome_driver()
             for i, link in enumerate(self.links):
                 try:                
-                    # Emit signal bahwa link ini sedang diproses
-                    self.link_processing.emit(i)
-                    self.status_updated.emit(f"Membuka: {link}")
+                    # Tandai link ini sedang diproses
+                    with self._updates_lock:
+                        _add_row_to_ranges(self._processing_ranges, self.rows[i])
+                        self._status = f"Membuka: {link}"
                     
                     # Buka link di tab baru tanpa tunggu loading
                     if i == 0:
                         # Tab pertama langsung di window utama - langsung navigate tanpa tunggu
-                        self.driver.execute_script(f"window.location.href = '{link}';")
+                        self.driver.execute_script("window.location.href = arguments[0];", link)
                         tab_handle = self.driver.current_window_handle
                     else:
                         # Tab berikutnya buka di window/tab baru dan langsung navigate
-                        self.driver.execute_script(f"window.open('{link}');")
+                        self.driver.execute_script("window.open(arguments[0]);", link)
                         # Get handle tab yang baru dibuka
                         tab_handle = self.driver.window_handles[-1]
                     
-                    # Track tab handle
+                    # Track tab handle, tandai link berhasil dibuka dan update progress
                     self.opened_tabs.append(tab_handle)
-                    self.chrome_tab_opened.emit(tab_handle)
-                    print(f"DEBUG: Worker - Opened tab: {tab_handle} for {link}")
-                    
-                    # Emit signal bahwa link berhasil dibuka
-                    self.link_opened.emit(i)
-                    
-                    # Update progress
-                    progress = int((i + 1) / total_links * 100)
-                    self.progress_updated.emit(progress)
+                    with self._updates_lock:
+                        self._new_tabs.append(tab_handle)
+                        _add_row_to_ranges(self._opened_ranges, self.rows[i])
+                        self._progress = int((i + 1) / total_links * 100)
+                    logger.debug("Worker - Opened tab: %s for %s", tab_handle, link)
                     
                     # Delay singkat untuk stabilitas (tidak tunggu loading)
                     self.msleep(200)  # Lebih cepat, cuma 200ms
                     
                 except Exception as e:
-                    self.status_updated.emit(f"Error membuka {link}: {str(e)}")
-                    print(f"DEBUG: Worker - Error opening {link}: {e}")
+                    with self._updates_lock:
+                        _add_row_to_ranges(self._failed_ranges, self.rows[i])
+                        self._status = f"Error membuka {link}: {str(e)}"
+                    logger.warning("Worker - Error opening %s: %s", link, e)
         
         except Exception as e:
-            self.status_updated.emit(f"Error setup Chrome driver: {str(e)}")
-            print(f"DEBUG: Worker - Driver setup error: {e}")
+            self._set_status(f"Error setup Chrome driver: {str(e)}")
+            logger.warning("Worker - Driver setup error: %s", e)
         
-        self.status_updated.emit("Selesai membuka semua link!")
+        self._set_status("Selesai membuka semua link!")
         self.finished.emit()
     
     def setup_chrome_driver(self):
@@ -360,29 +414,13 @@ class LinkOpenerWorker(QThread):
             # Use the updated chromedriver path from init
             chromedriver_path = init_chromedriver()
             
-            # Chrome options untuk incognito mode
-            chrome_options = Options()
-            chrome_options.add_argument("--incognito")
-            chrome_options.add_argument("--disable-web-security")
-            chrome_options.add_argument("--disable-features=VizDisplayCompositor")
-            
-            # Hilangkan pesan "Chrome is being controlled by automated test software"
-            chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-            chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            chrome_options.add_experimental_option('useAutomationExtension', False)
+            # Buat driver instance (incognito)
+            self.driver = create_chrome_driver(chromedriver_path)
             
-            # Setup service
-            service = Service(str(chromedriver_path))
-              # Buat driver instance
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            
-            # Hilangkan deteksi webdriver dengan execute script
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            
-            print("DEBUG: Worker - Chrome driver setup successful")
+            logger.debug("Worker - Chrome driver setup successful")
             
         except Exception as e:
-            print(f"DEBUG: Worker - Chrome driver setup failed: {e}")
+            logger.warning("Worker - Chrome driver setup failed: %s", e)
             raise e
     
     def cleanup_driver(self):
@@ -391,19 +429,654 @@ class LinkOpenerWorker(QThread):
             if self.driver:
                 self.driver.quit()
                 self.driver = None
-                print("DEBUG: Worker - Chrome driver cleaned up")
+                logger.debug("Worker - Chrome driver cleaned up")
         except Exception as e:
-            print(f"DEBUG: Worker - Error cleaning up driver: {e}")
+            logger.warning("Worker - Error cleaning up driver: %s", e)
+
+
+class ExtractionWorker(QThread):
+    """Worker thread untuk ekstraksi link dari file/folder agar GUI tidak freeze.
+
+    File dikerjakan paralel oleh pool berukuran tetap; folder baru di-scan
+    saat ada slot kosong, jadi ribuan file tidak pernah antre sekaligus.
+    Setiap file, kecil maupun besar, di-parse di process ekstraksi
+    (ExtractionProcessPool) yang dipakai ulang antar file, sehingga tombol
+    Batal dan timeout bisa langsung menghentikannya walaupun parser sedang
+    sibuk (misal zip bomb kecil atau PDF dengan ratusan halaman).
+    """
+    progress_updated = Signal(int, int, str)  # progres per file: done, total (0 = tidak diketahui), satuan
+    links_found = Signal(str, list)  # file_path, batch LinkRecord baru (link + asalnya)
+    file_extracted = Signal(str, bool)  # file_path, dari cache
+    file_failed = Signal(str, str)  # file_path, pesan error
+    batch_progress = Signal(int, int, float)  # file selesai, total file (0 = folder masih di-scan), MB selesai
+    extraction_finished = Signal(bool)  # True kalau dibatalkan
+
+    def __init__(self, paths, process_pool, link_cache=None, jobs=EXTRACTION_JOBS,
+                 timeout=EXTRACTION_TIMEOUT_SECONDS):
+        super().__init__()
+        self.paths = list(paths)
+        self.process_pool = process_pool
+        self.link_cache = link_cache
+        self.jobs = max(1, jobs)
+        self.timeout = timeout
+        self._cancel_requested = False
+
+    def cancel(self):
+        """Minta ekstraksi dihentikan (dipanggil dari GUI thread)"""
+        self._cancel_requested = True
+
+    def run(self):
+        if self.link_cache:
+            cache_hits, cache_misses = self.link_cache.hits, self.link_cache.misses
+        files = iter_supported_files(self.paths)
+        files_found = files_done = 0
+        bytes_done = 0
+        # Satu file di depan sudah diambil, supaya ketahuan file mana yang terakhir
+        upcoming = next(files, None)
+        pending = set()
+        with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+            while True:
+                # Back-pressure: ambil file berikutnya hanya kalau ada slot kosong
+                while not self._cancel_requested and upcoming is not None and len(pending) < self.jobs:
+                    file_path, upcoming = upcoming, next(files, None)
+                    files_found += 1
+                    # File yang dikerjakan sendirian (misal satu PDF besar) boleh memakai Pool XLSX/PDF
+                    alone = upcoming is None and not pending
+                    pending.add(executor.submit(self.extract_file, file_path, alone))
+                scan_finished = upcoming is None
+                if not pending:
+                    break
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    file_path, completed, from_cache, error, size = future.result()
+                    if error is not None:
+                        self.file_failed.emit(file_path, error)
+                    elif completed:
+                        self.file_extracted.emit(file_path, from_cache)
+                    files_done += 1
+                    bytes_done += size
+                self.batch_progress.emit(files_done, files_found if scan_finished else 0,
+                                         bytes_done / (1024 * 1024))
+        if self.link_cache:
+            # Ringkasan cache sekali per ekstraksi (LINK_OPENER_LOG=INFO untuk melihatnya)
+            try:
+                stats = self.link_cache.stats()
+                logger.info("Link cache: %d hit, %d miss, %d entry, %.1f MB",
+                            stats['hits'] - cache_hits, stats['misses'] - cache_misses,
+                            stats['entries'], stats['bytes'] / (1024 * 1024))
+            except Exception as e:
+                logger.warning("Link cache stats failed: %s", e)
+        self.extraction_finished.emit(self._cancel_requested)
+
+    def extract_file(self, file_path, alone=False):
+        """Ekstrak satu file, link dikirim bertahap lewat links_found.
+
+        alone True kalau tidak ada file lain yang dikerjakan bersamaan.
+        Return (file_path, selesai, dari_cache, error, ukuran); selesai False = dibatalkan.
+        """
+        try:
+            size = os.path.getsize(file_path)
+        except OSError as e:
+            return file_path, False, False, str(e), 0
+
+        # Cek cache dulu: file yang sama tidak perlu di-parse ulang
+        cache_key = None
+        if self.link_cache:
+            try:
+                cache_key = self.link_cache.file_key(file_path)
+                cached_rows = self.link_cache.get(cache_key)
+                if cached_rows is not None:
+                    cached_links = [LinkRecord(*row) for row in cached_rows]
+                    for start in range(0, len(cached_links), LINK_BATCH_SIZE):
+                        self.links_found.emit(file_path, cached_links[start:start + LINK_BATCH_SIZE])
+                    return file_path, True, True, None, size
+            except Exception as e:
+                logger.warning("Link cache lookup failed: %s", e)
+
+        links = []
+        try:
+            if not self.extract_in_process(file_path, links, alone):
+                return file_path, False, False, None, size
+        except Exception as e:
+            return file_path, False, False, str(e), size
+
+        if cache_key is not None:
+            try:
+                self.link_cache.put(cache_key, links)
+            except Exception as e:
+                logger.warning("Link cache store failed: %s", e)
+        return file_path, True, False, None, size
+
+    def extract_in_process(self, file_path, links, use_pools=False):
+        """Jalankan ekstraksi di process ekstraksi, isi links bertahap; False kalau dibatalkan"""
+        process = self.process_pool.acquire()
+        process.submit(file_path, use_pools=use_pools)
+        deadline = time.monotonic() + self.timeout
+        reusable = False
+        try:
+            while True:
+                if self._cancel_requested:
+                    logger.debug("Extraction cancelled: %s", file_path)
+                    return False
+                if time.monotonic() > deadline:
+                    raise Exception(f"Ekstraksi melebihi batas waktu {self.timeout} detik")
+                try:
+                    message = process.get(timeout=0.1)
+                except queue.Empty:
+                    if not process.is_alive() and process.result_queue.empty():
+                        raise Exception("Process ekstraksi berhenti tanpa hasil "
+                                        f"(exit code {process.process.exitcode})")
+                    continue
+                if message[0] == 'progress':
+                    self.progress_updated.emit(message[1], message[2], message[3])
+                elif message[0] == 'links':
+                    links.extend(message[1])
+                    self.links_found.emit(file_path, message[1])
+                elif message[0] == 'done':
+                    reusable = True
+                    return True
+                else:
+                    reusable = True  # Error parsing biasa: process masih bisa dipakai file lain
+                    raise Exception(message[1])
+        finally:
+            # Dibatalkan/timeout/crash: process dihentikan dan nanti diganti yang baru
+            if reusable:
+                self.process_pool.release(process)
+            else:
+                self.process_pool.discard(process)
+
+
+class LinkTableModel(QAbstractTableModel):
+    """Model tabel link untuk QTableView, tanpa satu QTableWidgetItem per cell.
+
+    URL disimpan di list string, asal link sebagai index (array 'I') ke daftar
+    asal unik, dan status baris di bytearray (satu byte per link). View hanya
+    meminta data baris yang sedang terlihat, jadi ratusan ribu link tetap
+    ringan. Warna baris berasal dari status lewat BackgroundRole.
+    """
+    STATUS_NORMAL = 0
+    STATUS_PROCESSING = 1  # Kuning: sedang dibuka
+    STATUS_OPENED = 2  # Hijau: berhasil dibuka
+    STATUS_FAILED = 3  # Merah: gagal dibuka
+    HEADERS = ("Link", "Sumber")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.links = []
+        self._source_ids = array('I')
+        self._sources = []  # (teks kolom Sumber, tooltip path file)
+        self._source_lookup = {}
+        self._status = bytearray()
+        # Index untuk filter cepat (teks link huruf kecil, host -> baris)
+        self.search_index = LinkSearchIndex()
+        self._status_colors = {
+            self.STATUS_PROCESSING: QColor(246, 191, 17, 25),  # rgba(246, 191, 17, 0.1)
+            self.STATUS_OPENED: QColor(100, 195, 0, 25),  # rgba(100, 195, 0, 0.1)
+            self.STATUS_FAILED: QColor(244, 67, 54, 25),  # rgba(244, 67, 54, 0.1)
+        }
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.links)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == Qt.DisplayRole:
+            if index.column() == 0:
+                return self.links[row]
+            return self._sources[self._source_ids[row]][0]
+        if role == Qt.ToolTipRole:
+            return self._sources[self._source_ids[row]][1]
+        if role == Qt.BackgroundRole:
+            return self._status_colors.get(self._status[row])
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def _source_id(self, file_path, record):
+        """Index asal link; record dengan asal sama (file, format, member, lokasi, jenis) berbagi satu entry"""
+        key = (file_path, record[1:])
+        source_id = self._source_lookup.get(key)
+        if source_id is None:
+            # Path file (dan member arsip) lengkap ditampilkan sebagai tooltip
+            tooltip = f"{file_path}!{record.member}" if record.member else file_path
+            source_id = self._source_lookup[key] = len(self._sources)
+            self._sources.append((record.provenance(), tooltip))
+        return source_id
+
+    def append_records(self, file_path, records):
+        """Tambahkan LinkRecord di bawah baris yang sudah ada (satu notifikasi insert)"""
+        if not records:
+            return
+        first_row = len(self.links)
+        self.beginInsertRows(QModelIndex(), first_row, first_row + len(records) - 1)
+        for record in records:
+            self.links.append(record.url)
+            self._source_ids.append(self._source_id(file_path, record))
+        self._status.extend(bytes(len(records)))
+        self.search_index.add(self.links[first_row:])
+        self.endInsertRows()
+
+    def clear(self):
+        self.beginResetModel()
+        self.links = []
+        self._source_ids = array('I')
+        self._sources = []
+        self._source_lookup = {}
+        self._status = bytearray()
+        self.search_index.clear()
+        self.endResetModel()
+
+    def link(self, row):
+        return self.links[row]
+
+    def source_text(self, row):
+        return self._sources[self._source_ids[row]][0]
+
+    def set_status(self, row, status):
+        """Ubah status satu baris; view hanya menggambar ulang baris itu"""
+        if 0 <= row < len(self._status):
+            self._status[row] = status
+            self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1),
+                                  [Qt.BackgroundRole])
+
+    def set_status_range(self, start, stop, status):
+        """Ubah status baris start..stop-1 dengan satu notifikasi dataChanged"""
+        start = max(start, 0)
+        stop = min(stop, len(self._status))
+        if start >= stop:
+            return
+        self._status[start:stop] = bytes((status,)) * (stop - start)
+        self.dataChanged.emit(self.index(start, 0), self.index(stop - 1, len(self.HEADERS) - 1),
+                              [Qt.BackgroundRole])
+
+    def status_mask(self, statuses):
+        """bytes berisi 1 untuk baris yang statusnya ada di statuses, 0 untuk yang lain"""
+        table = bytes(1 if value in statuses else 0 for value in range(256))
+        return self._status.translate(table)
+
+    def reset_status(self):
+        """Kembalikan semua baris ke status normal dengan satu notifikasi dataChanged"""
+        if not self.links:
+            return
+        self._status = bytearray(len(self.links))
+        self.dataChanged.emit(self.index(0, 0), self.index(len(self.links) - 1, len(self.HEADERS) - 1),
+                              [Qt.BackgroundRole])
+
+
+class LinkFilterProxyModel(QAbstractProxyModel):
+    """Proxy filter di atas LinkTableModel (teks/domain/regex dan status baris).
+
+    Baris yang lolos filter disimpan sebagai array 'I' berisi nomor baris
+    model sumber (urut naik) yang dihitung LinkSearchIndex sekali per
+    perubahan filter, bukan lewat filterAcceptsRow per baris seperti
+    QSortFilterProxyModel. Tanpa filter, baris diteruskan apa adanya.
+    Filter status dihitung saat filter diubah; baris tidak hilang sendiri
+    ketika statusnya berubah. Link dari domain yang dilewati (lihat
+    LinkDomainModel) juga disembunyikan.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = None  # None = tanpa filter (semua baris sumber)
+        self._query = None
+        self._statuses = None
+        self._skipped_hosts = frozenset()
+
+    def setSourceModel(self, model):
+        super().setSourceModel(model)
+        model.rowsAboutToBeInserted.connect(self._on_rows_about_to_be_inserted)
+        model.rowsInserted.connect(self._on_rows_inserted)
+        model.modelAboutToBeReset.connect(self.beginResetModel)
+        model.modelReset.connect(self._on_model_reset)
+        model.dataChanged.connect(self._on_data_changed)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid() or self.sourceModel() is None:
+            return 0
+        return self.sourceModel().rowCount() if self._rows is None else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid() or self.sourceModel() is None:
+            return 0
+        return self.sourceModel().columnCount()
+
+    def index(self, row, column, parent=QModelIndex()):
+        if parent.isValid() or not 0 <= row < self.rowCount() or not 0 <= column < self.columnCount():
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index=None):
+        if index is None:
+            return super().parent()  # QObject.parent()
+        return QModelIndex()
+
+    def mapToSource(self, proxy_index):
+        if not proxy_index.isValid():
+            return QModelIndex()
+        return self.sourceModel().index(self.source_row(proxy_index.row()), proxy_index.column())
+
+    def mapFromSource(self, source_index):
+        if not source_index.isValid():
+            return QModelIndex()
+        row = source_index.row()
+        if self._rows is not None:
+            position = bisect_left(self._rows, row)
+            if position == len(self._rows) or self._rows[position] != row:
+                return QModelIndex()
+            row = position
+        return self.index(row, source_index.column())
+
+    def source_row(self, row):
+        """Nomor baris di LinkTableModel untuk baris proxy"""
+        return row if self._rows is None else self._rows[row]
+
+    def source_rows(self):
+        """Nomor baris sumber yang sedang tampil, urut naik"""
+        return range(self.sourceModel().rowCount()) if self._rows is None else self._rows
+
+    def is_filtered(self):
+        return self._rows is not None
+
+    def set_filter(self, query=None, statuses=None):
+        """Terapkan filter: query dari link_index.parse_query, statuses = set status yang ditampilkan"""
+        self._query = query
+        self._statuses = statuses
+        self._refilter()
+
+    def set_skipped_hosts(self, host_ids):
+        """Sembunyikan link dengan id host (LinkSearchIndex.hosts) di host_ids"""
+        self._skipped_hosts = frozenset(host_ids)
+        self._refilter()
+
+    def _refilter(self):
+        self.beginResetModel()
+        if self._query is None and not self._statuses and not self._skipped_hosts:
+            self._rows = None
+        else:
+            self._rows = self._filter_rows(None)
+        self.endResetModel()
+
+    def _filter_rows(self, rows):
+        """Saring rows (None = semua baris sumber) dengan filter aktif"""
+        model = self.sourceModel()
+        if self._query is not None:
+            if rows is None:
+                rows = model.search_index.search(self._query)
+            else:
+                rows = model.search_index.filter_rows(rows, self._query)
+        if self._statuses:
+            mask = model.status_mask(self._statuses)
+            if rows is None:
+                rows = array('I', compress(range(len(mask)), mask))
+            else:
+                rows = array('I', compress(rows, map(mask.__getitem__, rows)))
+        if self._skipped_hosts:
+            row_hosts = model.search_index.row_hosts
+            if rows is None:
+                rows = range(len(row_hosts))
+            skipped = map(self._skipped_hosts.__contains__, map(row_hosts.__getitem__, rows))
+            rows = array('I', compress(rows, map(operator.not_, skipped)))
+        return rows
+
+    def _on_rows_about_to_be_inserted(self, parent, first, last):
+        if self._rows is None:
+            self.beginInsertRows(QModelIndex(), first, last)
+
+    def _on_rows_inserted(self, parent, first, last):
+        if self._rows is None:
+            self.endInsertRows()
+            return
+        # Hanya baris baru yang dicek terhadap filter
+        new_rows = self._filter_rows(range(first, last + 1))
+        if new_rows:
+            start = len(self._rows)
+            self.beginInsertRows(QModelIndex(), start, start + len(new_rows) - 1)
+            self._rows.extend(new_rows)
+            self.endInsertRows()
+
+    def _on_model_reset(self):
+        if self._rows is not None:
+            self._rows = array('I')
+        self.endResetModel()
+
+    def _on_data_changed(self, top_left, bottom_right, roles=()):
+        first, last = top_left.row(), bottom_right.row()
+        if self._rows is not None:
+            first = bisect_left(self._rows, first)
+            last = bisect_left(self._rows, last + 1) - 1
+            if first > last:
+                return
+        self.dataChanged.emit(self.index(first, 0), self.index(last, self.columnCount() - 1), roles)
+
+
+class LinkDomainModel(QAbstractItemModel):
+    """Model tree "per domain": domain (host) sebagai induk dengan jumlah link, link sebagai anak.
+
+    Pengelompokan tidak dihitung ulang dari found_links: model memakai host
+    dan host_rows dari LinkSearchIndex milik LinkTableModel, yang diisi sekali
+    jalan saat link masuk (host di-intern, baris per host di array 'I').
+    Link yang baru masuk dikumpulkan lalu diterapkan berkala
+    (DOMAIN_UPDATE_INTERVAL_MS), dan hanya domain yang bertambah yang diberi
+    notifikasi. Domain yang di-uncheck dilewati saat membuka/mengekspor link.
+    """
+    HEADERS = ("Domain / Link", "Jumlah / Sumber")
+    skipped_hosts_changed = Signal()
+
+    def __init__(self, source_model, parent=None):
+        super().__init__(parent)
+        self.source_model = source_model
+        self._search_index = source_model.search_index
+        self._counts = array('I')  # jumlah link per domain yang sudah diberitahukan ke view
+        self._pending_row = 0  # baris LinkTableModel pertama yang belum diterapkan ke tree
+        self.skipped_hosts = set()  # id host yang dilewati
+        self._skipped_color = QColor(153, 153, 153)
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.timeout.connect(self.apply_pending_rows)
+        source_model.rowsInserted.connect(self._on_rows_inserted)
+        source_model.modelAboutToBeReset.connect(self.beginResetModel)
+        source_model.modelReset.connect(self._on_model_reset)
+        source_model.dataChanged.connect(self._on_data_changed)
+
+    # internalId 0 = baris domain, host_id + 1 = link di bawah domain host_id
+    def index(self, row, column, parent=QModelIndex()):
+        if not 0 <= column < len(self.HEADERS):
+            return QModelIndex()
+        if not parent.isValid():
+            if 0 <= row < len(self._counts):
+                return self.createIndex(row, column, 0)
+        elif parent.internalId() == 0 and 0 <= row < self._counts[parent.row()]:
+            return self.createIndex(row, column, parent.row() + 1)
+        return QModelIndex()
+
+    def parent(self, index=None):
+        if index is None:
+            return super().parent()  # QObject.parent()
+        if not index.isValid() or index.internalId() == 0:
+            return QModelIndex()
+        return self.createIndex(index.internalId() - 1, 0, 0)
+
+    def rowCount(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return len(self._counts)
+        if parent.internalId() == 0 and parent.column() == 0:
+            return self._counts[parent.row()]
+        return 0
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.HEADERS)
+
+    def host_id(self, index):
+        """Id host untuk index domain maupun link"""
+        return index.row() if index.internalId() == 0 else index.internalId() - 1
+
+    def source_row(self, index):
+        """Nomor baris LinkTableModel untuk index link, atau None untuk index domain"""
+        if not index.isValid() or index.internalId() == 0:
+            return None
+        return self._search_index.host_rows[index.internalId() - 1][index.row()]
+
+    def domain_rows(self, host_id):
+        """Nomor baris LinkTableModel semua link di domain host_id (urut naik)"""
+        return array('I', self._search_index.host_rows[host_id][:self._counts[host_id]])
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        host_id = self.host_id(index)
+        skipped = host_id in self.skipped_hosts
+        if index.internalId() == 0:
+            if role == Qt.DisplayRole:
+                if index.column() == 0:
+                    return self._search_index.hosts[host_id] or "(tanpa domain)"
+                return self._counts[host_id]
+            if role == Qt.CheckStateRole and index.column() == 0:
+                return Qt.Unchecked if skipped else Qt.Checked
+            if role == Qt.ForegroundRole and skipped:
+                return self._skipped_color
+            return None
+        if role == Qt.ForegroundRole and skipped:
+            return self._skipped_color
+        row = self._search_index.host_rows[host_id][index.row()]
+        return self.source_model.data(self.source_model.index(row, index.column()), role)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        if index.internalId() == 0 and index.column() == 0:
+            flags |= Qt.ItemIsUserCheckable
+        return flags
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != Qt.CheckStateRole or not index.isValid() or index.internalId() != 0:
+            return False
+        self.set_host_skipped(index.row(), Qt.CheckState(value) != Qt.Checked)
+        return True
+
+    def set_host_skipped(self, host_id, skipped):
+        """Lewati (skipped=True) atau sertakan lagi semua link di satu domain"""
+        if skipped == (host_id in self.skipped_hosts):
+            return
+        if skipped:
+            self.skipped_hosts.add(host_id)
+        else:
+            self.skipped_hosts.discard(host_id)
+        domain_index = self.createIndex(host_id, 0, 0)
+        self.dataChanged.emit(domain_index, self.createIndex(host_id, len(self.HEADERS) - 1, 0))
+        if self._counts[host_id]:
+            self.dataChanged.emit(self.index(0, 0, domain_index),
+                                  self.index(self._counts[host_id] - 1, len(self.HEADERS) - 1, domain_index),
+                                  [Qt.ForegroundRole])
+        self.skipped_hosts_changed.emit()
+
+    def _on_rows_inserted(self, parent, first, last):
+        if not self._update_timer.isActive():
+            self._update_timer.start(DOMAIN_UPDATE_INTERVAL_MS)
+
+    def apply_pending_rows(self):
+        """Terapkan link yang masuk sejak update terakhir: domain baru lalu link baru per domain"""
+        search_index = self._search_index
+        first = self._pending_row
+        self._pending_row = len(search_index)
+        known_hosts = len(self._counts)
+        if len(search_index.hosts) > known_hosts:
+            self.beginInsertRows(QModelIndex(), known_hosts, len(search_index.hosts) - 1)
+            self._counts.extend(array('I', [0]) * (len(search_index.hosts) - known_hosts))
+            self.endInsertRows()
+        # Hanya domain yang mendapat link baru yang diberi notifikasi
+        for host_id in sorted(set(search_index.row_hosts[first:])):
+            old_count = self._counts[host_id]
+            new_count = len(search_index.host_rows[host_id])
+            if new_count > old_count:
+                domain_index = self.createIndex(host_id, 0, 0)
+                self.beginInsertRows(domain_index, old_count, new_count - 1)
+                self._counts[host_id] = new_count
+                self.endInsertRows()
+                count_index = self.createIndex(host_id, 1, 0)
+                self.dataChanged.emit(count_index, count_index, [Qt.DisplayRole])
+
+    def _on_model_reset(self):
+        self._update_timer.stop()
+        self._counts = array('I')
+        self._pending_row = 0
+        had_skipped = bool(self.skipped_hosts)
+        self.skipped_hosts = set()
+        self.endResetModel()
+        if had_skipped:
+            self.skipped_hosts_changed.emit()
+
+    def _on_data_changed(self, top_left, bottom_right, roles=()):
+        """Teruskan perubahan status baris LinkTableModel ke link di bawah domainnya"""
+        first, last = top_left.row(), bottom_right.row()
+        search_index = self._search_index
+        last_column = len(self.HEADERS) - 1
+        if last - first + 1 > len(self._counts):
+            # Banyak baris sekaligus (misal reset warna): satu notifikasi per domain
+            for host_id, count in enumerate(self._counts):
+                if count:
+                    self.dataChanged.emit(self.createIndex(0, 0, host_id + 1),
+                                          self.createIndex(count - 1, last_column, host_id + 1), roles)
+            return
+        for row in range(first, min(last + 1, len(search_index.row_hosts))):
+            host_id = search_index.row_hosts[row]
+            if host_id >= len(self._counts):
+                continue
+            position = bisect_left(search_index.host_rows[host_id], row)
+            if position < self._counts[host_id]:
+                self.dataChanged.emit(self.createIndex(position, 0, host_id + 1),
+                                      self.createIndex(position, last_column, host_id + 1), roles)
 
 
 class LinkOpenerApp(QMainWindow):    
+    # Pilihan filter status: (label, status LinkTableModel yang ditampilkan; None = semua)
+    STATUS_FILTERS = (
+        ("Semua status", None),
+        ("Belum dibuka", (LinkTableModel.STATUS_NORMAL, LinkTableModel.STATUS_PROCESSING)),
+        ("Dibuka", (LinkTableModel.STATUS_OPENED,)),
+        ("Gagal", (LinkTableModel.STATUS_FAILED,)),
+    )
+    
     def __init__(self):
         super().__init__()
         self.worker = None
+        self.extraction_worker = None  # Worker ekstraksi file yang sedang berjalan
+        # Process ekstraksi dipakai ulang antar file dan antar ekstraksi (dibuat saat dibutuhkan)
+        self.extraction_processes = ExtractionProcessPool()
+        self.extraction_single_file = True
+        # Mode pantau folder: hanya file baru/berubah yang diekstrak ulang
+        self.folder_watcher = None
+        self.fs_watcher = None
+        self.watch_scan_pending = False
+        self.watch_timer = QTimer(self)
+        self.watch_timer.setSingleShot(True)
+        self.watch_timer.timeout.connect(self.run_watch_scan)
+        # Update dari LinkOpenerWorker diterapkan berkala, bukan per link
+        self.opener_update_timer = QTimer(self)
+        self.opener_update_timer.timeout.connect(self.apply_opener_updates)
         self.is_processing = False  # Flag untuk mencegah multiple execution
         self.source_file_path = None  # Track source file path for export
         self.opened_chrome_tabs = []  # Track Chrome tab handles yang dibuka dari app ini
         self.chrome_driver = None  # Track Chrome driver instance
+        # Cache hasil ekstraksi di disk; aplikasi tetap jalan tanpa cache kalau gagal dibuka
+        try:
+            self.link_cache = LinkCache()
+        except Exception as e:
+            logger.warning("Link cache unavailable: %s", e)
+            self.link_cache = None
         self.init_ui()
         
         # Set window always on top
@@ -482,7 +1155,7 @@ class LinkOpenerApp(QMainWindow):
         drop_layout.addWidget(drop_label)
         
         # Supported formats label with smaller font
-        formats_label = QLabel("Mendukung format: TXT, DOC, DOCX, XLS, XLSX, PPT, PPTX, PDF, CSV, RTF, ODT, ODS, ODP")
+        formats_label = QLabel(f"Mendukung format: {supported_formats_text()}")
         formats_label.setAlignment(Qt.AlignCenter)
         formats_label.setFont(QFont("Arial", 8))
         formats_label.setStyleSheet("color: #666666; margin-top: 5px;")
@@ -516,6 +1189,34 @@ class LinkOpenerApp(QMainWindow):
         """)
         self.open_button.clicked.connect(self.open_file)
         buttons_layout.addWidget(self.open_button)
+        
+        # Tombol pantau folder
+        self.watch_button = QPushButton("Pantau Folder")
+        self.watch_button.setIcon(qta.icon('fa5s.eye', color='#9C27B0'))
+        self.watch_button.setMinimumHeight(50)
+        self.watch_button.setFont(QFont("Arial", 12))
+        self.watch_button.setStyleSheet("""
+            QPushButton {
+                border: 2px solid #9C27B0;
+                border-radius: 8px;
+                padding: 8px 16px;
+                background-color: transparent;
+            }
+            QPushButton:hover {
+                border: 2px solid #7B1FA2;
+                background-color: rgba(156, 39, 176, 0.05);
+            }
+            QPushButton:pressed {
+                border: 2px solid #4A148C;
+                background-color: rgba(156, 39, 176, 0.1);
+            }
+            QPushButton:disabled {
+                border: 2px solid #CCCCCC;
+                color: #999999;
+            }
+        """)
+        self.watch_button.clicked.connect(self.toggle_watch_folder)
+        buttons_layout.addWidget(self.watch_button)
           # Tombol buka link
         self.open_links_button = QPushButton("Buka Chrome")
         self.open_links_button.setIcon(qta.icon('fa5s.rocket', color='#4CAF50'))
@@ -598,22 +1299,82 @@ class LinkOpenerApp(QMainWindow):
         self.close_tabs_button.clicked.connect(self.close_chrome_tabs)
         buttons_layout.addWidget(self.close_tabs_button)
         
+        # Tombol batal ekstraksi (hanya tampil saat file sedang diekstrak)
+        self.cancel_extract_button = QPushButton("Batal")
+        self.cancel_extract_button.setIcon(qta.icon('fa5s.stop-circle', color='#9E9E9E'))
+        self.cancel_extract_button.setMinimumHeight(50)
+        self.cancel_extract_button.setFont(QFont("Arial", 12))
+        self.cancel_extract_button.setStyleSheet("""
+            QPushButton {
+                border: 2px solid #9E9E9E;
+                border-radius: 8px;
+                padding: 8px 16px;
+                background-color: transparent;
+            }
+            QPushButton:hover {
+                border: 2px solid #757575;
+                background-color: rgba(158, 158, 158, 0.05);
+            }
+            QPushButton:pressed {
+                border: 2px solid #424242;
+                background-color: rgba(158, 158, 158, 0.1);
+            }
+        """)
+        self.cancel_extract_button.setVisible(False)
+        self.cancel_extract_button.clicked.connect(self.cancel_extraction)
+        buttons_layout.addWidget(self.cancel_extract_button)
+        
         layout.addLayout(buttons_layout)
         
         # Status label
         self.status_label = QLabel("")
         self.status_label.setAlignment(Qt.AlignLeft)
         self.status_label.setWordWrap(True)
-        layout.addWidget(self.status_label)        # Table widget untuk menampilkan link yang ditemukan
-        self.links_table = QTableWidget()
-        self.links_table.setColumnCount(1)
-        self.links_table.setHorizontalHeaderLabels(["Link"])
+        layout.addWidget(self.status_label)
+        
+        # Filter bar: teks/domain:/regex dan status; Buka & Export hanya memakai link yang lolos filter
+        self.filter_bar = QWidget()
+        filter_layout = QHBoxLayout(self.filter_bar)
+        filter_layout.setContentsMargins(0, 0, 0, 0)
+        self.filter_edit = QLineEdit()
+        self.filter_edit.setPlaceholderText("Filter link: teks, domain:contoh.com, atau /regex/")
+        self.filter_edit.setClearButtonEnabled(True)
+        self.filter_edit.textChanged.connect(self.apply_link_filter)
+        filter_layout.addWidget(self.filter_edit)
+        self.status_filter = QComboBox()
+        for label, statuses in self.STATUS_FILTERS:
+            self.status_filter.addItem(label, statuses)
+        self.status_filter.currentIndexChanged.connect(self.apply_link_filter)
+        filter_layout.addWidget(self.status_filter)
+        self.filter_count_label = QLabel("")
+        filter_layout.addWidget(self.filter_count_label)
+        # Tampilan per domain: domain bisa dibuka atau dilewati sekaligus
+        self.group_button = QPushButton("Per Domain")
+        self.group_button.setIcon(qta.icon('fa5s.sitemap', color='#666666'))
+        self.group_button.setCheckable(True)
+        self.group_button.toggled.connect(self.toggle_domain_view)
+        filter_layout.addWidget(self.group_button)
+        self.filter_bar.setVisible(False)
+        layout.addWidget(self.filter_bar)
+        
+        # Table widget untuk menampilkan link yang ditemukan
+        # Model/view: data link disimpan di LinkTableModel, bukan item per cell;
+        # view melihatnya lewat LinkFilterProxyModel
+        self.links_model = LinkTableModel(self)
+        self.links_proxy = LinkFilterProxyModel(self)
+        self.links_proxy.setSourceModel(self.links_model)
+        self.links_proxy.rowsInserted.connect(self.update_filter_count)
+        self.links_proxy.modelReset.connect(self.update_filter_count)
+        self.links_table = QTableView()
+        self.links_table.setModel(self.links_proxy)
         self.links_table.setVisible(False)
-        self.links_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.links_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.links_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.links_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        # Tinggi baris tetap: view tidak perlu mengukur isi tiap baris
+        self.links_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
         
         # Connect double-click event untuk buka link individual
-        self.links_table.itemDoubleClicked.connect(self.open_single_link)
+        self.links_table.doubleClicked.connect(self.open_single_link)
         
         # Enable context menu untuk table
         self.links_table.setContextMenuPolicy(Qt.CustomContextMenu)
@@ -622,9 +1383,30 @@ class LinkOpenerApp(QMainWindow):
         # Set column widths
         header = self.links_table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.Stretch)  # Link column stretches
+        header.setSectionResizeMode(1, QHeaderView.Interactive)  # Sumber: format, lokasi, teks/hyperlink
+        header.resizeSection(1, 220)
         
         layout.addWidget(self.links_table)
         
+        # Tree per domain (jumlah link per host); link di bawah domain baru dimuat saat dibuka
+        self.domain_model = LinkDomainModel(self.links_model, self)
+        self.domain_model.skipped_hosts_changed.connect(self.on_skipped_hosts_changed)
+        self.domain_tree = QTreeView()
+        self.domain_tree.setModel(self.domain_model)
+        self.domain_tree.setVisible(False)
+        self.domain_tree.setUniformRowHeights(True)
+        self.domain_tree.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.domain_tree.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.domain_tree.doubleClicked.connect(self.open_single_link)
+        self.domain_tree.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.domain_tree.customContextMenuRequested.connect(self.show_domain_context_menu)
+        tree_header = self.domain_tree.header()
+        tree_header.setStretchLastSection(False)
+        tree_header.setSectionResizeMode(0, QHeaderView.Stretch)
+        tree_header.setSectionResizeMode(1, QHeaderView.Interactive)
+        tree_header.resizeSection(1, 220)
+        layout.addWidget(self.domain_tree)
+        
         # Progress bar (moved below table)
         self.progress_bar = QProgressBar()
         self.progress_bar.setVisible(False)
@@ -633,26 +1415,75 @@ class LinkOpenerApp(QMainWindow):
         layout.addWidget(self.progress_bar)
         layout.addStretch()
         
-        self.found_links = []
+        # Dedup lintas file berdasarkan URL kanonik (aturan dari config.json)
+        self.link_index = LinkDedupIndex(load_rules())
+    
+    @property
+    def found_links(self):
+        """List semua URL di tabel (milik links_model), termasuk yang tersembunyi oleh filter"""
+        return self.links_model.links
+    
+    def apply_link_filter(self, *args):
+        """Terapkan teks filter dan filter status ke tabel"""
+        try:
+            query = parse_query(self.filter_edit.text())
+        except re.error as e:
+            self.filter_edit.setStyleSheet("QLineEdit { border: 1px solid #F44336; }")
+            self.filter_edit.setToolTip(f"Regex tidak valid: {e}")
+            return
+        self.filter_edit.setStyleSheet("")
+        self.filter_edit.setToolTip("")
+        statuses = self.status_filter.currentData()
+        self.links_proxy.set_filter(query, set(statuses) if statuses else None)
+    
+    def update_filter_count(self, *args):
+        """Tampilkan jumlah link yang lolos filter"""
+        if self.links_proxy.is_filtered():
+            self.filter_count_label.setText(f"{self.links_proxy.rowCount()} dari {len(self.found_links)} link")
+        else:
+            self.filter_count_label.setText(f"{len(self.found_links)} link")
+    
+    def set_link_views_visible(self, visible):
+        """Tampilkan/sembunyikan tabel (atau tree per domain) beserta filter bar"""
+        grouped = self.group_button.isChecked()
+        self.filter_bar.setVisible(visible)
+        self.links_table.setVisible(visible and not grouped)
+        self.domain_tree.setVisible(visible and grouped)
+    
+    def toggle_domain_view(self, checked):
+        """Ganti antara tabel link biasa dan tree per domain"""
+        if self.filter_bar.isVisible():
+            self.set_link_views_visible(True)
+    
+    def on_skipped_hosts_changed(self):
+        """Domain yang di-uncheck di tree juga disembunyikan dari tabel, Buka dan Export"""
+        self.links_proxy.set_skipped_hosts(self.domain_model.skipped_hosts)
+    
+    def visible_link_rows(self):
+        """Nomor baris LinkTableModel yang sedang tampil (lolos filter)"""
+        return self.links_proxy.source_rows()
+    
+    def dropped_paths(self, mime_data):
+        """Ambil file yang didukung dan folder dari data drag & drop"""
+        paths = []
+        for url in mime_data.urls():
+            path = url.toLocalFile()
+            if path and (os.path.isdir(path) or is_supported_file(path)):
+                paths.append(path)
+        return paths
     
     def dragEnterEvent(self, event: QDragEnterEvent):
         """Handle drag enter event"""
         if event.mimeData().hasUrls():
-            urls = event.mimeData().urls()
-            if len(urls) == 1:
-                file_path = urls[0].toLocalFile().lower()
-                supported_extensions = ['.txt', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx', '.pdf', '.csv', '.rtf', '.odt', '.ods', '.odp']
-                if any(file_path.endswith(ext) for ext in supported_extensions):
-                    # Set hover style when dragging valid file - only border color change
-                    self.drop_frame.setStyleSheet("""
-                        QFrame#dropFrame {
-                            border: 2px dashed #4CAF50;
-                            border-radius: 10px;
-                        }
-                    """)
-                    event.acceptProposedAction()
-                else:
-                    event.ignore()
+            if self.extraction_worker is None and self.dropped_paths(event.mimeData()):
+                # Set hover style when dragging valid file - only border color change
+                self.drop_frame.setStyleSheet("""
+                    QFrame#dropFrame {
+                        border: 2px dashed #4CAF50;
+                        border-radius: 10px;
+                    }
+                """)
+                event.acceptProposedAction()
             else:
                 event.ignore()
         else:
@@ -669,7 +1500,7 @@ class LinkOpenerApp(QMainWindow):
         """)
         event.accept()    
     def dropEvent(self, event: QDropEvent):
-        """Handle drop event"""
+        """Handle drop event: satu atau banyak file, dan/atau folder (rekursif)"""
         # Reset to normal style first
         self.drop_frame.setStyleSheet("""
             QFrame#dropFrame {
@@ -679,464 +1510,272 @@ class LinkOpenerApp(QMainWindow):
         """)
         
         if event.mimeData().hasUrls():
-            urls = event.mimeData().urls()
-            if len(urls) == 1:
-                file_path = urls[0].toLocalFile()
-                file_path_lower = file_path.lower()
-                supported_extensions = ['.txt', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx', '.pdf', '.csv', '.rtf', '.odt', '.ods', '.odp']
-                if any(file_path_lower.endswith(ext) for ext in supported_extensions):
-                    self.load_and_extract_links(file_path)
-                    event.acceptProposedAction()                
-                else:
-                    QMessageBox.warning(self, "Peringatan", "Format file tidak didukung!\nHanya mendukung: TXT, DOC, DOCX, XLS, XLSX, PPT, PPTX, PDF, CSV, RTF, ODT, ODS, ODP")
+            paths = self.dropped_paths(event.mimeData())
+            if paths:
+                self.load_and_extract_links(paths)
+                event.acceptProposedAction()                
             else:
-                QMessageBox.warning(self, "Peringatan", "Hanya bisa drop satu file!")
+                QMessageBox.warning(self, "Peringatan", f"Format file tidak didukung!\nHanya mendukung: {supported_formats_text()}")
         else:
             event.ignore()
     def open_file(self):
-        """Buka dialog untuk memilih file"""
-        file_path, _ = QFileDialog.getOpenFileName(
+        """Buka dialog untuk memilih satu atau beberapa file"""
+        file_paths, _ = QFileDialog.getOpenFileNames(
             self, 
             "Pilih File", 
             "", 
-            "All Supported (*.txt *.doc *.docx *.xls *.xlsx *.ppt *.pptx *.pdf *.csv *.rtf *.odt *.ods *.odp);;"
-            "Text Files (*.txt);;"
-            "Word Documents (*.doc *.docx);;"
-            "Excel Files (*.xls *.xlsx);;"
-            "PowerPoint Files (*.ppt *.pptx);;"
-            "PDF Files (*.pdf);;"
-            "CSV Files (*.csv);;"
-            "RTF Files (*.rtf);;"
-            "OpenDocument Files (*.odt *.ods *.odp);;"
-            "All Files (*)"
+            file_dialog_filter()
         )
         
-        if file_path:
-            self.load_and_extract_links(file_path)
-    def extract_text_from_file(self, file_path):
-        """Ekstrak teks dari berbagai format file"""
-        file_extension = Path(file_path).suffix.lower()
-        
-        try:
-            if file_extension == '.txt':
-                return self.extract_text_from_txt(file_path)
-            elif file_extension == '.docx':
-                return self.extract_text_from_docx(file_path)
-            elif file_extension == '.doc':
-                return self.extract_text_from_doc(file_path)
-            elif file_extension in ['.xlsx', '.xls']:
-                return self.extract_text_from_excel(file_path)
-            elif file_extension == '.pptx':
-                return self.extract_text_from_pptx(file_path)
-            elif file_extension == '.ppt':
-                return self.extract_text_from_ppt(file_path)
-            elif file_extension == '.pdf':
-                return self.extract_text_from_pdf(file_path)
-            elif file_extension == '.csv':
-                return self.extract_text_from_csv(file_path)
-            elif file_extension == '.rtf':
-                return self.extract_text_from_rtf(file_path)
-            elif file_extension == '.odt':
-                return self.extract_text_from_odt(file_path)
-            elif file_extension == '.ods':
-                return self.extract_text_from_ods(file_path)
-            elif file_extension == '.odp':
-                return self.extract_text_from_odp(file_path)
-            else:
-                raise Exception(f"Format file {file_extension} tidak didukung")
-                
-        except Exception as e:
-            raise Exception(f"Gagal membaca file {file_extension}: {str(e)}")
-    
-    def extract_text_from_txt(self, file_path):
-        """Ekstrak teks dari file TXT"""
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as file:
-            return file.read()
+        if file_paths:
+            self.load_and_extract_links(file_paths)
+    def load_and_extract_links(self, paths, append=False):
+        """Mulai ekstraksi link dari file/folder di worker thread (GUI tetap responsif).
+
+        append=True menambahkan link baru ke tabel yang sudah ada (mode pantau folder).
+        """
+        if self.extraction_worker is not None:
+            return
+        if not append:
+            # Store source file path for export functionality
+            self.source_file_path = paths[0]
+        # Satu file saja: tampilkan progres per halaman/sheet seperti biasa
+        self.extraction_single_file = len(paths) == 1 and not os.path.isdir(paths[0])
+        self.extraction_label = Path(paths[0]).name if len(paths) == 1 else f"{len(paths)} item"
+        self.extraction_started = time.monotonic()
+        self.extraction_files_done = 0
+        self.extraction_errors = []
+        self.extraction_from_cache = True
+        self.extraction_append = append
+        
+        if not append:
+            # Hasil lama diganti dengan hasil gabungan dari file-file yang baru
+            self.links_model.clear()
+            self.link_index = LinkDedupIndex(load_rules())
+            self.set_link_views_visible(False)
+            self.open_links_button.setVisible(False)
+            self.export_button.setVisible(False)
+            self.close_tabs_button.setVisible(False)
+        
+        self.extraction_links_before = len(self.found_links)
+        self.open_button.setEnabled(False)
+        # Saat memantau folder, tombol tetap aktif supaya bisa Stop Pantau
+        self.watch_button.setEnabled(self.folder_watcher is not None)
+        self.cancel_extract_button.setVisible(True)
+        self.status_label.setText(f"Mengekstrak link dari {self.extraction_label}...")
+        if not self.is_processing:
+            # Progress bar dipakai bersama dengan proses buka link
+            self.progress_bar.setRange(0, 0)  # Busy indicator sampai ada progres pertama
+            self.progress_bar.setFormat(f"Mengekstrak {self.extraction_label}...")
+            self.progress_bar.setVisible(True)
+        
+        self.extraction_worker = ExtractionWorker(paths, self.extraction_processes, self.link_cache)
+        self.extraction_worker.progress_updated.connect(self.update_extraction_progress)
+        self.extraction_worker.batch_progress.connect(self.update_batch_progress)
+        self.extraction_worker.links_found.connect(self.on_links_found)
+        self.extraction_worker.file_extracted.connect(self.on_file_extracted)
+        self.extraction_worker.file_failed.connect(self.on_file_failed)
+        self.extraction_worker.extraction_finished.connect(self.on_extraction_finished)
+        self.extraction_worker.start()
     
-    def extract_text_from_docx(self, file_path):
-        """Ekstrak teks dari file DOCX termasuk hyperlink"""
-        if Document is None:
-            raise Exception("Library python-docx tidak terinstall. Install dengan: pip install python-docx")
-        
-        doc = Document(file_path)
-        text = []
-        links = []
-        
-        # Ekstrak teks normal dan hyperlink
-        for paragraph in doc.paragraphs:
-            text.append(paragraph.text)
-            
-            # Ekstrak hyperlink dari paragraph
-            for run in paragraph.runs:
-                if run.element.tag.endswith('hyperlink') or run._element.getparent().tag.endswith('hyperlink'):
-                    # Coba ambil URL dari hyperlink
-                    hyperlink_element = run._element.getparent()
-                    if hyperlink_element.tag.endswith('hyperlink'):
-                        rId = hyperlink_element.get('{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id')
-                        if rId:
-                            try:
-                                relationship = doc.part.rels[rId]
-                                if relationship.target_ref.startswith('http'):
-                                    links.append(relationship.target_ref)
-                            except:
-                                pass
-        
-        # Gabungkan teks dan link yang ditemukan
-        all_text = '\n'.join(text)
-        if links:
-            all_text += '\n' + '\n'.join(links)
-        
-        return all_text
+    def cancel_extraction(self):
+        """Batalkan ekstraksi yang sedang berjalan"""
+        if self.extraction_worker is not None:
+            self.cancel_extract_button.setEnabled(False)
+            self.status_label.setText("Membatalkan ekstraksi...")
+            self.extraction_worker.cancel()
     
-    def extract_text_from_doc(self, file_path):
-        """Ekstrak teks dari file DOC (format lama)"""
-        if olefile is None:
-            raise Exception("Library olefile tidak terinstall. Install dengan: pip install olefile")
-        
-        # Untuk file .doc, kita coba baca sebagai binary dan cari teks
-        try:
-            with open(file_path, 'rb') as file:
-                content = file.read()
-                # Decode dengan berbagai encoding
-                text = content.decode('utf-8', errors='ignore')
-                # Filter karakter yang tidak dapat dibaca
-                text = ''.join(char for char in text if ord(char) >= 32 or char in '\n\t')
-                return text
-        except Exception:
-            raise Exception("Gagal membaca file DOC. Coba convert ke DOCX dulu.")
+    def update_extraction_progress(self, done, total, unit):
+        """Update progress bar dengan jumlah byte/halaman/sheet yang sudah diproses"""
+        if self.is_processing or not self.extraction_single_file:
+            return
+        if total <= 0:
+            self.progress_bar.setRange(0, 0)
+            self.progress_bar.setFormat(f"Mengekstrak {self.extraction_label}...")
+            return
+        self.progress_bar.setRange(0, 1000)
+        self.progress_bar.setValue(int(done / total * 1000))
+        if unit == 'byte':
+            amount = f"{done / (1024 * 1024):.1f}/{total / (1024 * 1024):.1f} MB"
+        else:
+            amount = f"{done}/{total} {unit}"
+        self.progress_bar.setFormat(f"Mengekstrak {self.extraction_label}: {amount}")
     
-    def extract_text_from_excel(self, file_path):
-        """Ekstrak teks dari file Excel (XLS/XLSX) termasuk hyperlink"""
-        file_extension = Path(file_path).suffix.lower()
-        text = []
-        
-        if file_extension == '.xlsx':
-            if openpyxl is None:
-                raise Exception("Library openpyxl tidak terinstall. Install dengan: pip install openpyxl")
-            
-            workbook = openpyxl.load_workbook(file_path, data_only=False)  # Keep formulas untuk hyperlink
-            for sheet_name in workbook.sheetnames:
-                sheet = workbook[sheet_name]
-                for row in sheet.iter_rows():
-                    for cell in row:
-                        # Tambahkan nilai cell
-                        if cell.value is not None:
-                            text.append(str(cell.value))
-                        
-                        # Cek hyperlink
-                        if cell.hyperlink is not None:
-                            if hasattr(cell.hyperlink, 'target') and cell.hyperlink.target:
-                                if cell.hyperlink.target.startswith('http'):
-                                    text.append(cell.hyperlink.target)
-            workbook.close()
-            
-        elif file_extension == '.xls':
-            if xlrd is None:
-                raise Exception("Library xlrd tidak terinstall. Install dengan: pip install xlrd")
-            
-            workbook = xlrd.open_workbook(file_path, formatting_info=True)
-            for sheet in workbook.sheets():
-                for row in range(sheet.nrows):
-                    for col in range(sheet.ncols):
-                        cell_value = sheet.cell_value(row, col)
-                        if cell_value:
-                            text.append(str(cell_value))
-                        
-                        # Coba ekstrak hyperlink dari XLS (lebih kompleks)
-                        try:
-                            cell_obj = sheet.cell(row, col)
-                            if hasattr(cell_obj, 'ctype') and cell_obj.ctype == xlrd.XL_CELL_TEXT:
-                                # Untuk XLS, hyperlink biasanya tersimpan sebagai text yang dimulai dengan http
-                                cell_text = str(cell_value)
-                                if cell_text.startswith('http'):
-                                    text.append(cell_text)
-                        except:
-                            pass
-        
-        return '\n'.join(text)
+    def update_batch_progress(self, files_done, files_total, mb_done):
+        """Update progress bar dengan jumlah file selesai dan throughput (file/s, MB/s)"""
+        self.extraction_files_done = files_done
+        if self.is_processing or self.extraction_single_file:
+            return
+        elapsed = max(time.monotonic() - self.extraction_started, 1e-6)
+        throughput = f"{files_done / elapsed:.1f} file/s, {mb_done / elapsed:.1f} MB/s"
+        if files_total:
+            self.progress_bar.setRange(0, files_total)
+            self.progress_bar.setValue(files_done)
+            self.progress_bar.setFormat(f"{files_done}/{files_total} file ({throughput})")
+        else:
+            # Folder masih di-scan, total file belum diketahui
+            self.progress_bar.setRange(0, 0)
+            self.progress_bar.setFormat(f"{files_done} file ({throughput})")
     
-    def extract_text_from_pptx(self, file_path):
-        """Ekstrak teks dari file PPTX termasuk hyperlink"""
-        if Presentation is None:
-            raise Exception("Library python-pptx tidak terinstall. Install dengan: pip install python-pptx")
-        
-        prs = Presentation(file_path)
-        text = []
-        
-        for slide in prs.slides:
-            for shape in slide.shapes:
-                if hasattr(shape, "text") and shape.text:
-                    text.append(shape.text)
-                
-                # Cek hyperlink di shape
-                if hasattr(shape, "click_action") and shape.click_action.hyperlink:
-                    hyperlink = shape.click_action.hyperlink
-                    if hasattr(hyperlink, 'address') and hyperlink.address:
-                        if hyperlink.address.startswith('http'):
-                            text.append(hyperlink.address)
-                
-                # Cek hyperlink di text runs (untuk text yang ada hyperlink-nya)
-                if hasattr(shape, "text_frame"):
-                    for paragraph in shape.text_frame.paragraphs:
-                        for run in paragraph.runs:
-                            if hasattr(run, "hyperlink") and run.hyperlink:
-                                if hasattr(run.hyperlink, 'address') and run.hyperlink.address:
-                                    if run.hyperlink.address.startswith('http'):
-                                        text.append(run.hyperlink.address)
-        
-        return '\n'.join(text)
+    def on_file_extracted(self, file_path, from_cache):
+        self.extraction_from_cache = self.extraction_from_cache and from_cache
     
-    def extract_text_from_pdf(self, file_path):
-        """Ekstrak teks dari file PDF termasuk link/annotation"""
-        if PyPDF2 is None:
-            raise Exception("Library PyPDF2 tidak terinstall. Install dengan: pip install PyPDF2")
+    def on_links_found(self, file_path, records):
+        """Tambahkan batch LinkRecord ke tabel selama ekstraksi berjalan, tanpa duplikat"""
+        # URL asli yang disimpan; bentuk kanonik hanya untuk cek duplikat
+        new_records = [record for record in records if self.link_index.add(record.url)]
+        if not new_records:
+            return
         
-        text = []
-        try:
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                for page in pdf_reader.pages:
-                    # Ekstrak teks normal
-                    page_text = page.extract_text()
-                    if page_text:
-                        text.append(page_text)
-                    
-                    # Coba ekstrak link dari annotations
-                    if hasattr(page, 'annotations') and page.annotations:
-                        for annotation in page.annotations:
-                            if annotation.get_object():
-                                annotation_obj = annotation.get_object()
-                                if '/A' in annotation_obj:
-                                    action = annotation_obj['/A']
-                                    if '/URI' in action:
-                                        uri = action['/URI']
-                                        if isinstance(uri, str) and uri.startswith('http'):
-                                            text.append(uri)
-        except Exception as e:
-            raise Exception(f"Gagal membaca PDF: {str(e)}")
+        # Link baru ditambahkan di bawah link yang sudah ada
+        self.links_model.append_records(file_path, new_records)
         
-        return '\n'.join(text)
+        if not self.filter_bar.isVisible():
+            self.set_link_views_visible(True)
+            self.open_links_button.setVisible(True)
+            self.export_button.setVisible(True)
+            self.close_tabs_button.setVisible(True)
+            # Disable tombol tutup tab karena belum ada tab yang terbuka
+            self.close_tabs_button.setEnabled(False)
+        self.status_label.setText(f"Ditemukan {len(self.found_links)} link unik, mengekstrak {self.extraction_label}...")
     
-    def extract_text_from_ppt(self, file_path):
-        """Ekstrak teks dari file PPT (format lama)"""
-        if olefile is None:
-            raise Exception("Library olefile tidak terinstall. Install dengan: pip install olefile")
-        
-        # Untuk file .ppt, coba baca sebagai binary dan cari teks
-        try:
-            with open(file_path, 'rb') as file:
-                content = file.read()
-                # Decode dengan berbagai encoding
-                text = content.decode('utf-8', errors='ignore')
-                # Filter karakter yang tidak dapat dibaca
-                text = ''.join(char for char in text if ord(char) >= 32 or char in '\n\t')
-                return text
-        except Exception:
-            raise Exception("Gagal membaca file PPT. Coba convert ke PPTX dulu.")
+    def on_file_failed(self, file_path, message):
+        logger.warning("Extraction failed for %s: %s", file_path, message)
+        self.extraction_errors.append((file_path, message))
     
-    def extract_text_from_csv(self, file_path):
-        """Ekstrak teks dari file CSV"""
-        if pd is None:
-            raise Exception("Library pandas tidak terinstall. Install dengan: pip install pandas")
+    def on_extraction_finished(self, cancelled):
+        """Kembalikan UI ke keadaan normal dan tampilkan ringkasan hasil ekstraksi"""
+        self.extraction_worker.wait()
+        self.extraction_worker = None
+        self.cancel_extract_button.setVisible(False)
+        self.cancel_extract_button.setEnabled(True)
+        self.watch_button.setEnabled(True)
+        if not self.is_processing:
+            self.progress_bar.setVisible(False)
+            self.progress_bar.setRange(0, 100)
+            self.progress_bar.setFormat("Sedang membuka link...")
+            self.open_button.setEnabled(True)
+        
+        if (self.extraction_single_file and self.extraction_errors and not cancelled
+                and not self.extraction_append):
+            self.status_label.setText("")
+            QMessageBox.critical(self, "Error", f"Gagal baca file: {self.extraction_errors[0][1]}")
+            return
         
-        text = []
-        try:
-            # Coba baca dengan encoding UTF-8 dulu
-            df = pd.read_csv(file_path, encoding='utf-8')
-        except UnicodeDecodeError:
-            try:
-                # Kalau gagal, coba dengan encoding latin-1
-                df = pd.read_csv(file_path, encoding='latin-1')
-            except:
-                # Terakhir coba dengan encoding cp1252 (Windows)
-                df = pd.read_csv(file_path, encoding='cp1252')
-        
-        # Ekstrak semua nilai dari DataFrame
-        for column in df.columns:
-            # Tambahkan nama kolom
-            text.append(str(column))
-            # Tambahkan nilai kolom (drop NaN values)
-            values = df[column].dropna().astype(str).tolist()
-            text.extend(values)
-        
-        return '\n'.join(text)
+        if self.extraction_single_file:
+            source = self.extraction_label
+        else:
+            source = f"{self.extraction_files_done} file"
+        notes = []
+        if self.extraction_single_file and self.found_links and self.extraction_from_cache:
+            notes.append("dari cache")
+        if self.extraction_errors:
+            notes.append(f"{len(self.extraction_errors)} file gagal dibaca")
+        if cancelled:
+            notes.append("dibatalkan")
+        note = f" ({', '.join(notes)})" if notes else ""
+        
+        if self.extraction_append:
+            new_count = len(self.found_links) - self.extraction_links_before
+            self.status_label.setText(f"{new_count} link baru dari {source}{note}.")
+        elif self.found_links:
+            self.status_label.setText(f"Ditemukan {len(self.found_links)} link unik dari {source}{note}:")
+        else:
+            self.status_label.setText(f"Tidak ada link yang ditemukan dalam {source}{note}.")
+        
+        if self.folder_watcher is not None:
+            folder_name = Path(self.folder_watcher.paths[0]).name
+            self.status_label.setText(f"{self.status_label.text()}\nMemantau folder {folder_name}: "
+                                      f"total {len(self.found_links)} link unik.")
+            if self.watch_scan_pending:
+                # Ada perubahan selama ekstraksi berjalan
+                self.watch_scan_pending = False
+                self.watch_timer.start(WATCH_DEBOUNCE_MS)
     
-    def extract_text_from_rtf(self, file_path):
-        """Ekstrak teks dari file RTF"""
-        if rtf_to_text is None:
-            raise Exception("Library striprtf tidak terinstall. Install dengan: pip install striprtf")
-        
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as file:
-                rtf_content = file.read()
-            
-            # Convert RTF ke plain text
-            plain_text = rtf_to_text(rtf_content)
-            return plain_text
-        except UnicodeDecodeError:
-            # Coba dengan encoding lain
-            try:
-                with open(file_path, 'r', encoding='latin-1') as file:
-                    rtf_content = file.read()
-                plain_text = rtf_to_text(rtf_content)
-                return plain_text
-            except:
-                raise Exception("Gagal membaca file RTF dengan encoding yang didukung")
+    def toggle_watch_folder(self):
+        """Mulai/berhenti memantau folder"""
+        if self.folder_watcher is not None:
+            self.stop_watching_folder()
+            return
+        folder = QFileDialog.getExistingDirectory(self, "Pilih Folder untuk Dipantau")
+        if folder:
+            self.start_watching_folder(folder)
     
-    def extract_text_from_odt(self, file_path):
-        """Ekstrak teks dari file ODT (OpenDocument Text)"""
-        if odf_load is None or teletype is None:
-            raise Exception("Library odfpy tidak terinstall. Install dengan: pip install odfpy")
-        
-        try:
-            doc = odf_load(file_path)
-            text = []
-            
-            # Ekstrak semua paragraf teks
-            for paragraph in doc.getElementsByType(OdfP):
-                para_text = teletype.extractText(paragraph)
-                if para_text.strip():
-                    text.append(para_text)
-            
-            return '\n'.join(text)
-        except Exception as e:
-            raise Exception(f"Gagal membaca file ODT: {str(e)}")
+    def start_watching_folder(self, folder):
+        """Ekstrak semua file di folder, lalu pantau file baru/berubah"""
+        if self.extraction_worker is not None:
+            return
+        self.folder_watcher = FolderWatcher([folder])
+        self.folder_watcher.prime()
+        self.fs_watcher = QFileSystemWatcher(self)
+        self.update_watched_paths()
+        self.fs_watcher.directoryChanged.connect(self.schedule_watch_scan)
+        self.fs_watcher.fileChanged.connect(self.schedule_watch_scan)
+        
+        self.watch_button.setText("Stop Pantau")
+        self.watch_button.setIcon(qta.icon('fa5s.eye-slash', color='#9C27B0'))
+        logger.debug("Watching folder: %s", folder)
+        self.load_and_extract_links([folder])
     
-    def extract_text_from_ods(self, file_path):
-        """Ekstrak teks dari file ODS (OpenDocument Spreadsheet)"""
-        if odf_load is None or teletype is None:
-            raise Exception("Library odfpy tidak terinstall. Install dengan: pip install odfpy")
-        
-        try:
-            doc = odf_load(file_path)
-            text = []
-            
-            # Ekstrak teks dari semua tabel
-            for table in doc.getElementsByType(OdfTable):
-                for row in table.getElementsByType(OdfTableRow):
-                    for cell in row.getElementsByType(OdfTableCell):
-                        cell_text = teletype.extractText(cell)
-                        if cell_text.strip():
-                            text.append(cell_text)
-            
-            return '\n'.join(text)
-        except Exception as e:
-            raise Exception(f"Gagal membaca file ODS: {str(e)}")
+    def stop_watching_folder(self):
+        """Berhenti memantau folder (link yang sudah ada tetap di tabel)"""
+        self.watch_timer.stop()
+        if self.fs_watcher is not None:
+            self.fs_watcher.deleteLater()
+            self.fs_watcher = None
+        self.folder_watcher = None
+        self.watch_scan_pending = False
+        self.watch_button.setText("Pantau Folder")
+        self.watch_button.setIcon(qta.icon('fa5s.eye', color='#9C27B0'))
+        logger.debug("Stopped watching folder")
     
-    def extract_text_from_odp(self, file_path):
-        """Ekstrak teks dari file ODP (OpenDocument Presentation)"""
-        if odf_load is None or teletype is None:
-            raise Exception("Library odfpy tidak terinstall. Install dengan: pip install odfpy")
-        
-        try:
-            doc = odf_load(file_path)
-            text = []
-            
-            # Ekstrak teks dari semua halaman presentasi
-            for page in doc.getElementsByType(OdfPage):
-                # Ekstrak teks dari frame di halaman
-                for frame in page.getElementsByType(OdfFrame):
-                    frame_text = teletype.extractText(frame)
-                    if frame_text.strip():
-                        text.append(frame_text)
-                
-                # Ekstrak paragraf langsung dari halaman
-                for paragraph in page.getElementsByType(OdfP):
-                    para_text = teletype.extractText(paragraph)
-                    if para_text.strip():
-                        text.append(para_text)
-            
-            return '\n'.join(text)
-        except Exception as e:
-            raise Exception(f"Gagal membaca file ODP: {str(e)}")
+    def update_watched_paths(self):
+        """Daftarkan folder dan file yang baru muncul ke QFileSystemWatcher"""
+        watched = set(self.fs_watcher.directories()) | set(self.fs_watcher.files())
+        paths = self.folder_watcher.directories() + list(self.folder_watcher.fingerprints)
+        new_paths = [path for path in paths if path not in watched]
+        if new_paths:
+            self.fs_watcher.addPaths(new_paths)
+    
+    def schedule_watch_scan(self, path=None):
+        """Tunda scan sampai folder tenang (banyak event saat file sedang di-copy)"""
+        if self.folder_watcher is not None:
+            self.watch_timer.start(WATCH_DEBOUNCE_MS)
+    
+    def run_watch_scan(self):
+        """Cek fingerprint file di folder dan ekstrak hanya file baru/berubah"""
+        if self.folder_watcher is None:
+            return
+        if self.extraction_worker is not None:
+            self.watch_scan_pending = True
+            return
+        changed_files = self.folder_watcher.scan()
+        self.update_watched_paths()
+        if self.folder_watcher.pending:
+            # File yang masih berubah dicek lagi sampai ukurannya stabil
+            self.watch_timer.start(WATCH_DEBOUNCE_MS)
+        if changed_files:
+            logger.debug("Watch - %s file baru/berubah", len(changed_files))
+            self.load_and_extract_links(changed_files, append=True)
+    
+    def closeEvent(self, event):
+        """Hentikan ekstraksi yang masih berjalan sebelum aplikasi ditutup"""
+        if self.extraction_worker is not None:
+            self.extraction_worker.cancel()
+            self.extraction_worker.wait(5000)
+        self.extraction_processes.close()
+        super().closeEvent(event)
     
-    def load_and_extract_links(self, file_path):
-        """Load file dan ekstrak link dengan metode yang diperbaiki"""
-        try:
-            # Store source file path for export functionality
-            self.source_file_path = file_path
-            
-            # Ekstrak teks berdasarkan format file
-            content = self.extract_text_from_file(file_path)
-            
-            # Ambil nama file tanpa path
-            file_name = Path(file_path).name
-            
-            # Regex yang diperbaiki untuk mencari link http/https
-            # Pattern yang lebih fleksibel untuk menangkap berbagai format link
-            link_patterns = [
-                r'https?://[^\s<>"\'`\[\]{}|\\^]+',  # Standard HTTP links
-                r'www\.[^\s<>"\'`\[\]{}|\\^]+\.[a-zA-Z]{2,}[^\s<>"\'`\[\]{}|\\^]*',  # www links
-                r'[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}/[^\s<>"\'`\[\]{}|\\^]*',  # domain/path links
-            ]
-            
-            links = []
-            for pattern in link_patterns:
-                found_links = re.findall(pattern, content, re.IGNORECASE)
-                links.extend(found_links)
-            
-            # Bersihkan dan validasi link
-            self.found_links = []
-            for link in links:
-                # Hapus karakter yang tidak diinginkan di akhir
-                cleaned_link = re.sub(r'[.,!?;:)}\]]+$', '', link.strip())
-                
-                # Pastikan link memiliki protocol
-                if cleaned_link:
-                    if not cleaned_link.startswith(('http://', 'https://')):
-                        if cleaned_link.startswith('www.'):
-                            cleaned_link = 'https://' + cleaned_link
-                        elif '.' in cleaned_link and not cleaned_link.startswith('mailto:'):
-                            # Cek apakah ini seperti domain
-                            domain_pattern = r'^[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-                            if re.match(domain_pattern, cleaned_link):
-                                cleaned_link = 'https://' + cleaned_link
-                    
-                    # Validasi final
-                    if cleaned_link.startswith(('http://', 'https://')):
-                        # Pastikan domain valid
-                        try:
-                            from urllib.parse import urlparse
-                            parsed = urlparse(cleaned_link)
-                            if parsed.netloc and '.' in parsed.netloc:
-                                self.found_links.append(cleaned_link)
-                        except:
-                            # Jika parsing gagal, tetap tambahkan jika format basic benar
-                            if re.match(r'https?://[^.]+\..+', cleaned_link):
-                                self.found_links.append(cleaned_link)
-            
-            # Hapus duplikat
-            self.found_links = list(dict.fromkeys(self.found_links))  # Preserves order
-            
-            if self.found_links:
-                self.status_label.setText(f"Ditemukan {len(self.found_links)} link unik dari {file_name}:")
-                  # Populate table dengan link
-                self.links_table.setRowCount(len(self.found_links))               
-                for i, link in enumerate(self.found_links):
-                    # Kolom Link
-                    link_item = QTableWidgetItem(link)
-                    self.links_table.setItem(i, 0, link_item)
-                
-                self.links_table.setVisible(True)
-                self.open_links_button.setVisible(True)
-                self.export_button.setVisible(True)
-                self.close_tabs_button.setVisible(True)
-                # Disable tombol tutup tab karena belum ada tab yang terbuka
-                self.close_tabs_button.setEnabled(False)
-            else:
-                self.status_label.setText(f"Tidak ada link yang ditemukan dalam {file_name}.")                
-                self.links_table.setVisible(False)
-                self.open_links_button.setVisible(False)
-                self.export_button.setVisible(False)
-                self.close_tabs_button.setVisible(False)
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Gagal baca file: {str(e)}")
     def open_links(self):
-        """Mulai proses membuka link"""
+        """Mulai proses membuka link yang lolos filter"""
+        self.open_link_rows(self.visible_link_rows())
+    
+    def open_link_rows(self, rows):
+        """Mulai proses membuka link di baris-baris LinkTableModel"""
         # Cegah multiple execution dengan disable button
         if self.is_processing:
             return            
-        if not self.found_links:
+        if not rows:
             QMessageBox.warning(self, "Peringatan", "Tidak ada link untuk dibuka!")
             return
         
@@ -1145,62 +1784,60 @@ class LinkOpenerApp(QMainWindow):
         self.open_links_button.setEnabled(False)
         
         # Langsung mulai tanpa konfirmasi
-        self.start_opening_links()    
-    def start_opening_links(self):
+        self.start_opening_links(rows)    
+    def start_opening_links(self, rows):
         """Mulai worker thread untuk membuka link"""
         self.open_links_button.setEnabled(False)
         self.open_button.setEnabled(False)
         self.progress_bar.setVisible(True)
+        self.progress_bar.setRange(0, 100)
         self.progress_bar.setValue(0)
           # Reset daftar Chrome tabs yang terbuka
         self.opened_chrome_tabs = []
         self.chrome_driver = None  # Track Chrome driver instance        # Buat dan jalankan worker thread
-        self.worker = LinkOpenerWorker(self.found_links)
-        self.worker.progress_updated.connect(self.progress_bar.setValue)
-        self.worker.status_updated.connect(self.update_progress_text)
+        # Snapshot baris: link yang masih masuk dari ekstraksi tidak ikut dibuka
+        rows = array('I', rows)
+        self.worker = LinkOpenerWorker(list(map(self.found_links.__getitem__, rows)), rows)
         self.worker.finished.connect(self.on_finished)
-        self.worker.chrome_tab_opened.connect(self.track_chrome_tab)
-        self.worker.link_processing.connect(self.mark_link_processing)
-        self.worker.link_opened.connect(self.mark_link_opened)
-        self.worker.start()    
-    def track_chrome_tab(self, tab_handle):
+        self.worker.start()
+        self.opener_update_timer.start(OPENER_UPDATE_INTERVAL_MS)
+    
+    def apply_opener_updates(self):
+        """Terapkan perubahan yang dikumpulkan LinkOpenerWorker sejak update terakhir"""
+        updates = self.worker.take_updates() if self.worker else None
+        if updates is None:
+            return
+        for start, stop in updates['processing']:
+            self.links_model.set_status_range(start, stop, LinkTableModel.STATUS_PROCESSING)
+        for start, stop in updates['opened']:
+            self.links_model.set_status_range(start, stop, LinkTableModel.STATUS_OPENED)
+        for start, stop in updates['failed']:
+            self.links_model.set_status_range(start, stop, LinkTableModel.STATUS_FAILED)
+        if updates['tabs']:
+            self.track_chrome_tabs(updates['tabs'])
+        if updates['progress'] is not None:
+            self.progress_bar.setValue(updates['progress'])
+        if updates['status'] is not None:
+            self.update_progress_text(updates['status'])
+    
+    def track_chrome_tabs(self, tab_handles):
         """Track Chrome tab handle yang dibuka dari app ini"""
-        self.opened_chrome_tabs.append(tab_handle)
-        print(f"DEBUG: Tracking Chrome tab: {tab_handle}, Total tracked: {len(self.opened_chrome_tabs)}")
+        self.opened_chrome_tabs.extend(tab_handles)
+        logger.debug("Tracking %s Chrome tab, Total tracked: %s", len(tab_handles), len(self.opened_chrome_tabs))
         # Update status label dengan info tab
         self.status_label.setText(f"Melacak {len(self.opened_chrome_tabs)} tab Chrome...")
-          # Store driver reference untuk close tabs nanti
+        # Store driver reference untuk close tabs nanti
         if self.worker and self.worker.driver:
             self.chrome_driver = self.worker.driver
     
     def mark_link_processing(self, index):
         """Tandai link yang sedang diproses dengan warna kuning transparan"""
-        try:
-            # Set background kuning transparan untuk row yang sedang diproses menggunakan rgba
-            # rgba(246, 191, 17, 0.1) - warna kuning/amber transparan
-            for column in range(self.links_table.columnCount()):
-                item = self.links_table.item(index, column)
-                if item:
-                    # Gunakan QColor dengan nilai rgba yang dikonversi
-                    rgba_color = QColor(246, 191, 17, 25)  # rgba(246, 191, 17, 0.1)
-                    item.setBackground(rgba_color)
-            print(f"DEBUG: Marked link {index} as processing (rgba yellow: 246, 191, 17, 0.1)")
-        except Exception as e:
-            print(f"DEBUG: Error marking link {index} as processing: {e}")
+        self.links_model.set_status(index, LinkTableModel.STATUS_PROCESSING)
     
     def mark_link_opened(self, index):
         """Tandai link yang berhasil dibuka dengan warna hijau transparan"""
-        try:
-            # Set background hijau transparan untuk row yang berhasil dibuka menggunakan rgba
-            # rgba(100, 195, 0, 0.1) - warna hijau transparan
-            rgba_color = QColor(100, 195, 0, 25)  # rgba(100, 195, 0, 0.1)
-            for column in range(self.links_table.columnCount()):
-                item = self.links_table.item(index, column)
-                if item:
-                    item.setBackground(rgba_color)
-            print(f"DEBUG: Marked link {index} as opened (rgba green: 100, 195, 0, 0.1)")
-        except Exception as e:
-            print(f"DEBUG: Error marking link {index} as opened: {e}")
+        self.links_model.set_status(index, LinkTableModel.STATUS_OPENED)
+    
     def update_progress_text(self, text):
         """Update progress bar text dengan link yang sedang dibuka"""
         if text.startswith("Membuka:"):
@@ -1213,10 +1850,15 @@ class LinkOpenerApp(QMainWindow):
             self.progress_bar.setFormat(text)    
     def on_finished(self):
         """Callback ketika selesai membuka semua link"""
-        print("DEBUG: on_finished called")
-        self.progress_bar.setVisible(False)
+        logger.debug("on_finished called")
+        # Terapkan sisa perubahan terakhir dari worker sebelum worker dilepas
+        self.opener_update_timer.stop()
+        self.apply_opener_updates()
+        opened_count = len(self.worker.links) if self.worker else len(self.found_links)
+        # Progress bar tetap tampil kalau ekstraksi masih berjalan
+        self.progress_bar.setVisible(self.extraction_worker is not None)
         self.open_links_button.setEnabled(True)
-        self.open_button.setEnabled(True)
+        self.open_button.setEnabled(self.extraction_worker is None)
         
         # Reset flag processing
         self.is_processing = False
@@ -1224,40 +1866,40 @@ class LinkOpenerApp(QMainWindow):
         # Store Chrome driver reference untuk close tabs nanti (JANGAN cleanup di sini)
         if self.worker and self.worker.driver:
             self.chrome_driver = self.worker.driver
-            print(f"DEBUG: Chrome driver stored for later cleanup, tabs tracked: {len(self.opened_chrome_tabs)}")
+            logger.debug("Chrome driver stored for later cleanup, tabs tracked: %s", len(self.opened_chrome_tabs))
         
         # Safely cleanup worker thread TANPA cleanup driver
         if self.worker:
             try:                 # Disconnect signals to prevent recursive calls
-                self.worker.progress_updated.disconnect()
-                self.worker.status_updated.disconnect()
-                self.worker.finished.disconnect()                
-                self.worker.chrome_tab_opened.disconnect()
-                self.worker.link_processing.disconnect()
-                self.worker.link_opened.disconnect()
+                self.worker.finished.disconnect()
                 
                 # Let thread finish naturally
                 self.worker.quit()
                 self.worker.wait(5000)  # Wait max 5 seconds
                 
             except Exception as e:
-                print(f"DEBUG: Error during worker cleanup: {e}")
+                logger.warning("Error during worker cleanup: %s", e)
             finally:
                 self.worker = None
           # Ubah status tanpa dialog konfirmasi
-        self.status_label.setText(f"Selesai membuka {len(self.found_links)} link di Chrome incognito!")
+        self.status_label.setText(f"Selesai membuka {opened_count} link di Chrome incognito!")
         
         # Update informasi tentang tab yang dibuka dan enable tombol tutup tab
         if self.opened_chrome_tabs:
-            self.status_label.setText(f"Selesai membuka {len(self.found_links)} link di Chrome incognito! "
+            self.status_label.setText(f"Selesai membuka {opened_count} link di Chrome incognito! "
                                     f"({len(self.opened_chrome_tabs)} tab Chrome dibuka)")
             self.close_tabs_button.setEnabled(True)  # Enable tombol tutup tab
         else:
             self.close_tabs_button.setEnabled(False)  # Disable jika tidak ada tab
+        
+        # Filter status dihitung ulang supaya sesuai status terbaru
+        if self.status_filter.currentData():
+            self.apply_link_filter()
     
     def export_links(self):
-        """Export link ke file _links.txt"""
-        if not self.found_links:
+        """Export link yang lolos filter ke file _links.txt"""
+        rows = self.visible_link_rows()
+        if not rows:
             QMessageBox.warning(self, "Peringatan", "Tidak ada link untuk diekspor!")
             return
         
@@ -1284,19 +1926,20 @@ class LinkOpenerApp(QMainWindow):
         
         try:
             with open(export_file_path, 'w', encoding='utf-8') as file:                
-                for i, link in enumerate(self.found_links, 1):
-                    file.write(f"{i}. {link}\n")
+                # Asal link dipisah tab supaya URL tetap utuh saat di-copy
+                for i, row in enumerate(rows):
+                    file.write(f"{i + 1}. {self.found_links[row]}\t{self.links_model.source_text(row)}\n")
             QMessageBox.information(
                 self, 
                 "Berhasil!", 
-                f"Berhasil mengekspor {len(self.found_links)} link ke:\n{export_file_path}"
+                f"Berhasil mengekspor {len(rows)} link ke:\n{export_file_path}"
             )
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Gagal ekspor file: {str(e)}")
     
     def close_chrome_tabs(self):
         """Tutup hanya tab Chrome yang dibuka dari aplikasi ini"""
-        print(f"DEBUG: close_chrome_tabs called. Current tracked tabs: {self.opened_chrome_tabs}")
+        logger.debug("close_chrome_tabs called. Current tracked tabs: %s", self.opened_chrome_tabs)
         
         if not self.opened_chrome_tabs:
             self.status_label.setText("Tidak ada tab Chrome dari app ini yang perlu ditutup.")
@@ -1321,10 +1964,10 @@ class LinkOpenerApp(QMainWindow):
                     # Hapus dari tracking list
                     self.opened_chrome_tabs.remove(tab_handle)
                     closed_count += 1
-                    print(f"DEBUG: Successfully closed tab: {tab_handle}")
+                    logger.debug("Successfully closed tab: %s", tab_handle)
                     
                 except Exception as e:
-                    print(f"DEBUG: Error closing tab {tab_handle}: {e}")
+                    logger.warning("Error closing tab %s: %s", tab_handle, e)
                     failed_count += 1
                     # Tetap hapus dari list meskipun gagal tutup
                     if tab_handle in self.opened_chrome_tabs:
@@ -1334,9 +1977,9 @@ class LinkOpenerApp(QMainWindow):
                 try:
                     self.chrome_driver.quit()
                     self.chrome_driver = None
-                    print("DEBUG: Chrome driver cleaned up after closing tabs")
+                    logger.debug("Chrome driver cleaned up after closing tabs")
                 except Exception as e:
-                    print(f"DEBUG: Error cleaning up driver: {e}")
+                    logger.warning("Error cleaning up driver: %s", e)
               # Reset styling di table rows setelah tutup tabs
             self.reset_table_styling()
             
@@ -1351,27 +1994,14 @@ class LinkOpenerApp(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Gagal tutup tab Chrome: {str(e)}")
     def reset_table_styling(self):
-        """Reset semua background color di table rows ke style original"""
-        try:
-            for row in range(self.links_table.rowCount()):
-                for column in range(self.links_table.columnCount()):
-                    item = self.links_table.item(row, column)
-                    if item:
-                        # Reset ke background default table dengan membuat item baru
-                        # Simpan text content
-                        original_text = item.text()
-                        # Buat item baru dengan styling default
-                        new_item = QTableWidgetItem(original_text)
-                        # Replace item dengan yang baru (akan menggunakan style default)
-                        self.links_table.setItem(row, column, new_item)
-            print("DEBUG: Reset all table row styling to original default")
-        except Exception as e:
-            print(f"DEBUG: Error resetting table styling: {e}")
+        """Reset semua warna baris ke style original"""
+        self.links_model.reset_status()
+        logger.debug("Reset all table row styling to original default")
     
     def show_context_menu(self, position):
         """Tampilkan context menu saat klik kanan pada tabel"""
-        item = self.links_table.itemAt(position)
-        if not item:
+        item = self.links_table.indexAt(position)
+        if not item.isValid():
             return
         
         # Buat context menu
@@ -1392,13 +2022,52 @@ class LinkOpenerApp(QMainWindow):
         # Tampilkan menu di posisi kursor
         context_menu.exec(self.links_table.mapToGlobal(position))
     
+    def show_domain_context_menu(self, position):
+        """Context menu tree per domain: buka/lewati satu domain, atau copy/open satu link"""
+        item = self.domain_tree.indexAt(position)
+        if not item.isValid():
+            return
+        if self.domain_model.source_row(item) is not None:
+            context_menu = QMenu(self)
+            copy_action = QAction("Copy Link", self)
+            copy_action.setIcon(qta.icon('fa5s.copy', color='#666666'))
+            copy_action.triggered.connect(lambda: self.copy_link_to_clipboard(item))
+            context_menu.addAction(copy_action)
+            open_action = QAction("Open Link", self)
+            open_action.setIcon(qta.icon('fa5s.external-link-alt', color='#4CAF50'))
+            open_action.triggered.connect(lambda: self.open_single_link(item))
+            context_menu.addAction(open_action)
+            context_menu.exec(self.domain_tree.viewport().mapToGlobal(position))
+            return
+        
+        host_id = self.domain_model.host_id(item)
+        skipped = host_id in self.domain_model.skipped_hosts
+        context_menu = QMenu(self)
+        open_action = QAction("Buka Semua Link Domain Ini", self)
+        open_action.setIcon(qta.icon('fa5s.external-link-alt', color='#4CAF50'))
+        open_action.setEnabled(not self.is_processing)
+        open_action.triggered.connect(lambda: self.open_link_rows(self.domain_model.domain_rows(host_id)))
+        context_menu.addAction(open_action)
+        skip_action = QAction("Sertakan Domain Ini" if skipped else "Lewati Domain Ini", self)
+        skip_action.setIcon(qta.icon('fa5s.eye' if skipped else 'fa5s.eye-slash', color='#666666'))
+        skip_action.triggered.connect(lambda: self.domain_model.set_host_skipped(host_id, not skipped))
+        context_menu.addAction(skip_action)
+        context_menu.exec(self.domain_tree.viewport().mapToGlobal(position))
+    
+    def link_row_for_index(self, item):
+        """Nomor baris LinkTableModel untuk index di tabel (lewat proxy) atau di tree per domain"""
+        if item.model() is self.domain_model:
+            return self.domain_model.source_row(item)
+        return self.links_proxy.source_row(item.row())
+    
     def copy_link_to_clipboard(self, item):
         """Copy link ke clipboard"""
         try:
-            if not item:
+            if not item.isValid():
                 return
             
-            link = item.text()
+            # Klik bisa di kolom Sumber; link diambil dari baris yang diklik
+            link = self.links_model.link(self.link_row_for_index(item))
             if link:
                 # Get clipboard
                 clipboard = QApplication.clipboard()
@@ -1416,25 +2085,20 @@ class LinkOpenerApp(QMainWindow):
             QMessageBox.warning(self, "Peringatan", f"Gagal copy link: {str(e)}")
     
     def open_single_link(self, item):
-        """Buka link individual saat double-click pada item tabel"""
+        """Buka link individual saat double-click pada item tabel atau tree per domain"""
         try:
-            if not item:
+            if not item.isValid():
                 return
             
-            # Ambil link dari item yang diklik
-            link = item.text()
+            # Ambil link dari baris yang diklik (index view -> baris model); dipakai juga untuk visual feedback
+            link_index = self.link_row_for_index(item)
+            if link_index is None:
+                return  # Baris domain di tree: double-click hanya membuka/menutup grupnya
+            link = self.links_model.link(link_index)
             if not link or not (link.startswith('http://') or link.startswith('https://')):
                 QMessageBox.warning(self, "Peringatan", "Link tidak valid!")
                 return
             
-            # Cari index link di table untuk visual feedback
-            link_index = -1
-            for row in range(self.links_table.rowCount()):
-                table_item = self.links_table.item(row, 0)
-                if table_item and table_item.text() == link:
-                    link_index = row
-                    break
-            
             # Tandai link sebagai processing (kuning)
             if link_index >= 0:
                 self.mark_link_processing(link_index)
@@ -1455,11 +2119,11 @@ class LinkOpenerApp(QMainWindow):
                     tab_handle = self.chrome_driver.current_window_handle
                 else:
                     # Kalau sudah ada tab, buka di tab baru
-                    self.chrome_driver.execute_script(f"window.open('{link}');")
+                    self.chrome_driver.execute_script("window.open(arguments[0]);", link)
                     tab_handle = self.chrome_driver.window_handles[-1]
                   # Track tab yang baru dibuka
                 self.opened_chrome_tabs.append(tab_handle)
-                print(f"DEBUG: Single link opened: {link}, tab handle: {tab_handle}")
+                logger.debug("Single link opened: %s, tab handle: %s", link, tab_handle)
                 
                 # Tandai link sebagai berhasil dibuka (hijau)
                 if link_index >= 0:
@@ -1471,7 +2135,7 @@ class LinkOpenerApp(QMainWindow):
                 
             except Exception as e:
                 # Jika masih error, coba buat driver baru
-                print(f"DEBUG: Error with existing driver, creating new one: {e}")
+                logger.warning("Error with existing driver, creating new one: %s", e)
                 try:
                     self.setup_chrome_driver_for_single_link()
                     self.chrome_driver.get(link)
@@ -1485,12 +2149,13 @@ class LinkOpenerApp(QMainWindow):
                     self.close_tabs_button.setEnabled(True)
                     
                 except Exception as e2:
+                    self.links_model.set_status(link_index, LinkTableModel.STATUS_FAILED)
                     QMessageBox.critical(self, "Error", f"Gagal buka link: {str(e2)}")
-                    print(f"DEBUG: Error opening single link {link}: {e2}")
+                    logger.warning("Error opening single link %s: %s", link, e2)
                 
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Error saat buka link: {str(e)}")
-            print(f"DEBUG: Error in open_single_link: {e}")
+            logger.warning("Error in open_single_link: %s", e)
     
     def is_chrome_driver_valid(self):
         """Cek apakah Chrome driver session masih valid"""
@@ -1504,7 +2169,7 @@ class LinkOpenerApp(QMainWindow):
             _ = self.chrome_driver.current_url
             return True
         except Exception as e:
-            print(f"DEBUG: Chrome driver session invalid: {e}")
+            logger.debug("Chrome driver session invalid: %s", e)
             # Cleanup driver yang tidak valid
             try:
                 self.chrome_driver.quit()
@@ -1522,30 +2187,23 @@ class LinkOpenerApp(QMainWindow):
             if not os.path.exists(chromedriver_path):
                 raise Exception("chromedriver.exe tidak ditemukan di folder aplikasi")
             
-            # Chrome options untuk incognito mode
-            chrome_options = Options()
-            chrome_options.add_argument("--incognito")
-            chrome_options.add_argument("--disable-web-security")
-            chrome_options.add_argument("--disable-features=VizDisplayCompositor")
-            chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-            chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            chrome_options.add_experimental_option('useAutomationExtension', False)
-            
-            # Setup service dan driver
-            service = Service(str(chromedriver_path))
-            self.chrome_driver = webdriver.Chrome(service=service, options=chrome_options)
-            self.chrome_driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            # Setup driver (incognito)
+            self.chrome_driver = create_chrome_driver(chromedriver_path)
             
             # Reset daftar tab karena ini driver baru
             self.opened_chrome_tabs = []
             
-            print(f"DEBUG: New Chrome driver created for single link")
+            logger.debug("New Chrome driver created for single link")
             
         except Exception as e:
-            print(f"DEBUG: Failed to setup Chrome driver for single link: {e}")
+            logger.debug("Failed to setup Chrome driver for single link: %s", e)
             raise e
 
 def main():
+    configure_logging()
+    # Process GUI menjalankan thread Qt: jangan fork Pool di sini. Ekstraksi
+    # berjalan di ExtractionProcess, yang memakai Pool sendiri untuk file tunggal.
+    set_process_pools_enabled(False)
     app = QApplication(sys.argv)
     
     # Set aplikasi ID untuk Windows taskbar agar ikon muncul dengan benar
@@ -1569,4 +2227,5 @@ def main():
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     main()